@@ -0,0 +1,342 @@
+"""Module implementing data-ready (DRDY) driven SPI acquisition.
+
+A sensor signals new data on its DRDY pin wired to an FT4222 GPIO port.
+'DrdyAcquisition' arms an edge trigger on the port, drains the trigger queue
+in a dedicated thread and issues a prepared SPI transfer through the SPI
+Master for each detected edge. The samples are stored into a fixed-size
+'SampleRing' with host timestamps.
+
+The GPIO and the SPI Master are separate interfaces of the same chip
+(e.g., interface B in GPIO mode and interface A in SPI Master mode in
+chip mode 0), both are used from the acquisition thread only.
+
+Note:
+    The trigger queue tells how many edges occurred since the last poll,
+    not when. With 'coalesce' enabled (default) only the latest sample is
+    read when several edges are found by one poll, the overwritten samples
+    are counted as missed edges. Edges lost by a trigger queue overflow
+    cannot be counted, polls finding the queue full (see 'overflow_level')
+    are counted as overflow polls instead.
+
+Example:
+    command = bytes([0x80 | 0x28]) + bytes(6)
+    with DrdyAcquisition(gpio, spi_master, PortId.PORT_3, command) as acquisition:
+        time.sleep(1.0)
+    samples = acquisition.ring.pop_all()
+"""
+
+import threading
+import time
+from array import array
+from typing import Any, List, NamedTuple, Optional
+
+from pyft4222.gpio import TRIGGER_QUEUE_DEPTH, Gpio
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.polling import PollStrategy
+from pyft4222.spi.master import SpiMasterSingle
+from pyft4222.worker import PollingWorker
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+
+
+class AcquiredSample(NamedTuple):
+    """NamedTuple representing a single acquired sample."""
+
+    sequence: int
+    """Sample number since the acquisition start."""
+    timestamp: float
+    """Host 'time.monotonic()' after the SPI transfer finished."""
+    edge_after: float
+    """Host 'time.monotonic()' of the previous poll, the edge came later."""
+    data: bytes
+    """Received data (without the command bytes)."""
+
+
+class AcquisitionStats(NamedTuple):
+    """NamedTuple representing acquisition counters."""
+
+    samples: int
+    """Number of SPI transfers issued."""
+    edges: int
+    """Number of DRDY edges read from the trigger queue."""
+    missed_edges: int
+    """Edges whose sample was overwritten before it could be read ('coalesce')."""
+    overflow_polls: int
+    """Polls finding the trigger queue at or above 'overflow_level'.
+
+    Edges may have been lost, the number of lost edges is unknown.
+    """
+    overwritten: int
+    """Samples dropped from the full ring buffer before being popped."""
+    polls: int
+    """Number of trigger queue polls."""
+    latency: HistogramSnapshot
+    """Upper bound of the DRDY-to-data latency (seconds).
+
+    Time from the poll preceding the edge detection to the end of the transfer.
+    """
+
+
+class SampleRing:
+    """A fixed-capacity, thread-safe ring buffer of fixed-size samples.
+
+    Sample data are stored in a single preallocated buffer,
+    the oldest samples are overwritten when the ring is full.
+    """
+
+    _capacity: int
+    _sample_size: int
+    _data: bytearray
+    _timestamps: "array[float]"
+    _edge_after: "array[float]"
+    _sequences: "array[int]"
+    _head: int
+    _count: int
+    _overwritten: int
+    _lock: threading.Lock
+
+    def __init__(self, capacity: int, sample_size: int):
+        """Initialize an empty ring.
+
+        Args:
+            capacity:       Maximum number of stored samples
+            sample_size:    Size of each sample in bytes
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive number.")
+        if sample_size <= 0:
+            raise ValueError("sample_size must be a positive number.")
+
+        self._capacity = capacity
+        self._sample_size = sample_size
+        self._data = bytearray(capacity * sample_size)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._edge_after = array("d", bytes(8 * capacity))
+        self._sequences = array("q", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+        self._overwritten = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def overwritten(self) -> int:
+        """Number of samples overwritten before being popped."""
+        return self._overwritten
+
+    def append(
+        self, sequence: int, timestamp: float, edge_after: float, data: bytes
+    ) -> None:
+        """Store a sample, overwriting the oldest one if the ring is full.
+
+        Args:
+            sequence:       Sample number
+            timestamp:      Sample timestamp
+            edge_after:     Start of the edge detection window
+            data:           Sample data of exactly 'sample_size' bytes
+        """
+        size = self._sample_size
+        with self._lock:
+            slot = (self._head + self._count) % self._capacity
+            if self._count == self._capacity:
+                self._head = (self._head + 1) % self._capacity
+                self._overwritten += 1
+            else:
+                self._count += 1
+
+            self._data[slot * size : (slot + 1) * size] = data
+            self._timestamps[slot] = timestamp
+            self._edge_after[slot] = edge_after
+            self._sequences[slot] = sequence
+
+    def pop_all(self) -> List[AcquiredSample]:
+        """Remove and return all stored samples, oldest first.
+
+        Returns:
+            List[AcquiredSample]:   Stored samples
+        """
+        size = self._sample_size
+        with self._lock:
+            samples = []
+            for idx in range(self._count):
+                slot = (self._head + idx) % self._capacity
+                samples.append(
+                    AcquiredSample(
+                        self._sequences[slot],
+                        self._timestamps[slot],
+                        self._edge_after[slot],
+                        bytes(self._data[slot * size : (slot + 1) * size]),
+                    )
+                )
+            self._head = (self._head + self._count) % self._capacity
+            self._count = 0
+            return samples
+
+
+class DrdyAcquisition(PollingWorker):
+    """A class reading an SPI sensor on each edge of its data-ready signal.
+
+    'start()' arms the DRDY trigger, edges queued before the start
+    are discarded. The acquired samples stay in the ring after 'stop()'.
+    """
+
+    _worker_name = "Acquisition"
+    _thread_name = "pyft4222-drdy"
+
+    ring: SampleRing
+    """Ring buffer receiving the acquired samples."""
+
+    _gpio: Gpio[Any]
+    _spi_master: SpiMasterSingle[Any]
+    _port: PortId
+    _command: bytes
+    _response_offset: int
+    _trigger: GpioTrigger
+    _coalesce: bool
+    _overflow_level: Optional[int]
+    _sequence: int
+    _last_poll: float
+
+    _samples: int
+    _edges: int
+    _missed_edges: int
+    _overflow_polls: int
+    _polls: int
+    _latency: Histogram
+
+    def __init__(
+        self,
+        gpio: Gpio[Any],
+        spi_master: SpiMasterSingle[Any],
+        drdy_port: PortId,
+        command: bytes,
+        *,
+        response_offset: Optional[int] = None,
+        trigger: GpioTrigger = GpioTrigger.FALLING,
+        coalesce: bool = True,
+        ring_capacity: int = 4096,
+        poll_strategy: PollStrategy = PollStrategy(
+            spin_polls=16, initial_interval=0.00005, max_interval=0.001
+        ),
+        overflow_level: Optional[int] = TRIGGER_QUEUE_DEPTH,
+    ):
+        """Initialize the acquisition.
+
+        Args:
+            gpio:               Initialized GPIO, 'drdy_port' configured as input
+            spi_master:         Initialized SPI Master (single I/O mode)
+            drdy_port:          GPIO port connected to the DRDY signal
+            command:            Full-duplex transfer issued per sample (e.g., a read
+                                command followed by dummy bytes)
+            response_offset:    Offset of the sample data in the received bytes
+                                (default: 1, the byte following the command byte)
+            trigger:            DRDY edge ('GpioTrigger.RISING' or 'FALLING')
+            coalesce:           Read only the latest sample when several edges
+                                were found by one poll? Disable for sensors
+                                with a FIFO, so each edge is read.
+            ring_capacity:      Number of samples kept in the ring buffer
+            poll_strategy:      Trigger queue polling schedule, restarted
+                                after each detected edge
+            overflow_level:     Pending event count regarded as a (likely)
+                                trigger queue overflow, None disables the check.
+                                The default is the depth reported by the driver
+                                (65_535), lower it to be warned before edges
+                                are lost.
+        """
+        offset = 1 if response_offset is None else response_offset
+        if not (0 <= offset < len(command)):
+            raise ValueError(
+                f"response_offset must be in range <0, {len(command) - 1}>."
+            )
+        if trigger not in (GpioTrigger.RISING, GpioTrigger.FALLING):
+            raise ValueError("trigger must be either RISING or FALLING.")
+
+        super().__init__(poll_strategy)
+        self.ring = SampleRing(ring_capacity, len(command) - offset)
+        self._gpio = gpio
+        self._spi_master = spi_master
+        self._port = drdy_port
+        self._command = bytes(command)
+        self._response_offset = offset
+        self._trigger = trigger
+        self._coalesce = coalesce
+        self._overflow_level = overflow_level
+        self._sequence = 0
+        self._last_poll = 0.0
+        self._latency = Histogram.exponential(0.00005)
+        self.reset_stats()
+
+    def get_stats(self) -> AcquisitionStats:
+        """Get a snapshot of the acquisition counters.
+
+        Returns:
+            AcquisitionStats:   Counters accumulated since the last reset
+        """
+        with self._lock:
+            return AcquisitionStats(
+                self._samples,
+                self._edges,
+                self._missed_edges,
+                self._overflow_polls,
+                self.ring.overwritten,
+                self._polls,
+                self._latency.snapshot(),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the acquisition counters (except 'overwritten')."""
+        with self._lock:
+            self._samples = 0
+            self._edges = 0
+            self._missed_edges = 0
+            self._overflow_polls = 0
+            self._polls = 0
+            self._latency.reset()
+
+    def _on_start(self) -> None:
+        self._gpio.set_input_trigger(self._port, self._trigger)
+        # A single read returns at most a saturated count of events
+        while self._gpio.count_triggers(self._port).total >= TRIGGER_QUEUE_DEPTH:
+            pass
+        self._sequence = 0
+        self._last_poll = time.monotonic()
+
+    def _poll(self) -> bool:
+        counts = self._gpio.count_triggers(self._port)
+        edges = counts.rising if self._trigger == GpioTrigger.RISING else counts.falling
+        polled_at = time.monotonic()
+        last_poll, self._last_poll = self._last_poll, polled_at
+        overflow = (
+            self._overflow_level is not None and counts.total >= self._overflow_level
+        )
+
+        if edges == 0:
+            with self._lock:
+                self._polls += 1
+                self._overflow_polls += int(overflow)
+            return False
+
+        transfer = self._spi_master.single_read_write
+        offset = self._response_offset
+        reads = 1 if self._coalesce else edges
+        for _ in range(reads):
+            data = transfer(self._command)
+            now = time.monotonic()
+            self.ring.append(self._sequence, now, last_poll, data[offset:])
+            self._sequence += 1
+
+        self._latency.record(now - last_poll)
+        with self._lock:
+            self._polls += 1
+            self._samples += reads
+            self._edges += edges
+            self._missed_edges += edges - reads
+            self._overflow_polls += int(overflow)
+        return True
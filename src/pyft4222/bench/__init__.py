@@ -0,0 +1,5 @@
+"""Benchmark harnesses measuring the FT4222 Python layers.
+
+Each benchmark runs against real handles or against the simulated
+endpoints from 'pyft4222.sim', so regressions can be caught in CI.
+"""
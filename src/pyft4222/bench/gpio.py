@@ -0,0 +1,186 @@
+"""GPIO per-sample cost benchmark.
+
+Compares sampling and setting all four ports port-by-port ('read()',
+'write()') against the bulk calls ('read_all()', 'write_mask()').
+All ports are configured as outputs, so written patterns can be read back.
+
+Usage:
+    python -m pyft4222.bench.gpio --sim --call-latency 0.0001
+    python -m pyft4222.bench.gpio --dev-idx 1
+"""
+
+import argparse
+import contextlib
+import json
+import time
+from typing import (
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+)
+
+from pyft4222.wrapper.gpio import PortId
+
+_PORTS: Sequence[PortId] = tuple(PortId)
+
+
+class BenchGpio(Protocol):
+    """Any GPIO handle (e.g., 'Gpio', 'SimGpio')."""
+
+    def read(self, port_id: PortId) -> bool:
+        ...
+
+    def write(self, port_id: PortId, state: bool) -> None:
+        ...
+
+    def read_all(self) -> int:
+        ...
+
+    def write_mask(self, mask: int, states: int) -> int:
+        ...
+
+
+class GpioBenchResult(NamedTuple):
+    """NamedTuple representing the cost of one GPIO operation."""
+
+    operation: str
+    iterations: int
+    seconds: float
+    """Total time of all iterations."""
+
+    @property
+    def per_sample_us(self) -> float:
+        """Mean time of a single iteration in microseconds."""
+        return (self.seconds / self.iterations) * 1e6 if self.iterations > 0 else 0.0
+
+
+def _time(iterations: int, operation: Callable[[int], object]) -> float:
+    start = time.perf_counter()
+    for idx in range(iterations):
+        operation(idx)
+    return time.perf_counter() - start
+
+
+def run_gpio_bench(gpio: BenchGpio, iterations: int = 1000) -> List[GpioBenchResult]:
+    """Measure the per-sample cost of single-port and bulk GPIO operations.
+
+    Args:
+        gpio:           GPIO handle with all ports configured as outputs
+        iterations:     Number of samples per operation
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        List[GpioBenchResult]:  One result per measured operation
+    """
+    if iterations <= 0:
+        raise ValueError("iterations must be a positive number.")
+
+    def read_each(_: int) -> int:
+        states = 0
+        for port_id in _PORTS:
+            states |= gpio.read(port_id) << port_id
+        return states
+
+    def write_each(idx: int) -> None:
+        states = 0x0F if idx & 1 else 0x00
+        for port_id in _PORTS:
+            gpio.write(port_id, bool(states & (1 << port_id)))
+
+    operations = [
+        ("read x4", read_each),
+        ("read_all", lambda _: gpio.read_all()),
+        ("write x4", write_each),
+        ("write_mask all changed", lambda idx: gpio.write_mask(0x0F, 0x0F * (idx & 1))),
+        ("write_mask one changed", lambda idx: gpio.write_mask(0x0F, idx & 1)),
+        ("write_mask unchanged", lambda _: gpio.write_mask(0x0F, 0x0A)),
+    ]
+    return [
+        GpioBenchResult(name, iterations, _time(iterations, operation))
+        for name, operation in operations
+    ]
+
+
+def results_to_json(results: Iterable[GpioBenchResult]) -> str:
+    """Serialize benchmark results into JSON.
+
+    Args:
+        results:    Benchmark results
+
+    Returns:
+        str:        JSON list of result objects
+    """
+    return json.dumps(
+        [
+            {**result._asdict(), "per_sample_us": result.per_sample_us}
+            for result in results
+        ],
+        indent=2,
+    )
+
+
+@contextlib.contextmanager
+def open_hw_gpio(dev_idx: int) -> Iterator[BenchGpio]:
+    """Open an FT4222 GPIO stream with all ports configured as outputs.
+
+    Args:
+        dev_idx:    Device index of the GPIO stream
+
+    Yields:
+        BenchGpio:  Initialized GPIO handle
+    """
+    import pyft4222 as ft
+    from pyft4222.stream import GpioStream
+    from pyft4222.wrapper.gpio import Direction
+
+    result = ft.open_by_idx(dev_idx)
+    if not isinstance(result.val, GpioStream):
+        raise RuntimeError(f"Device {dev_idx} is not a GPIO stream: {result.val}")
+
+    with result.val as stream:
+        dirs = (Direction.OUTPUT, Direction.OUTPUT, Direction.OUTPUT, Direction.OUTPUT)
+        with stream.init_gpio(dirs) as gpio:
+            yield gpio
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sim", action="store_true", help="use simulated GPIO")
+    parser.add_argument(
+        "--call-latency",
+        type=float,
+        default=0.0,
+        help="simulated driver call duration in seconds",
+    )
+    parser.add_argument("--dev-idx", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    gpio_cm: ContextManager[BenchGpio]
+    if args.sim:
+        from pyft4222.sim import SimGpio
+
+        gpio_cm = contextlib.nullcontext(SimGpio(args.call_latency))
+    else:
+        gpio_cm = open_hw_gpio(args.dev_idx)
+
+    with gpio_cm as gpio:
+        results = run_gpio_bench(gpio, args.iterations)
+
+    if args.json:
+        print(results_to_json(results))
+    else:
+        for result in results:
+            print(f"{result.operation:<24} {result.per_sample_us:10.2f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""SPI Master to SPI Slave loopback throughput and latency benchmark.
+
+One handle writes a verification pattern using 'single_write()',
+the other drains it using 'readinto()' in a dedicated thread.
+Each transfer starts with a 32-bit sequence number, followed by
+a position-dependent byte pattern, so lost, duplicated or corrupted
+transfers are detected.
+
+Usage:
+    python -m pyft4222.bench.spi_loopback --sim
+    python -m pyft4222.bench.spi_loopback --master-idx 0 --slave-idx 2
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import threading
+import time
+from array import array
+from typing import (
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from pyft4222.wrapper import WritableBuffer
+from pyft4222.wrapper.common import ClockRate
+from pyft4222.wrapper.spi.master import ClkDiv
+
+_HEADER_SIZE: int = 4
+"""Size of the sequence number header of each transfer."""
+_PATTERN_PERIOD: int = 251
+"""Prime pattern period, so consecutive transfers differ."""
+_MAX_READ_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes read by a single driver call."""
+
+
+class LoopbackMaster(Protocol):
+    """Master side of the loopback (e.g., 'SpiMasterSingle', 'SimSpiMaster')."""
+
+    def single_write(self, write_data: bytes, end_transaction: bool = True) -> int:
+        ...
+
+
+class LoopbackSlave(Protocol):
+    """Slave side of the loopback (e.g., 'SpiSlaveRaw', 'SimSpiSlave')."""
+
+    def get_rx_status(self) -> int:
+        ...
+
+    def readinto(self, buffer: WritableBuffer) -> int:
+        ...
+
+
+PairFactory = Callable[
+    [ClockRate, ClkDiv], ContextManager[Tuple[LoopbackMaster, LoopbackSlave]]
+]
+
+
+class LoopbackResult(NamedTuple):
+    """NamedTuple representing the result of a single loopback run."""
+
+    clk_rate: Optional[str]
+    clk_div: Optional[str]
+    spi_clock_hz: Optional[float]
+    transfer_size: int
+    transfer_count: int
+    bytes_sent: int
+    bytes_received: int
+    seconds: float
+    """Time from the first write to the reception of the last byte."""
+    throughput_mb_s: float
+    """Received payload in MB/s (10^6 bytes per second)."""
+    latency_p50: float
+    """Median time from the start of a write to the reception of its last byte."""
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    error_transfers: int
+    """Number of received transfers not matching the pattern.
+
+    After lost or extra bytes the receiver resynchronizes on the next
+    sequence header, so each such event is counted once.
+    """
+    missing_bytes: int
+    """Number of bytes not received before the timeout."""
+
+
+def _payload_template(transfer_size: int) -> bytes:
+    return bytes(idx % 256 for idx in range(transfer_size + _PATTERN_PERIOD))
+
+
+def _fill_payload(buffer: bytearray, template: bytes, seq: int) -> None:
+    phase = seq % _PATTERN_PERIOD
+    buffer[:_HEADER_SIZE] = seq.to_bytes(_HEADER_SIZE, "little")
+    buffer[_HEADER_SIZE:] = template[phase : phase + len(buffer) - _HEADER_SIZE]
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if len(sorted_values) == 0:
+        return float("nan")
+    idx = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[idx]
+
+
+class _Receiver(threading.Thread):
+    """Thread draining the slave and verifying received transfers."""
+
+    received: int
+    error_transfers: int
+    recv_times: "array[float]"
+    """Reception time of each transfer (NaN for transfers never received)."""
+    error: Optional[BaseException]
+
+    def __init__(
+        self,
+        slave: LoopbackSlave,
+        template: bytes,
+        transfer_size: int,
+        transfer_count: int,
+        deadline: float,
+    ):
+        super().__init__(name="pyft4222-bench-receiver", daemon=True)
+        self._slave = slave
+        self._template = template
+        self._transfer_size = transfer_size
+        self._transfer_count = transfer_count
+        self._deadline = deadline
+        self.received = 0
+        self.error_transfers = 0
+        self.recv_times = array("d", [math.nan]) * transfer_count
+        self.error = None
+
+    def run(self) -> None:
+        try:
+            self._receive()
+        except BaseException as e:
+            self.error = e
+
+    def _receive(self) -> None:
+        total = self._transfer_size * self._transfer_count
+        read_buffer = memoryview(bytearray(_MAX_READ_SIZE))
+        pending = bytearray()
+        expected = bytearray(self._transfer_size)
+        synced = True
+        seq = 0
+
+        while (
+            self.received < total
+            and seq < self._transfer_count
+            and time.perf_counter() < self._deadline
+        ):
+            rx_count = self._slave.get_rx_status()
+            if rx_count <= 0:
+                time.sleep(0)
+                continue
+
+            read_len = min(rx_count, _MAX_READ_SIZE, total - self.received)
+            bytes_read = self._slave.readinto(read_buffer[:read_len])
+            now = time.perf_counter()
+            pending += read_buffer[:bytes_read]
+            self.received += bytes_read
+
+            while seq < self._transfer_count:
+                if not synced:
+                    found = _find_header(pending, seq, self._transfer_count)
+                    if found is None:
+                        # Keep a possibly incomplete header for the next read
+                        del pending[: max(len(pending) - _HEADER_SIZE + 1, 0)]
+                        break
+                    pos, seq = found
+                    del pending[:pos]
+                    synced = True
+
+                if len(pending) < self._transfer_size:
+                    break
+
+                _fill_payload(expected, self._template, seq)
+                if pending.startswith(expected):
+                    del pending[: self._transfer_size]
+                else:
+                    # Lost, extra or corrupted bytes, skip to the next header
+                    self.error_transfers += 1
+                    del pending[:1]
+                    synced = False
+                self.recv_times[seq] = now
+                seq += 1
+
+
+def _find_header(
+    buffer: bytearray, first_seq: int, end_seq: int
+) -> Optional[Tuple[int, int]]:
+    for pos in range(len(buffer) - _HEADER_SIZE + 1):
+        seq = int.from_bytes(buffer[pos : pos + _HEADER_SIZE], "little")
+        if first_seq <= seq < end_seq:
+            return pos, seq
+    return None
+
+
+def run_loopback(
+    master: LoopbackMaster,
+    slave: LoopbackSlave,
+    *,
+    transfer_size: int = 4096,
+    transfer_count: int = 256,
+    timeout: float = 10.0,
+    clk_rate: Optional[ClockRate] = None,
+    clk_div: Optional[ClkDiv] = None,
+) -> LoopbackResult:
+    """Run a single loopback measurement.
+
+    Args:
+        master:             Initialized SPI Master in single I/O mode
+        slave:              Initialized SPI Slave in raw mode, wired to 'master'
+        transfer_size:      Bytes per 'single_write()' call;   range <8, 65_535>
+        transfer_count:     Number of transfers
+        timeout:            Maximum duration of the run in seconds
+        clk_rate:           System clock used (for reporting only)
+        clk_div:            SPI clock divisor used (for reporting only)
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        LoopbackResult:     Measured throughput, latencies and error counts
+    """
+    if not (2 * _HEADER_SIZE <= transfer_size < (2 ** 16)):
+        raise ValueError("transfer_size must be in range <8, 65_535>.")
+    if transfer_count <= 0:
+        raise ValueError("transfer_count must be a positive number.")
+
+    template = _payload_template(transfer_size)
+    payload = bytearray(transfer_size)
+    send_times = array("d", [0.0]) * transfer_count
+
+    start = time.perf_counter()
+    receiver = _Receiver(
+        slave, template, transfer_size, transfer_count, start + timeout
+    )
+    receiver.start()
+
+    for seq in range(transfer_count):
+        _fill_payload(payload, template, seq)
+        data = bytes(payload)
+        send_times[seq] = time.perf_counter()
+        master.single_write(data)
+
+    receiver.join()
+    if receiver.error is not None:
+        raise receiver.error
+
+    completed = [
+        seq for seq in range(transfer_count) if not math.isnan(receiver.recv_times[seq])
+    ]
+    latencies = sorted(receiver.recv_times[seq] - send_times[seq] for seq in completed)
+    end = receiver.recv_times[completed[-1]] if completed else start
+    seconds = end - send_times[0]
+
+    return LoopbackResult(
+        clk_rate.name if clk_rate is not None else None,
+        clk_div.name if clk_div is not None else None,
+        (
+            (clk_rate.frequency / clk_div.divisor)
+            if clk_rate is not None and clk_div is not None
+            else None
+        ),
+        transfer_size,
+        transfer_count,
+        transfer_size * transfer_count,
+        receiver.received,
+        seconds,
+        (receiver.received / seconds / 1e6) if seconds > 0 else 0.0,
+        _percentile(latencies, 0.50),
+        _percentile(latencies, 0.90),
+        _percentile(latencies, 0.99),
+        latencies[-1] if latencies else float("nan"),
+        receiver.error_transfers,
+        transfer_size * transfer_count - receiver.received,
+    )
+
+
+def run_sweep(
+    open_pair: PairFactory,
+    combinations: Iterable[Tuple[ClockRate, ClkDiv]],
+    *,
+    transfer_size: int = 4096,
+    transfer_count: int = 256,
+    timeout: float = 10.0,
+) -> List[LoopbackResult]:
+    """Run the loopback measurement for each clock rate/divisor combination.
+
+    Args:
+        open_pair:          Returns a context manager yielding a (master, slave)
+                            pair configured for the given clock rate and divisor
+        combinations:       Clock rate and divisor pairs to measure
+        transfer_size:      Bytes per 'single_write()' call
+        transfer_count:     Number of transfers per combination
+        timeout:            Maximum duration of each run in seconds
+
+    Returns:
+        List[LoopbackResult]:   One result per combination
+    """
+    results: List[LoopbackResult] = []
+    for clk_rate, clk_div in combinations:
+        with open_pair(clk_rate, clk_div) as (master, slave):
+            results.append(
+                run_loopback(
+                    master,
+                    slave,
+                    transfer_size=transfer_size,
+                    transfer_count=transfer_count,
+                    timeout=timeout,
+                    clk_rate=clk_rate,
+                    clk_div=clk_div,
+                )
+            )
+    return results
+
+
+def results_to_json(results: Iterable[LoopbackResult]) -> str:
+    """Serialize loopback results into a JSON array.
+
+    Args:
+        results:    Results to serialize
+
+    Returns:
+        str:        JSON document
+    """
+    return json.dumps([result._asdict() for result in results], indent=2)
+
+
+def sim_pair_factory(realtime: bool = False) -> PairFactory:
+    """Get a pair factory creating simulated SPI links.
+
+    Args:
+        realtime:   Let the simulated link take the time of a real transfer?
+
+    Returns:
+        PairFactory:    Factory usable with 'run_sweep()'
+    """
+    from pyft4222.sim import SimSpiLink
+
+    def open_pair(
+        clk_rate: ClockRate, clk_div: ClkDiv
+    ) -> ContextManager[Tuple[LoopbackMaster, LoopbackSlave]]:
+        link = SimSpiLink(clk_rate, clk_div, realtime=realtime)
+        return contextlib.nullcontext((link.master, link.slave))
+
+    return open_pair
+
+
+def hw_pair_factory(master_idx: int, slave_idx: int) -> PairFactory:
+    """Get a pair factory opening two FT4222 data streams.
+
+    Args:
+        master_idx:     Device index of the SPI Master stream
+        slave_idx:      Device index of the SPI Slave stream
+
+    Returns:
+        PairFactory:    Factory usable with 'run_sweep()'
+    """
+    import pyft4222 as ft
+    from pyft4222.stream import ProtocolStream
+    from pyft4222.wrapper.spi import ClkPhase, ClkPolarity
+    from pyft4222.wrapper.spi.master import SsoMap
+
+    def open_stream(dev_idx: int) -> ProtocolStream:
+        result = ft.open_by_idx(dev_idx)
+        if isinstance(result.val, ProtocolStream):
+            return result.val
+        raise RuntimeError(f"Device {dev_idx} is not a data stream: {result.val}")
+
+    @contextlib.contextmanager
+    def open_pair(
+        clk_rate: ClockRate, clk_div: ClkDiv
+    ) -> Iterator[Tuple[LoopbackMaster, LoopbackSlave]]:
+        with open_stream(master_idx) as master_stream, open_stream(
+            slave_idx
+        ) as slave_stream:
+            master_stream.set_clock(clk_rate)
+            slave_stream.set_clock(clk_rate)
+            with master_stream.init_single_spi_master(
+                clk_div, ClkPolarity.CLK_IDLE_LOW, ClkPhase.CLK_LEADING, SsoMap.SS_0
+            ) as master, slave_stream.init_raw_spi_slave() as slave:
+                slave.set_mode(ClkPolarity.CLK_IDLE_LOW, ClkPhase.CLK_LEADING)
+                yield master, slave
+
+    return open_pair
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sim", action="store_true", help="use simulated link")
+    parser.add_argument("--realtime", action="store_true", help="simulate bus time")
+    parser.add_argument("--master-idx", type=int, default=0)
+    parser.add_argument("--slave-idx", type=int, default=1)
+    parser.add_argument("--size", type=int, default=4096, help="bytes per transfer")
+    parser.add_argument("--count", type=int, default=256, help="transfer count")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument(
+        "--clk-rates",
+        nargs="+",
+        default=[rate.name for rate in ClockRate],
+        choices=[rate.name for rate in ClockRate],
+    )
+    parser.add_argument(
+        "--clk-divs",
+        nargs="+",
+        default=[div.name for div in ClkDiv if div != ClkDiv.CLK_NONE],
+        choices=[div.name for div in ClkDiv if div != ClkDiv.CLK_NONE],
+    )
+    args = parser.parse_args(argv)
+
+    open_pair = (
+        sim_pair_factory(args.realtime)
+        if args.sim
+        else hw_pair_factory(args.master_idx, args.slave_idx)
+    )
+    combinations = [
+        (ClockRate[rate], ClkDiv[div])
+        for rate in args.clk_rates
+        for div in args.clk_divs
+    ]
+    results = run_sweep(
+        open_pair,
+        combinations,
+        transfer_size=args.size,
+        transfer_count=args.count,
+        timeout=args.timeout,
+    )
+    print(results_to_json(results))
+
+
+if __name__ == "__main__":
+    main()
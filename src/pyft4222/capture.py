@@ -0,0 +1,483 @@
+"""Module implementing long-running capture of slave-mode traffic to disk.
+
+Device draining and disk writes are decoupled by a bounded queue.
+A reader thread empties the device Rx queue as fast as possible,
+a writer thread coalesces the received chunks into large blocks
+and writes them into size- or time-rotated capture files.
+
+Each capture file 'NAME.bin' is accompanied by an index file 'NAME.idx'
+containing one fixed-size record per written block (see 'IndexEntry').
+The index can be used to seek into the capture by host timestamp
+without scanning the data.
+
+Example:
+    with CaptureService(spi_slave, "/var/capture", prefix="bus0") as capture:
+        time.sleep(3600)
+    print(capture.get_stats())
+"""
+
+import errno
+import os
+import queue
+import struct
+import threading
+import time
+from bisect import bisect_right
+from types import TracebackType
+from typing import BinaryIO, List, NamedTuple, Optional, Protocol, Tuple, Type
+
+from pyft4222.wrapper import WritableBuffer
+
+_INDEX_RECORD: struct.Struct = struct.Struct("<dQI")
+"""Index record layout: wall-clock timestamp, file offset, block length."""
+_MAX_READ_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes read by a single driver call."""
+_ALIGNMENT: int = 4096
+"""Block size alignment (in bytes)."""
+
+
+class CaptureSource(Protocol):
+    """Any slave handle with an Rx queue (e.g., 'SpiSlaveRaw', 'I2CSlave')."""
+
+    def get_rx_status(self) -> int:
+        ...
+
+    def readinto(self, buffer: WritableBuffer) -> int:
+        ...
+
+
+class IndexEntry(NamedTuple):
+    """NamedTuple representing a single capture index record."""
+
+    timestamp: float
+    """Host wall-clock time at which the first byte of the block was read."""
+    offset: int
+    """Offset of the block in the capture file."""
+    length: int
+    """Length of the block in bytes."""
+
+
+class CaptureStats(NamedTuple):
+    """NamedTuple representing capture statistics."""
+
+    bytes_captured: int
+    """Number of bytes read from the device."""
+    bytes_written: int
+    """Number of bytes written to disk."""
+    blocks_written: int
+    """Number of blocks written to disk."""
+    files_written: int
+    """Number of capture files opened."""
+    dropped_chunks: int
+    """Number of chunks dropped because the queue was full."""
+    dropped_bytes: int
+    """Number of bytes dropped because the queue was full."""
+    max_queue_depth: int
+    """Maximum observed number of chunks waiting for the writer."""
+    mean_write_latency: float
+    """Mean time between reading a block's first byte and writing it (seconds)."""
+    max_write_latency: float
+    """Maximum time between reading a block's first byte and writing it (seconds)."""
+
+
+def read_index(index_path: str) -> List[IndexEntry]:
+    """Read all records from a capture index file.
+
+    Args:
+        index_path:     Path to the '.idx' file
+
+    Returns:
+        List[IndexEntry]:   Index records ordered by file offset
+    """
+    with open(index_path, "rb") as index_file:
+        data = index_file.read()
+
+    usable = len(data) - (len(data) % _INDEX_RECORD.size)
+    return [IndexEntry(*fields) for fields in _INDEX_RECORD.iter_unpack(data[:usable])]
+
+
+def find_offset(entries: List[IndexEntry], timestamp: float) -> int:
+    """Find the offset of the block containing data captured at the given time.
+
+    Args:
+        entries:        Index records (see 'read_index()')
+        timestamp:      Host wall-clock timestamp
+
+    Returns:
+        int:            File offset of the last block started before 'timestamp'
+    """
+    idx = bisect_right([entry.timestamp for entry in entries], timestamp)
+    return entries[max(idx - 1, 0)].offset if entries else 0
+
+
+class CaptureService:
+    """A class capturing a slave Rx stream into rotating, size-bounded files."""
+
+    _source: CaptureSource
+    _directory: str
+    _prefix: str
+    _block_size: int
+    _max_file_size: int
+    _max_file_age: Optional[float]
+    _flush_interval: float
+    _poll_interval: float
+    _fsync: bool
+    _queue_size: int
+    _queue: "queue.Queue[Optional[Tuple[float, float, bytearray, int]]]"
+    _free_chunks: "queue.SimpleQueue[bytearray]"
+    _chunk_count: int
+    _drop_chunk: memoryview
+    _stop_event: threading.Event
+    _reader: Optional[threading.Thread]
+    _writer: Optional[threading.Thread]
+    _error: Optional[BaseException]
+    _lock: threading.Lock
+
+    _data_file: Optional[BinaryIO]
+    _index_file: Optional[BinaryIO]
+    _file_offset: int
+    _file_opened_at: float
+    _file_count: int
+
+    _bytes_captured: int
+    _bytes_written: int
+    _blocks_written: int
+    _dropped_chunks: int
+    _dropped_bytes: int
+    _max_queue_depth: int
+    _latency_sum: float
+    _latency_max: float
+
+    def __init__(
+        self,
+        source: CaptureSource,
+        directory: str,
+        *,
+        prefix: str = "capture",
+        block_size: int = 2 ** 20,
+        max_file_size: int = 2 ** 30,
+        max_file_age: Optional[float] = None,
+        queue_size: int = 1024,
+        flush_interval: float = 1.0,
+        poll_interval: float = 0.0005,
+        fsync: bool = False,
+    ):
+        """Initialize the capture service.
+
+        Args:
+            source:             Initialized slave handle to capture from
+            directory:          Directory to store capture files into
+            prefix:             Capture file name prefix
+            block_size:         Disk write size in bytes, a multiple of 4096
+            max_file_size:      Rotate files after reaching this size (bytes)
+            max_file_age:       Rotate files after this many seconds (if not None)
+            queue_size:         Maximum number of chunks waiting for the writer,
+                                each chunk buffer takes 64 KiB once allocated
+            flush_interval:     Write out partially filled blocks after this
+                                many seconds of inactivity
+            poll_interval:      Rx queue poll interval while the device is idle
+            fsync:              Call 'os.fsync()' on the capture and index files
+                                after each block
+        """
+        if block_size <= 0 or block_size % _ALIGNMENT != 0:
+            raise ValueError("block_size must be a positive multiple of 4096.")
+        if max_file_size < block_size:
+            raise ValueError("max_file_size must not be smaller than block_size.")
+        if queue_size <= 0:
+            raise ValueError("queue_size must be a positive number.")
+
+        self._source = source
+        self._directory = directory
+        self._prefix = prefix
+        self._block_size = block_size
+        self._max_file_size = max_file_size
+        self._max_file_age = max_file_age
+        self._flush_interval = flush_interval
+        self._poll_interval = poll_interval
+        self._fsync = fsync
+        self._queue_size = queue_size
+        self._queue = queue.Queue(queue_size)
+        self._free_chunks = queue.SimpleQueue()
+        self._chunk_count = 0
+        self._drop_chunk = memoryview(bytearray(_MAX_READ_SIZE))
+        self._stop_event = threading.Event()
+        self._reader = None
+        self._writer = None
+        self._error = None
+        self._lock = threading.Lock()
+
+        self._data_file = None
+        self._index_file = None
+        self._file_offset = 0
+        self._file_opened_at = 0.0
+        self._file_count = 0
+
+        self._bytes_captured = 0
+        self._bytes_written = 0
+        self._blocks_written = 0
+        self._dropped_chunks = 0
+        self._dropped_bytes = 0
+        self._max_queue_depth = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+
+    def __enter__(self) -> "CaptureService":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        self.stop()
+        return False
+
+    def start(self) -> None:
+        """Start the reader and writer threads."""
+        if self._reader is not None:
+            raise RuntimeError("Capture is already running!")
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._stop_event.clear()
+        self._error = None
+        self._writer = threading.Thread(
+            target=self._write_loop, name="pyft4222-capture-writer", daemon=True
+        )
+        self._reader = threading.Thread(
+            target=self._read_loop, name="pyft4222-capture-reader", daemon=True
+        )
+        self._writer.start()
+        self._reader.start()
+
+    def stop(self) -> None:
+        """Stop capturing, write out all queued data and close the files.
+
+        Raises:
+            Ft4222Exception:    If the reader thread failed on a device error
+            OSError:            If the writer thread failed on a disk error
+        """
+        if self._reader is None or self._writer is None:
+            return
+
+        self._stop_event.set()
+        self._reader.join()
+        # Deliver the sentinel unless the writer already died on an error
+        while self._writer.is_alive():
+            try:
+                self._queue.put(None, timeout=self._flush_interval)
+                break
+            except queue.Full:
+                pass
+        self._writer.join()
+        self._reader = None
+        self._writer = None
+
+        if self._error is not None:
+            raise self._error
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """Error which stopped the capture, None while it runs normally.
+
+        A device error stops the reader thread and a disk error stops both
+        the writer and the reader thread; 'stop()' re-raises the error.
+        """
+        return self._error
+
+    def get_stats(self) -> CaptureStats:
+        """Get a snapshot of the capture statistics.
+
+        Returns:
+            CaptureStats:       Capture statistics
+        """
+        with self._lock:
+            return CaptureStats(
+                self._bytes_captured,
+                self._bytes_written,
+                self._blocks_written,
+                self._file_count,
+                self._dropped_chunks,
+                self._dropped_bytes,
+                self._max_queue_depth,
+                (
+                    (self._latency_sum / self._blocks_written)
+                    if self._blocks_written > 0
+                    else 0.0
+                ),
+                self._latency_max,
+            )
+
+    # Reader thread
+
+    def _read_loop(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                rx_count = self._source.get_rx_status()
+                if rx_count <= 0:
+                    self._stop_event.wait(self._poll_interval)
+                    continue
+
+                chunk = self._get_free_chunk()
+                read_len = min(rx_count, _MAX_READ_SIZE)
+                if chunk is None:
+                    # Keep draining the device, otherwise its queue overflows
+                    bytes_read = self._source.readinto(self._drop_chunk[:read_len])
+                    with self._lock:
+                        self._bytes_captured += bytes_read
+                        self._dropped_chunks += 1
+                        self._dropped_bytes += bytes_read
+                    continue
+
+                bytes_read = self._source.readinto(memoryview(chunk)[:read_len])
+                if bytes_read > 0:
+                    self._queue.put_nowait(
+                        (time.monotonic(), time.time(), chunk, bytes_read)
+                    )
+                    depth = self._queue.qsize()
+                    with self._lock:
+                        self._bytes_captured += bytes_read
+                        self._max_queue_depth = max(self._max_queue_depth, depth)
+                else:
+                    self._free_chunks.put(chunk)
+        except BaseException as e:
+            self._error = e
+
+    def _get_free_chunk(self) -> Optional[bytearray]:
+        try:
+            return self._free_chunks.get_nowait()
+        except queue.Empty:
+            # Chunks are allocated lazily, at most one per queue slot
+            if self._chunk_count < self._queue_size:
+                self._chunk_count += 1
+                return bytearray(_MAX_READ_SIZE)
+            return None
+
+    # Writer thread
+
+    def _write_loop(self) -> None:
+        block = bytearray(self._block_size)
+        block_view = memoryview(block)
+        block_len = 0
+        block_read_at = 0.0
+        block_timestamp = 0.0
+
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self._flush_interval)
+                except queue.Empty:
+                    # Device is idle, do not keep data in memory
+                    if block_len > 0:
+                        self._write_block(
+                            block_view[:block_len], block_read_at, block_timestamp
+                        )
+                        block_len = 0
+                    continue
+
+                if item is None:
+                    break
+
+                read_at, timestamp, chunk, chunk_len = item
+                offset = 0
+                while offset < chunk_len:
+                    if block_len == 0:
+                        block_read_at = read_at
+                        block_timestamp = timestamp
+
+                    limit = self._block_limit()
+                    copy_len = min(limit - block_len, chunk_len - offset)
+                    block_view[block_len : block_len + copy_len] = chunk[
+                        offset : offset + copy_len
+                    ]
+                    block_len += copy_len
+                    offset += copy_len
+
+                    if block_len >= limit:
+                        self._write_block(
+                            block_view[:block_len], block_read_at, block_timestamp
+                        )
+                        block_len = 0
+
+                self._free_chunks.put(chunk)
+
+            if block_len > 0:
+                self._write_block(
+                    block_view[:block_len], block_read_at, block_timestamp
+                )
+        except BaseException as e:
+            self._error = e
+            # Stop the reader, nothing would consume its chunks anymore
+            self._stop_event.set()
+        finally:
+            self._close_files()
+
+    def _block_limit(self) -> int:
+        # Partial blocks (flushed on idle) are followed by a shorter block
+        # to bring the file offset back to block alignment
+        return self._block_size - (self._file_offset % self._block_size)
+
+    def _write_block(self, block: memoryview, read_at: float, timestamp: float) -> None:
+        if self._needs_rotation(len(block)):
+            self._rotate()
+
+        assert self._data_file is not None and self._index_file is not None
+
+        # Raw (unbuffered) writes may be short
+        written = 0
+        while written < len(block):
+            count = self._data_file.write(block[written:])
+            if not count:
+                raise OSError(errno.EIO, "Capture file accepted no data!")
+            written += count
+        if self._fsync:
+            os.fsync(self._data_file.fileno())
+
+        # The record is written only after its data, so a crash never
+        # leaves an index entry pointing past the end of the capture file
+        self._index_file.write(
+            _INDEX_RECORD.pack(timestamp, self._file_offset, len(block))
+        )
+        self._index_file.flush()
+        if self._fsync:
+            os.fsync(self._index_file.fileno())
+
+        self._file_offset += len(block)
+        latency = time.monotonic() - read_at
+
+        with self._lock:
+            self._bytes_written += len(block)
+            self._blocks_written += 1
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+
+    def _needs_rotation(self, block_len: int) -> bool:
+        if self._data_file is None:
+            return True
+        if self._file_offset + block_len > self._max_file_size:
+            return True
+        if self._max_file_age is not None:
+            return (time.monotonic() - self._file_opened_at) >= self._max_file_age
+        return False
+
+    def _rotate(self) -> None:
+        self._close_files()
+
+        name = f"{self._prefix}-{time.strftime('%Y%m%dT%H%M%S')}-{self._file_count:06d}"
+        base_path = os.path.join(self._directory, name)
+        self._data_file = open(base_path + ".bin", "wb", buffering=0)
+        self._index_file = open(base_path + ".idx", "wb")
+        self._file_offset = 0
+        self._file_opened_at = time.monotonic()
+
+        with self._lock:
+            self._file_count += 1
+
+    def _close_files(self) -> None:
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
@@ -0,0 +1,291 @@
+"""Module implementing a background-drained stream of GPIO trigger events.
+
+The FT4222 records input trigger events (see 'Gpio.set_input_trigger()')
+into a small per-port queue which overflows when it is not read in time.
+'GpioEventStream' drains the queues of all selected ports in a dedicated
+thread using adaptive polling and stamps each event with the host
+monotonic time of the poll which found it.
+
+Events are delivered through any combination of:
+    - iteration ('for event in stream')
+    - a callback invoked from the drain thread
+    - 'asyncio.Queue' objects (see 'async_queue()')
+
+Note:
+    An idle poll costs one driver call per port, the queue of a port is
+    only read when it holds events (into a buffer reused across polls).
+    Events of different ports found by the same poll share the timestamp,
+    their relative order is unknown.
+
+Example:
+    gpio.set_input_trigger(PortId.PORT_2, GpioTrigger.RISING | GpioTrigger.FALLING)
+    with GpioEventStream(gpio, [PortId.PORT_2]) as stream:
+        for event in stream:
+            print(event.port, event.trigger, event.timestamp)
+"""
+
+import asyncio
+import queue
+import time
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pyft4222.gpio import TRIGGER_QUEUE_DEPTH, Gpio
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.polling import PollStrategy
+from pyft4222.worker import PollingWorker
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+
+_TRIGGERS: Dict[int, GpioTrigger] = {trigger.value: trigger for trigger in GpioTrigger}
+"""Raw event values mapped to their (cached) enum members."""
+_ITER_POLL_INTERVAL: float = 0.05
+"""Interval (in seconds) at which a waiting iterator checks for a stopped stream."""
+
+
+class GpioEvent(NamedTuple):
+    """NamedTuple representing a single GPIO trigger event."""
+
+    port: PortId
+    trigger: GpioTrigger
+    timestamp: float
+    """Host 'time.monotonic()' of the poll which found the event."""
+
+
+class EventStreamStats(NamedTuple):
+    """NamedTuple representing GPIO event stream counters."""
+
+    events: int
+    """Number of events read from the device."""
+    polls: int
+    """Number of polls (one trigger status query per port each)."""
+    dropped: int
+    """Events dropped because the iteration queue or an asyncio queue was full."""
+    max_pending: int
+    """Largest number of events found in a single port queue."""
+    overflow_polls: int
+    """Polls finding a port queue at or above 'overflow_level'."""
+    latency: HistogramSnapshot
+    """Upper bound of the event age at detection (seconds).
+
+    Time since the previous poll, recorded once per poll finding events.
+    """
+
+
+class GpioEventStream(PollingWorker):
+    """A class draining GPIO trigger event queues in a background thread.
+
+    Events pending when the stream is stopped stay available for iteration.
+    """
+
+    _worker_name = "Event stream"
+    _thread_name = "pyft4222-gpio-events"
+
+    _gpio: Gpio[Any]
+    _ports: Tuple[PortId, ...]
+    _callback: Optional[Callable[[GpioEvent], None]]
+    _overflow_level: Optional[int]
+    _buffer: "array[int]"
+    _queue: "Optional[queue.Queue[GpioEvent]]"
+    _async_queues: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[GpioEvent]"]]
+    _last_poll: float
+
+    _events: int
+    _polls: int
+    _dropped: int
+    _max_pending: int
+    _overflow_polls: int
+    _latency: Histogram
+
+    def __init__(
+        self,
+        gpio: Gpio[Any],
+        ports: Iterable[PortId] = tuple(PortId),
+        *,
+        callback: Optional[Callable[[GpioEvent], None]] = None,
+        queue_size: int = 4096,
+        poll_strategy: PollStrategy = PollStrategy(
+            spin_polls=4, initial_interval=0.0002, max_interval=0.005
+        ),
+        overflow_level: Optional[int] = TRIGGER_QUEUE_DEPTH,
+    ):
+        """Initialize the event stream.
+
+        Args:
+            gpio:           Initialized GPIO with input triggers configured
+            ports:          Ports to drain
+            callback:       Called from the drain thread for each event
+            queue_size:     Maximum number of events waiting for iteration,
+                            0 disables iteration (no events are queued)
+            poll_strategy:  Polling schedule, restarted whenever events are found
+            overflow_level: Pending event count regarded as a (likely) queue
+                            overflow, None disables the check. The default
+                            is the depth reported by the driver (65_535),
+                            lower it to be warned before events are lost.
+        """
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative.")
+
+        super().__init__(poll_strategy)
+        self._gpio = gpio
+        self._ports = tuple(ports)
+        self._callback = callback
+        self._overflow_level = overflow_level
+        self._buffer = array("I", bytes(4 * 64))
+        self._queue = queue.Queue(queue_size) if queue_size > 0 else None
+        self._async_queues = []
+        self._last_poll = 0.0
+        self._latency = Histogram.exponential(0.0001)
+        self.reset_stats()
+
+    def __iter__(self) -> Iterator[GpioEvent]:
+        """Iterate over events until the stream is stopped and drained."""
+        while True:
+            event = self.get(_ITER_POLL_INTERVAL)
+            if event is not None:
+                yield event
+            elif not self.running:
+                return
+
+    def get(self, timeout: Optional[float] = None) -> Optional[GpioEvent]:
+        """Get the next event.
+
+        Args:
+            timeout:    Maximum wait in seconds, None waits forever
+
+        Returns:
+            Optional[GpioEvent]:    Next event, None on timeout
+        """
+        if self._queue is None:
+            raise RuntimeError("Iteration is disabled (queue_size == 0)!")
+
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def async_queue(self, maxsize: int = 0) -> "asyncio.Queue[GpioEvent]":
+        """Create an asyncio queue receiving all subsequent events.
+
+        Must be called from a coroutine, events are put into the queue
+        by the running event loop. Events are dropped while the queue is full
+        (counted as 'dropped').
+
+        Args:
+            maxsize:    Maximum queue size, 0 means unbounded
+
+        Returns:
+            asyncio.Queue[GpioEvent]:   Queue receiving the events
+        """
+        loop = asyncio.get_running_loop()
+        async_queue: "asyncio.Queue[GpioEvent]" = asyncio.Queue(maxsize)
+        with self._lock:
+            self._async_queues = [*self._async_queues, (loop, async_queue)]
+        return async_queue
+
+    def get_stats(self) -> EventStreamStats:
+        """Get a snapshot of the stream counters.
+
+        Returns:
+            EventStreamStats:   Counters accumulated since the last reset
+        """
+        with self._lock:
+            return EventStreamStats(
+                self._events,
+                self._polls,
+                self._dropped,
+                self._max_pending,
+                self._overflow_polls,
+                self._latency.snapshot(),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the stream counters."""
+        with self._lock:
+            self._events = 0
+            self._polls = 0
+            self._dropped = 0
+            self._max_pending = 0
+            self._overflow_polls = 0
+            self._latency.reset()
+
+    def _on_start(self) -> None:
+        self._last_poll = time.monotonic()
+
+    def _poll(self) -> bool:
+        events = self._read_events()
+        now = time.monotonic()
+        if events:
+            self._latency.record(now - self._last_poll)
+            for event in events:
+                self._deliver(event)
+        self._last_poll = now
+        return len(events) > 0
+
+    def _read_events(self) -> List[GpioEvent]:
+        gpio = self._gpio
+        events: List[GpioEvent] = []
+        max_pending = 0
+        overflow = False
+
+        for port in self._ports:
+            pending = gpio.get_queued_trigger_event_count(port)
+            if pending <= 0:
+                continue
+
+            if len(self._buffer) < pending:
+                self._buffer = array("I", bytes(4 * pending))
+            event_count = gpio.read_trigger_queue_into(
+                port, memoryview(self._buffer)[:pending]
+            )
+            timestamp = time.monotonic()
+            events.extend(
+                GpioEvent(port, _TRIGGERS.get(value) or GpioTrigger(value), timestamp)
+                for value in memoryview(self._buffer)[:event_count].tolist()
+            )
+            max_pending = max(max_pending, pending)
+            if self._overflow_level is not None and pending >= self._overflow_level:
+                overflow = True
+
+        with self._lock:
+            self._polls += 1
+            self._events += len(events)
+            self._max_pending = max(self._max_pending, max_pending)
+            self._overflow_polls += int(overflow)
+
+        return events
+
+    def _deliver(self, event: GpioEvent) -> None:
+        if self._callback is not None:
+            self._callback(event)
+
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                with self._lock:
+                    self._dropped += 1
+
+        for loop, async_queue in self._async_queues:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._put_async, async_queue, event)
+
+    def _put_async(
+        self, async_queue: "asyncio.Queue[GpioEvent]", event: GpioEvent
+    ) -> None:
+        # Runs in the event loop thread
+        try:
+            async_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            with self._lock:
+                self._dropped += 1
@@ -0,0 +1,292 @@
+"""Module implementing GPIO frequency and duty cycle measurements.
+
+'FrequencyCounter' enables rising and falling edge triggers on an input
+port and drains the trigger queue in bulk. Edges are counted per window
+(host-timed, between two queue polls), so the frequency resolution is
+'1 / window' and nothing is lost between consecutive windows.
+
+Edges of a two-level signal alternate. Two equal consecutive events in the
+queue mean that events were dropped, which is reported as an overflow.
+
+'measure_duty_cycle()' uses the waveform mode instead (see
+'pyft4222.waveform'), the trigger queue does not carry edge times.
+
+Measurable range:
+    - lowest frequency: '1 / window' (at least one period per window)
+    - highest frequency: limited by the undocumented trigger sampling
+      of the device, not by the host (the queue is drained in bulk),
+      so always check 'overflow'. 'max_hz' reports the frequency at
+      which the host could still read each edge by a separate call.
+
+Example:
+    counter = FrequencyCounter(gpio, PortId.PORT_2)
+    if not counter.check(1000.0, tolerance=0.01, window=0.5):
+        print("Clock out of tolerance")
+"""
+
+import re
+import sys
+import time
+from array import array
+from typing import Any, List, NamedTuple, Tuple
+
+from pyft4222.gpio import Gpio
+from pyft4222.polling import PollStrategy
+from pyft4222.waveform import capture_waveform, find_edges
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+_LSB_OFFSET: int = 0 if sys.byteorder == "little" else 3
+"""Offset of the least significant byte of a raw 32-bit event value."""
+_REPEATS: "re.Pattern[bytes]" = re.compile(b"(?=\x01\x01|\x02\x02)")
+"""Two equal consecutive edges (zero-width, so overlapping runs count)."""
+
+
+class FrequencyMeasurement(NamedTuple):
+    """NamedTuple representing the result of one measurement window."""
+
+    frequency: float
+    """Rising edges per second."""
+    rising: int
+    falling: int
+    elapsed: float
+    """Window length in seconds (between the bounding queue polls)."""
+    min_hz: float
+    """Lowest measurable frequency, equal to the resolution ('1 / elapsed')."""
+    max_hz: float
+    """Half of the queue read rate (reads per second of read call time).
+
+    Informative only, the queue buffers edges arriving between reads.
+    """
+    overflow: bool
+    """Have edges been dropped (result not reliable)?"""
+
+
+class DutyMeasurement(NamedTuple):
+    """NamedTuple representing a waveform-based duty cycle measurement."""
+
+    duty_cycle: float
+    """Fraction of samples at the high level."""
+    frequency: float
+    """Rising edges per second (NaN if the sample period is unknown)."""
+    sample_count: int
+    sample_period: float
+    """Measured sample period in seconds."""
+    max_hz: float
+    """Highest measurable frequency ('1 / (2 * sample_period)')."""
+
+
+def _count_events(events: "array[int]", previous: int) -> Tuple[int, int, int]:
+    """Count rising edges, falling edges and repeated edges in raw events."""
+    if np is not None:
+        values = np.frombuffer(events, dtype=np.uint32)
+        rising = int(np.count_nonzero(values == GpioTrigger.RISING))
+        repeats = int(np.count_nonzero(values[1:] == values[:-1]))
+    else:
+        rising = events.count(GpioTrigger.RISING)
+        lsb = memoryview(events).cast("B")[_LSB_OFFSET::4].tobytes()
+        repeats = sum(1 for _ in _REPEATS.finditer(lsb))
+
+    falling = len(events) - rising
+    if len(events) > 0 and events[0] == previous:
+        repeats += 1
+    return rising, falling, repeats
+
+
+class FrequencyCounter:
+    """A class measuring the edge rate of a GPIO input using its trigger queue."""
+
+    _gpio: Gpio[Any]
+    _port: PortId
+    _strategy: PollStrategy
+    _armed: bool
+    _previous: int
+    _window_start: float
+
+    def __init__(
+        self,
+        gpio: Gpio[Any],
+        port: PortId,
+        strategy: PollStrategy = PollStrategy(
+            spin_polls=1, initial_interval=0.0005, max_interval=0.005
+        ),
+    ):
+        """Initialize the counter.
+
+        Args:
+            gpio:       Initialized GPIO, 'port' configured as input
+            port:       Measured port
+            strategy:   Queue polling schedule while no edges arrive
+        """
+        self._gpio = gpio
+        self._port = port
+        self._strategy = strategy
+        self._armed = False
+        self._previous = 0
+        self._window_start = 0.0
+
+    def arm(self) -> None:
+        """Enable the edge triggers and discard previously queued events.
+
+        Called by the first measurement automatically.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        self._gpio.set_input_trigger(
+            self._port, GpioTrigger.RISING | GpioTrigger.FALLING
+        )
+        self._gpio.count_triggers(self._port)
+        self._window_start = time.monotonic()
+        self._previous = 0
+        self._armed = True
+
+    def measure(self, window: float = 0.1) -> FrequencyMeasurement:
+        """Count edges during one window.
+
+        Consecutive measurements are contiguous, edges arriving between
+        two windows are counted in the later one.
+
+        Args:
+            window:     Window length in seconds
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            FrequencyMeasurement:   Edge counts and derived frequency
+        """
+        if window <= 0:
+            raise ValueError("window must be a positive number.")
+        if not self._armed:
+            self.arm()
+
+        gpio = self._gpio
+        port = self._port
+        start = self._window_start
+        end = start + window
+        rising = falling = repeats = 0
+        reads = 0
+        read_time = 0.0
+        intervals = self._strategy.intervals()
+
+        while True:
+            before = time.monotonic()
+            events = gpio.read_trigger_array(port)
+            now = time.monotonic()
+            reads += 1
+            read_time += now - before
+
+            if len(events) > 0:
+                counts = _count_events(events, self._previous)
+                rising += counts[0]
+                falling += counts[1]
+                repeats += counts[2]
+                self._previous = events[-1]
+                intervals = self._strategy.intervals()
+
+            if now >= end:
+                break
+            if len(events) == 0:
+                interval = next(intervals)
+                if interval > 0.0:
+                    time.sleep(min(interval, end - now))
+
+        self._window_start = now
+        elapsed = now - start
+        return FrequencyMeasurement(
+            rising / elapsed,
+            rising,
+            falling,
+            elapsed,
+            1.0 / elapsed,
+            (reads / read_time / 2.0) if read_time > 0 else float("inf"),
+            repeats > 0,
+        )
+
+    def measure_windows(
+        self, window: float, window_count: int
+    ) -> List[FrequencyMeasurement]:
+        """Measure several contiguous windows.
+
+        Args:
+            window:         Window length in seconds
+            window_count:   Number of windows
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[FrequencyMeasurement]:     One result per window
+        """
+        return [self.measure(window) for _ in range(window_count)]
+
+    def check(
+        self, expected_hz: float, tolerance: float = 0.01, window: float = 0.1
+    ) -> bool:
+        """Go/no-go check of the signal frequency.
+
+        Fails if the queue overflowed or the expected frequency is below
+        the resolution of the window ('min_hz').
+
+        Args:
+            expected_hz:    Expected frequency
+            tolerance:      Allowed relative deviation (e.g., 0.01 -> 1 %)
+            window:         Measurement window in seconds
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            bool:           Is the measured frequency within the tolerance?
+        """
+        result = self.measure(window)
+        return (
+            not result.overflow
+            and result.min_hz <= expected_hz
+            and abs(result.frequency - expected_hz) <= tolerance * expected_hz
+        )
+
+
+def measure_duty_cycle(
+    gpio: Gpio[Any], port: PortId, sample_count: int = 65_535, timeout: float = 1.0
+) -> DutyMeasurement:
+    """Measure the duty cycle (and frequency) of a signal using the waveform mode.
+
+    Args:
+        gpio:           Initialized GPIO, 'port' configured as input
+        port:           Measured port
+        sample_count:   Number of samples to capture
+        timeout:        Maximum capture time in seconds
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        DutyMeasurement:    Duty cycle and frequency
+    """
+    capture = capture_waveform(gpio, [port], sample_count, timeout=timeout)
+    samples = capture.samples[port]
+    count = capture.sample_count
+    if count == 0:
+        raise RuntimeError("No waveform samples captured!")
+
+    if np is not None and isinstance(samples, np.ndarray):
+        high = int(np.count_nonzero(samples))
+    else:
+        high = memoryview(samples).cast("B").tobytes().count(1)
+
+    rising, _ = find_edges(samples)
+    period = capture.sample_period
+    return DutyMeasurement(
+        high / count,
+        len(rising) / (count * period),
+        count,
+        period,
+        1.0 / (2.0 * period),
+    )
@@ -1,18 +1,68 @@
-from typing import Generic, List
+import time
+from array import array
+from functools import partial
+from typing import Callable, Generic, Iterator, List, NamedTuple, Optional, Tuple
 
 from pyft4222.handle import GenericProtocolHandle, StreamHandleType
-from pyft4222.wrapper import Ft4222Exception, Ft4222Status, GpioTrigger
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.polling import DEFAULT_STRATEGY, PollStrategy
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status, GpioTrigger, WritableBuffer
 from pyft4222.wrapper.gpio import (
     GpioHandle,
     PortId,
     get_trigger_status,
     read,
+    read_all,
     read_trigger_queue,
+    read_trigger_queue_into,
     set_input_trigger,
     set_waveform_mode,
     write,
+    write_mask,
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+_COUNTED_TRIGGERS: Tuple[GpioTrigger, ...] = (
+    GpioTrigger.RISING,
+    GpioTrigger.FALLING,
+    GpioTrigger.LEVEL_HIGH,
+    GpioTrigger.LEVEL_LOW,
+)
+"""Trigger types in the order of the 'TriggerCounts' fields."""
+TRIGGER_QUEUE_DEPTH: int = (2 ** 16) - 1
+"""Largest pending trigger event count reported by the driver (the count saturates)."""
+
+
+class TriggerCounts(NamedTuple):
+    """NamedTuple representing numbers of trigger events per type."""
+
+    rising: int
+    falling: int
+    level_high: int
+    level_low: int
+
+    @property
+    def total(self) -> int:
+        return self.rising + self.falling + self.level_high + self.level_low
+
+
+class InterruptEvent(NamedTuple):
+    """NamedTuple representing a GPIO3 wake-up/interrupt event.
+
+    Events found by the same poll share 'timestamp' and 'latency'.
+    """
+
+    trigger: GpioTrigger
+    timestamp: float
+    """Host 'time.monotonic()' of the poll which found the event."""
+    latency: float
+    """Upper bound of the interrupt-to-return latency of the oldest event
+    found by the poll (seconds)."""
+
 
 class Gpio(
     Generic[StreamHandleType],
@@ -20,6 +70,12 @@ class Gpio(
 ):
     """A class encapsulating GPIO functions."""
 
+    _shadow: int
+    _shadow_valid: int
+    _trigger_buffer: "array[int]"
+    _interrupt_polled_at: Optional[float]
+    _interrupt_latency: Histogram
+
     def __init__(self, ft_handle: GpioHandle, stream_handle: StreamHandleType):
         """Initialize the class with given FT4222 handle and a mode class type.
 
@@ -28,6 +84,11 @@ class Gpio(
             stream_handle:  Calling stream mode handle. Used in 'uninitialize()' method.
         """
         super().__init__(ft_handle, stream_handle)
+        self._shadow = 0
+        self._shadow_valid = 0
+        self._trigger_buffer = array("I")
+        self._interrupt_polled_at = None
+        self._interrupt_latency = Histogram.exponential(0.0001)
 
     def read(self, port_id: PortId) -> bool:
         """Read state of the given GPIO port.
@@ -59,12 +120,111 @@ class Gpio(
             Ft4222Exception:    In case of unexpected error
         """
         if self._handle is not None:
+            bit = 1 << port_id
+            self._shadow_valid &= ~bit
             write(self._handle, port_id, state)
+            self._shadow = (self._shadow | bit) if state else (self._shadow & ~bit)
+            self._shadow_valid |= bit
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
+            )
+
+    def bind_write(self, port_id: PortId, state: bool) -> Callable[[], None]:
+        """Get a precompiled call setting the state of the given GPIO port.
+
+        The handle check and the argument conversions are done once here,
+        the returned call only issues the driver call. Used by timing
+        critical code (e.g., 'pyft4222.sequencer').
+
+        Note:
+            The call must not be used after the GPIO has been uninitialized.
+            The port state is no longer tracked by the 'write_mask()' shadow.
+
+        Args:
+            port_id:    ID of the port to set
+            state:      New port state (True -> '1', False -> '0')
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            Callable[[], None]: Call setting the port state
+        """
+        if self._handle is not None:
+            self._shadow_valid &= ~(1 << port_id)
+            return partial(write, self._handle, port_id, bool(state))
         else:
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
             )
 
+    def read_all(self) -> int:
+        """Read states of all GPIO ports.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:                Bit map of port states (bit n -> 'PortId.PORT_n')
+        """
+        if self._handle is not None:
+            return read_all(self._handle)
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
+            )
+
+    def write_mask(self, mask: int, states: int) -> int:
+        """Set states of the GPIO ports selected by a bit mask.
+
+        The last written state of each port is kept in a shadow register,
+        only ports whose state differs from the shadow are written.
+
+        Args:
+            mask:       Bit map of ports to set (bit n -> 'PortId.PORT_n');
+                        range <0, 15>
+            states:     Bit map of new port states
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:        Bit map of ports actually written
+        """
+        if self._handle is not None:
+            if 0 <= mask < (2 ** len(PortId)):
+                changed = mask & (~self._shadow_valid | (self._shadow ^ states))
+                if changed != 0:
+                    # A failed write leaves the port state unknown
+                    self._shadow_valid &= ~changed
+                    write_mask(self._handle, changed, states)
+                    self._shadow = (self._shadow & ~changed) | (states & changed)
+                    self._shadow_valid |= changed
+                return changed
+            else:
+                raise ValueError("mask must be in range <0, 15>.")
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
+            )
+
+    def get_output_shadow(self) -> int:
+        """Get the last written states of the GPIO ports.
+
+        Returns:
+            int:        Bit map of port states, ports never written read as '0'
+        """
+        return self._shadow
+
+    def invalidate_output_shadow(self) -> None:
+        """Forget the last written states, the next 'write_mask()' writes all ports.
+
+        Call it whenever the outputs may have been changed externally
+        (e.g., by the waveform mode or after a device reset).
+        """
+        self._shadow_valid = 0
+
     def set_input_trigger(self, port_id: PortId, triggers: GpioTrigger) -> None:
         """Set software trigger conditions for the selected GPIO port.
 
@@ -102,13 +262,14 @@ class Gpio(
             )
 
     def read_trigger_queue(
-        self, port_id: PortId, event_read_count: int
+        self, port_id: PortId, event_read_count: Optional[int] = None
     ) -> List[GpioTrigger]:
         """Read events from the trigger event queue.
 
         Args:
             port_id:            GPIO port ID
-            event_read_count:   Number of events to read from queue
+            event_read_count:   Number of events to read from queue,
+                                None reads all currently queued events
 
         Raises:
             Ft4222Exception:    In case of unexpected error
@@ -123,10 +284,88 @@ class Gpio(
                 Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
             )
 
+    def read_trigger_queue_into(self, port_id: PortId, buffer: WritableBuffer) -> int:
+        """Read raw events from the trigger event queue into the given buffer.
+
+        Unlike 'read_trigger_queue()', this method does not allocate any memory.
+        Each event is a 'GpioTrigger' value stored as a 32-bit unsigned integer.
+
+        Args:
+            port_id:            GPIO port ID
+            buffer:             Writable buffer of 32-bit items (e.g., 'array("I")');
+                                size <1, 65_535> items
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:                Number of events read into the buffer
+        """
+        if self._handle is not None:
+            if 0 < (memoryview(buffer).nbytes // 4) < (2 ** 16):
+                return read_trigger_queue_into(self._handle, port_id, buffer)
+            else:
+                raise ValueError("buffer size must be in range <1, 65_535> items.")
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
+            )
+
+    def read_trigger_array(self, port_id: PortId) -> "array[int]":
+        """Read all currently queued events as a compact array.
+
+        The events are read into a buffer reused across calls,
+        sized by the trigger status query. The returned array is a copy
+        of the read events (a single memory copy), so it stays valid
+        after the next read. Use 'read_trigger_queue_into()' with your
+        own buffer to avoid the copy.
+
+        Args:
+            port_id:            GPIO port ID
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            array[int]:         Raw 'GpioTrigger' values ('array("I")')
+        """
+        # Read first, the buffer may be reallocated by the read
+        event_count = self._read_pending(port_id)
+        return self._trigger_buffer[:event_count]
+
+    def count_triggers(self, port_id: PortId) -> TriggerCounts:
+        """Read all currently queued events and count them per trigger type.
+
+        Args:
+            port_id:            GPIO port ID
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            TriggerCounts:      Number of read events of each type
+        """
+        event_count = self._read_pending(port_id)
+        if np is not None:
+            values = np.frombuffer(self._trigger_buffer, np.uint32, event_count)
+            return TriggerCounts(
+                *(int(np.count_nonzero(values == t)) for t in _COUNTED_TRIGGERS)
+            )
+
+        events = self._trigger_buffer[:event_count]
+        return TriggerCounts(*(events.count(t) for t in _COUNTED_TRIGGERS))
+
     def set_waveform_mode(self, enable: bool) -> None:
         """Enable or disable the waveform mode.
 
-        TODO: Add description
+        In waveform mode, the device periodically records the level of each
+        input port with a level trigger enabled (see 'set_input_trigger()')
+        into the trigger event queue, one 'GpioTrigger.LEVEL_HIGH' or
+        'GpioTrigger.LEVEL_LOW' event per sample. The sampling period
+        depends on the system clock (see 'pyft4222.waveform').
+
+        Note:
+            The waveform mode is disabled by default.
 
         Args:
             enable:             Enable waveform mode?
@@ -140,3 +379,127 @@ class Gpio(
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
             )
+
+    def wait_interrupt(
+        self,
+        timeout: Optional[float] = None,
+        strategy: PollStrategy = DEFAULT_STRATEGY,
+    ) -> List[InterruptEvent]:
+        """Wait for interrupts on the GPIO3 wake-up/interrupt pin.
+
+        The interrupt is reported through the trigger event queue of
+        'PortId.PORT_3' (see 'set_wakeup_interrupt()' and 'set_interrupt_trigger()'),
+        which is polled adaptively: one driver call per poll, back-to-back
+        polls first, then exponentially growing sleeps.
+
+        The interrupt time is unknown, only the poll which found it is.
+        All events returned by one call share the timestamp and the latency,
+        the time from the previous poll (or the previous return) to the return.
+        It bounds the oldest event of the batch, later events waited less.
+        One latency per call is recorded, see 'get_interrupt_latency()'.
+
+        Args:
+            timeout:    Maximum wait in seconds, None waits forever
+            strategy:   Polling schedule
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[InterruptEvent]:   Interrupts queued since the previous call,
+                                    empty on timeout
+        """
+        if self._handle is not None:
+            handle = self._handle
+            start = time.monotonic()
+            deadline = (start + timeout) if timeout is not None else None
+            previous = (
+                self._interrupt_polled_at
+                if self._interrupt_polled_at is not None
+                else start
+            )
+            intervals = strategy.intervals()
+
+            while True:
+                pending = get_trigger_status(handle, PortId.PORT_3)
+                now = time.monotonic()
+                if pending > 0:
+                    break
+                if deadline is not None and now >= deadline:
+                    self._interrupt_polled_at = now
+                    return []
+
+                previous = now
+                interval = next(intervals)
+                if interval > 0.0:
+                    if deadline is not None:
+                        interval = min(interval, deadline - now)
+                    time.sleep(interval)
+
+            if len(self._trigger_buffer) < pending:
+                self._trigger_buffer = array("I", bytes(4 * pending))
+            event_count = read_trigger_queue_into(
+                handle, PortId.PORT_3, memoryview(self._trigger_buffer)[:pending]
+            )
+            returned_at = time.monotonic()
+            self._interrupt_polled_at = returned_at
+            latency = returned_at - previous
+            self._interrupt_latency.record(latency)
+
+            return [
+                InterruptEvent(GpioTrigger(value), now, latency)
+                for value in self._trigger_buffer[:event_count]
+            ]
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "GPIO has been uninitialized!"
+            )
+
+    def interrupts(
+        self,
+        timeout: Optional[float] = None,
+        strategy: PollStrategy = DEFAULT_STRATEGY,
+    ) -> Iterator[InterruptEvent]:
+        """Iterate over interrupts on the GPIO3 wake-up/interrupt pin.
+
+        See 'wait_interrupt()', events found by the same poll share
+        the timestamp and the latency.
+
+        Args:
+            timeout:    Maximum wait for the next interrupt in seconds,
+                        the iteration ends when it expires; None waits forever
+            strategy:   Polling schedule
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Yields:
+            InterruptEvent:     Interrupt events in the order of occurrence
+        """
+        while True:
+            events = self.wait_interrupt(timeout, strategy)
+            if not events:
+                return
+            yield from events
+
+    def get_interrupt_latency(self) -> HistogramSnapshot:
+        """Get the recorded interrupt-to-return latencies (upper bounds).
+
+        A latency is recorded per 'wait_interrupt()' call returning events,
+        not per event, the events of a batch are not timed individually.
+
+        Returns:
+            HistogramSnapshot:  Latencies in seconds, one per returned batch
+        """
+        return self._interrupt_latency.snapshot()
+
+    def _read_pending(self, port_id: PortId) -> int:
+        pending = self.get_queued_trigger_event_count(port_id)
+        if pending == 0:
+            return 0
+
+        if len(self._trigger_buffer) < pending:
+            self._trigger_buffer = array("I", bytes(4 * pending))
+        return self.read_trigger_queue_into(
+            port_id, memoryview(self._trigger_buffer)[:pending]
+        )
@@ -16,6 +16,7 @@ from pyft4222.wrapper.common import (
     SwChipVersion,
     chip_reset,
     get_clock,
+    get_max_transfer_size,
     get_version,
     set_clock,
     set_interrupt_trigger,
@@ -331,6 +332,24 @@ class GenericProtocolHandle(
         """
         self.uninitialize().close()
 
+    def get_max_transfer_size(self) -> int:
+        """Get the maximum packet size of a single transfer.
+
+        It depends on the bus speed, the chip mode and the used function.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:                Maximum packet size in bytes
+        """
+        if self._handle is not None:
+            return get_max_transfer_size(self._handle)
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "This handle is uninitialized!"
+            )
+
     def uninitialize(self) -> StreamHandleType:
         """Un-initialize the owned handle from the current stream mode.
 
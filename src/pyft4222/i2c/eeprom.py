@@ -0,0 +1,265 @@
+"""Module implementing a driver of 24Cxx-compatible I2C EEPROMs.
+
+Writes are split at page boundaries. The end of each internal write cycle
+is detected by acknowledge polling, instead of sleeping for the worst-case
+write cycle time given in the datasheet.
+"""
+
+import time
+from typing import Any, Iterator, NamedTuple, Tuple
+
+from pyft4222.i2c.master import I2CMaster, ScanMethod
+from pyft4222.wrapper import WritableBuffer
+from pyft4222.wrapper.i2c.master import TransactionFlag
+
+
+class EepromVerifyError(Exception):
+    """An exception raised when read-back data differ from the written data."""
+
+    address: int
+    """Memory address of the first differing byte."""
+
+    def __init__(self, address: int):
+        super().__init__(f"EEPROM verification failed at address {address:#06x}!")
+        self.address = address
+
+
+class EepromStats(NamedTuple):
+    """NamedTuple representing EEPROM transfer statistics."""
+
+    bytes_written: int
+    write_seconds: float
+    """Time spent writing, including the write cycles."""
+    pages_written: int
+    ack_polls: int
+    """Number of acknowledge polls issued while waiting for write cycles."""
+    bytes_read: int
+    read_seconds: float
+
+    @property
+    def write_rate(self) -> float:
+        """Achieved write speed in bytes per second."""
+        return (self.bytes_written / self.write_seconds) if self.write_seconds else 0.0
+
+    @property
+    def read_rate(self) -> float:
+        """Achieved read speed in bytes per second."""
+        return (self.bytes_read / self.read_seconds) if self.read_seconds else 0.0
+
+
+class Eeprom:
+    """A class encapsulating 24Cxx EEPROM access.
+
+    Devices with a 1-byte memory address larger than 256 bytes (24C04 - 24C16)
+    use the lowest bits of the slave address as a block select,
+    this is handled transparently.
+
+    Example (24C256):
+        eeprom = Eeprom(i2c_master, size=32_768, page_size=64, address_width=2)
+    """
+
+    _i2c_master: I2CMaster[Any]
+    _dev_address: int
+    _size: int
+    _page_size: int
+    _address_width: int
+    _write_timeout: float
+
+    _bytes_written: int
+    _write_seconds: float
+    _pages_written: int
+    _ack_polls: int
+    _bytes_read: int
+    _read_seconds: float
+
+    def __init__(
+        self,
+        i2c_master: I2CMaster[Any],
+        dev_address: int = 0x50,
+        size: int = 256,
+        page_size: int = 8,
+        address_width: int = 1,
+        write_timeout: float = 0.05,
+    ):
+        """Initialize the driver.
+
+        Args:
+            i2c_master:     Initialized I2C Master
+            dev_address:    Base 7-bit slave address;   range <0, 127>
+            size:           Memory size in bytes
+            page_size:      Write page size in bytes (power of two)
+            address_width:  Memory address size in bytes;   1 or 2
+            write_timeout:  Maximum write cycle duration in seconds
+        """
+        if not (0 <= dev_address < (2 ** 7)):
+            raise ValueError("dev_address must be in range <0, 127>.")
+        if address_width not in (1, 2):
+            raise ValueError("address_width must be either 1 or 2.")
+        if page_size <= 0 or (page_size & (page_size - 1)) != 0:
+            raise ValueError("page_size must be a power of two.")
+        block_count = -(-size // (2 ** (8 * address_width)))
+        if size <= 0 or block_count > 8 or (dev_address & (block_count - 1)) != 0:
+            raise ValueError("size is not addressable with the given address_width.")
+
+        self._i2c_master = i2c_master
+        self._dev_address = dev_address
+        self._size = size
+        self._page_size = page_size
+        self._address_width = address_width
+        self._write_timeout = write_timeout
+        self.reset_stats()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def page_size(self) -> int:
+        return self._page_size
+
+    def read(self, address: int, length: int) -> bytes:
+        """Read data using sequential reads.
+
+        Args:
+            address:    Memory address of the first byte
+            length:     Number of bytes to read
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            bytes:      Read data
+        """
+        buffer = bytearray(length)
+        self.readinto(address, buffer)
+        return bytes(buffer)
+
+    def readinto(self, address: int, buffer: WritableBuffer) -> None:
+        """Read data into the given buffer using sequential reads.
+
+        Args:
+            address:    Memory address of the first byte
+            buffer:     Buffer to fill, its size is the number of bytes to read
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        view = memoryview(buffer).cast("B")
+        self._check_range(address, len(view))
+
+        start = time.perf_counter()
+        offset = 0
+        # Sequential reads do not cross the block select boundaries
+        block_size = 2 ** (8 * self._address_width)
+        for dev_address, header, chunk_len in self._split(
+            address, len(view), block_size
+        ):
+            self._i2c_master.write_ex(dev_address, TransactionFlag.START, header)
+            self._i2c_master.read_chunked_into(
+                dev_address,
+                view[offset : offset + chunk_len],
+                TransactionFlag.REPEATED_START,
+            )
+            offset += chunk_len
+
+        self._read_seconds += time.perf_counter() - start
+        self._bytes_read += len(view)
+
+    def write(self, address: int, data: bytes, verify: bool = False) -> None:
+        """Write data, page by page, waiting for each write cycle to finish.
+
+        Args:
+            address:    Memory address of the first byte
+            data:       Data to write
+            verify:     Read the data back and compare them?
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+            TimeoutError:       The EEPROM has not finished a write cycle in time
+            EepromVerifyError:  Read-back data differ from the written data
+        """
+        view = memoryview(data).cast("B")
+        self._check_range(address, len(view))
+
+        start = time.perf_counter()
+        offset = 0
+        for dev_address, header, chunk_len in self._split(
+            address, len(view), self._page_size
+        ):
+            self._i2c_master.write(
+                dev_address, header + bytes(view[offset : offset + chunk_len])
+            )
+            self._wait_write_cycle(dev_address)
+            self._pages_written += 1
+            offset += chunk_len
+
+        self._write_seconds += time.perf_counter() - start
+        self._bytes_written += len(view)
+
+        if verify and len(view) > 0:
+            read_back = self.read(address, len(view))
+            if read_back != view:
+                mismatch = next(
+                    idx for idx in range(len(view)) if read_back[idx] != view[idx]
+                )
+                raise EepromVerifyError(address + mismatch)
+
+    def get_stats(self) -> EepromStats:
+        """Get transfer statistics accumulated since the last reset.
+
+        Returns:
+            EepromStats:    Transfer statistics
+        """
+        return EepromStats(
+            self._bytes_written,
+            self._write_seconds,
+            self._pages_written,
+            self._ack_polls,
+            self._bytes_read,
+            self._read_seconds,
+        )
+
+    def reset_stats(self) -> None:
+        """Reset transfer statistics."""
+        self._bytes_written = 0
+        self._write_seconds = 0.0
+        self._pages_written = 0
+        self._ack_polls = 0
+        self._bytes_read = 0
+        self._read_seconds = 0.0
+
+    def _check_range(self, address: int, length: int) -> None:
+        if not (0 <= address and address + length <= self._size):
+            raise ValueError(f"Memory range must be within <0, {self._size - 1}>.")
+
+    def _split(
+        self, address: int, length: int, boundary: int
+    ) -> Iterator[Tuple[int, bytes, int]]:
+        """Split a memory range at 'boundary' multiples.
+
+        Yields:
+            (slave address, memory address bytes, chunk length) tuples
+        """
+        end = address + length
+        while address < end:
+            chunk_len = min(boundary - (address % boundary), end - address)
+            block = address >> (8 * self._address_width)
+            header = (address & ((2 ** (8 * self._address_width)) - 1)).to_bytes(
+                self._address_width, "big"
+            )
+            yield self._dev_address | block, header, chunk_len
+            address += chunk_len
+
+    def _wait_write_cycle(self, dev_address: int) -> None:
+        # A read probe sends nothing to the EEPROM (a write probe would
+        # set its address pointer), the controller is reset only on timeout
+        deadline = time.perf_counter() + self._write_timeout
+        while True:
+            self._ack_polls += 1
+            if self._i2c_master.probe(
+                dev_address, ScanMethod.READ, reset_on_failure=False
+            ):
+                return
+            if time.perf_counter() >= deadline:
+                self._i2c_master.reset()
+                raise TimeoutError("EEPROM write cycle has not finished in time!")
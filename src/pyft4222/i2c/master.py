@@ -1,20 +1,144 @@
-from typing import Generic
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, auto
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from koda import Ok
 
 from pyft4222.handle import GenericProtocolHandle, StreamHandleType
-from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.i2c.recovery import BusRecovery, RecoveryPolicy, RecoveryStats
+from pyft4222.polling import DEFAULT_STRATEGY, PollStrategy, poll_until
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status, WritableBuffer
 from pyft4222.wrapper.i2c.master import (
     CtrlStatus,
     I2cMasterHandle,
     TransactionFlag,
     get_status,
+    get_status_byte,
     read,
     read_ex,
+    read_ex_into,
     reset,
     reset_bus,
+    try_get_status,
+    try_read_ex_into,
+    try_write_ex,
     write,
     write_ex,
 )
 
+_DEFAULT_SCAN_RANGE: range = range(0x08, 0x78)
+"""7-bit addresses not reserved by the I2C specification."""
+_READ_PROBE_RANGES: Tuple[range, ...] = (range(0x30, 0x38), range(0x50, 0x60))
+"""Addresses probed by reading in 'AUTO' mode (EEPROMs, write-only devices)."""
+_MAX_CHUNK_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes transferred by a single driver call."""
+_FIRST_CHUNK_FLAGS: Tuple[TransactionFlag, ...] = (
+    TransactionFlag.START,
+    TransactionFlag.REPEATED_START,
+    TransactionFlag.NONE,
+)
+"""Conditions allowed on the first chunk of a chunked transfer."""
+_STATUS_POLL_TIMEOUT: float = 0.01
+"""Maximum time (in seconds) to wait for the controller to become ready."""
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ResultType = TypeVar("ResultType")
+
+RegisterAddress = Union[int, bytes]
+"""Register address, either a single byte or a multi-byte big-endian sequence."""
+RegisterRead = Tuple[int, RegisterAddress, int]
+"""Register read request: (dev_address, register, read_byte_count)."""
+RegisterWrite = Tuple[int, RegisterAddress, bytes]
+"""Register write request: (dev_address, register, write_data)."""
+
+
+class ScanMethod(Enum):
+    """Enum representing the I2C bus scan probe types."""
+
+    AUTO = auto()
+    """Read probe for EEPROM-like address ranges, write probe elsewhere.
+
+    Warning:
+        Has the side effects of 'WRITE' outside of the EEPROM ranges.
+    """
+    WRITE = auto()
+    """Write a single zero byte.
+
+    Warning:
+        The driver rejects zero-length writes, an address-only probe is not
+        possible. Every acknowledging device receives the 0x00 byte, which
+        sets the register pointer of most devices and writes a register
+        of some (e.g., command-only devices).
+    """
+    READ = auto()
+    """Read a single byte (may confuse write-only devices)."""
+
+
+class RegisterReadResult(NamedTuple):
+    """NamedTuple representing the result of a batched register read."""
+
+    data: List[memoryview]
+    """Read data per request, empty for failed requests.
+
+    The views share one buffer. With 'reuse_buffer' enabled, the buffer
+    is overwritten by the next batch, copy the data (e.g., 'bytes(view)')
+    to keep them longer.
+    """
+    failed: List[int]
+    """Indices of the requests which were not acknowledged or failed."""
+
+
+class WaitResult(NamedTuple):
+    """NamedTuple representing the outcome of a controller status wait."""
+
+    ok: bool
+    """Has the awaited state been reached before the timeout?"""
+    status: CtrlStatus
+    """Last polled controller status."""
+    polls: int
+    """Number of status polls (USB round-trips) issued."""
+    elapsed: float
+    """Time spent waiting in seconds."""
+
+
+_BUSY: int = int(CtrlStatus.CONTROLLER_BUSY)
+_BUSY_OR_BUS_BUSY: int = int(CtrlStatus.CONTROLLER_BUSY | CtrlStatus.BUS_BUSY)
+
+
+def _check_first_flag(first_flag: TransactionFlag) -> None:
+    # A STOP in the first chunk would end the transaction early
+    if first_flag not in _FIRST_CHUNK_FLAGS:
+        raise ValueError("first_flag must be START, REPEATED_START or NONE.")
+
+
+def _register_bytes(register: RegisterAddress) -> bytes:
+    if isinstance(register, int):
+        if not (0 <= register < (2 ** 8)):
+            raise ValueError("register must be in range <0, 255>.")
+        return bytes((register,))
+
+    if not (0 < len(register) < (2 ** 16)):
+        raise ValueError("register length must be in range <1, 65_535>.")
+    return bytes(register)
+
 
 class I2CMaster(
     Generic[StreamHandleType],
@@ -22,6 +146,11 @@ class I2CMaster(
 ):
     """A class encapsulating I2C Master functions."""
 
+    _arena: bytearray
+    _probe_buffer: bytearray
+    _chunk_size: Optional[int]
+    _recovery: Optional[BusRecovery]
+
     def __init__(self, ft_handle: I2cMasterHandle, mode_handle: StreamHandleType):
         """Initialize the class with given FT4222 handle and a mode class type.
 
@@ -30,6 +159,10 @@ class I2CMaster(
             mode_handle:    Calling stream mode handle. Used in 'uninitialize()' method.
         """
         super().__init__(ft_handle, mode_handle)
+        self._arena = bytearray()
+        self._probe_buffer = bytearray(1)
+        self._chunk_size = None
+        self._recovery = None
 
     def read(self, dev_address: int, read_byte_count: int) -> bytes:
         """Read data from specified I2C slave with START and STOP conditions.
@@ -50,7 +183,12 @@ class I2CMaster(
             if not (0 < read_byte_count < (2 ** 16)):
                 raise ValueError("read_byte_count must be in range <1, 65_535>.")
 
-            return read(self._handle, dev_address, read_byte_count)
+            handle = self._handle
+            if self._recovery is not None:
+                return self._recovery.run(
+                    self, lambda: read(handle, dev_address, read_byte_count), True
+                )
+            return read(handle, dev_address, read_byte_count)
         else:
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
@@ -75,7 +213,14 @@ class I2CMaster(
             if not (0 < len(write_data) < (2 ** 16)):
                 raise ValueError("write_data length must be in range <1, 65_535>.")
 
-            return write(self._handle, dev_address, write_data)
+            handle = self._handle
+            if self._recovery is not None:
+                return self._recovery.run(
+                    self,
+                    lambda: write(handle, dev_address, write_data),
+                    self._recovery.policy.retry_writes,
+                )
+            return write(handle, dev_address, write_data)
         else:
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
@@ -137,6 +282,472 @@ class I2CMaster(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
             )
 
+    def scan(
+        self,
+        addresses: Iterable[int] = _DEFAULT_SCAN_RANGE,
+        method: ScanMethod = ScanMethod.READ,
+    ) -> Set[int]:
+        """Find I2C slaves acknowledging their address.
+
+        Each address is probed by a minimal transaction. The controller status
+        is checked for 'SLAVE_ADDR_NACK' directly, no exceptions are raised
+        for absent devices. The controller is reset after failed probes.
+
+        Args:
+            addresses:      7-bit addresses to probe;   range <0, 127>
+            method:         Probe transaction type
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            Set[int]:       Addresses of the responding slaves
+        """
+        if self._handle is not None:
+            address_list = list(addresses)
+            if not all(0 <= address < (2 ** 7) for address in address_list):
+                raise ValueError("addresses must be in range <0, 127>.")
+
+            found: Set[int] = set()
+            for address in address_list:
+                if self._probe(address, method):
+                    found.add(address)
+
+            return found
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def probe(
+        self,
+        dev_address: int,
+        method: ScanMethod = ScanMethod.READ,
+        reset_on_failure: bool = True,
+    ) -> bool:
+        """Check whether an I2C slave acknowledges its address.
+
+        Uses the same minimal transaction as 'scan()', suitable for
+        acknowledge polling (e.g., waiting for an EEPROM write cycle).
+
+        Args:
+            dev_address:        7-bit address to probe;     range <0, 127>
+            method:             Probe transaction type
+            reset_on_failure:   Reset the controller after a failed probe?
+                                Disable for repeated polling and reset once
+                                when giving up.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            bool:           Has the slave acknowledged its address?
+        """
+        if self._handle is not None:
+            if not (0 <= dev_address < (2 ** 7)):
+                raise ValueError("dev_address must be in range <0, 127>.")
+
+            return self._probe(dev_address, method, reset_on_failure)
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def _probe(
+        self, address: int, method: ScanMethod, reset_on_failure: bool = True
+    ) -> bool:
+        assert self._handle is not None
+
+        if method == ScanMethod.READ or (
+            method == ScanMethod.AUTO and any(address in r for r in _READ_PROBE_RANGES)
+        ):
+            result = try_read_ex_into(
+                self._handle,
+                address,
+                TransactionFlag.START_AND_STOP,
+                self._probe_buffer,
+            )
+        else:
+            result = try_write_ex(
+                self._handle, address, TransactionFlag.START_AND_STOP, b"\x00"
+            )
+
+        status = self._wait_ready()
+        if status is None or not isinstance(result, Ok):
+            if reset_on_failure:
+                reset(self._handle)
+            return False
+
+        return not (status & (CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.ARBITRATION_LOST))
+
+    def read_chunked_into(
+        self,
+        dev_address: int,
+        buffer: WritableBuffer,
+        first_flag: TransactionFlag = TransactionFlag.START,
+        stop: bool = True,
+    ) -> int:
+        """Read any amount of data from the specified I2C slave into a buffer.
+
+        The read is split into chunks forming a single I2C transaction,
+        'first_flag' is signaled on the first chunk, no condition on
+        the middle chunks and STOP on the last one.
+
+        A chunk transferring less data than requested ends the transaction,
+        the controller is reset (releasing the bus) and an exception is raised.
+
+        Args:
+            dev_address:    I2C slave address;      range <0, 65_535>
+            buffer:         Writable buffer, its size is the number of bytes to read
+            first_flag:     Condition of the first chunk (START, REPEATED_START,
+                            or NONE to continue a previous transfer)
+            stop:           Signal STOP after the last chunk?
+
+        Raises:
+            Ft4222Exception:    Short chunk read, or unexpected error
+
+        Returns:
+            int:            Number of bytes read
+        """
+        if self._handle is not None:
+            if not (0 <= dev_address < (2 ** 16)):
+                raise ValueError("dev_address must be in range <0, 65_535>.")
+            view = memoryview(buffer).cast("B")
+            if len(view) == 0:
+                raise ValueError("buffer must not be empty.")
+            _check_first_flag(first_flag)
+
+            total = 0
+            for offset, end, flag in self._chunks(len(view), first_flag, stop):
+                count = read_ex_into(self._handle, dev_address, flag, view[offset:end])
+                total += count
+                if count != end - offset:
+                    self._abort_chunked(total, len(view))
+
+            return total
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def read_chunked(
+        self,
+        dev_address: int,
+        read_byte_count: int,
+        first_flag: TransactionFlag = TransactionFlag.START,
+        stop: bool = True,
+    ) -> bytes:
+        """Read any amount of data from the specified I2C slave.
+
+        See 'read_chunked_into()' for the used bus conditions.
+
+        Args:
+            dev_address:        I2C slave address;      range <0, 65_535>
+            read_byte_count:    Positive number of bytes to read
+            first_flag:         Condition of the first chunk
+            stop:               Signal STOP after the last chunk?
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            bytes:              Read data
+        """
+        if read_byte_count <= 0:
+            raise ValueError("read_byte_count must be a positive number.")
+
+        buffer = bytearray(read_byte_count)
+        count = self.read_chunked_into(dev_address, buffer, first_flag, stop)
+        return bytes(memoryview(buffer)[:count])
+
+    def write_chunked(
+        self,
+        dev_address: int,
+        write_data: bytes,
+        first_flag: TransactionFlag = TransactionFlag.START,
+        stop: bool = True,
+    ) -> int:
+        """Write any amount of data to the specified I2C slave.
+
+        The write is split into chunks forming a single I2C transaction,
+        'first_flag' is signaled on the first chunk, no condition on
+        the middle chunks and STOP on the last one.
+
+        A chunk transferring less data than requested ends the transaction,
+        the controller is reset (releasing the bus) and an exception is raised.
+
+        Args:
+            dev_address:    I2C slave address;      range <0, 65_535>
+            write_data:     Non-empty bytes-like object to write
+            first_flag:     Condition of the first chunk (START, REPEATED_START,
+                            or NONE to continue a previous transfer)
+            stop:           Signal STOP after the last chunk?
+
+        Raises:
+            Ft4222Exception:    Short chunk written, or unexpected error
+
+        Returns:
+            int:            Number of bytes written
+        """
+        if self._handle is not None:
+            if not (0 <= dev_address < (2 ** 16)):
+                raise ValueError("dev_address must be in range <0, 65_535>.")
+            view = memoryview(write_data).cast("B")
+            if len(view) == 0:
+                raise ValueError("write_data must not be empty.")
+            _check_first_flag(first_flag)
+
+            total = 0
+            for offset, end, flag in self._chunks(len(view), first_flag, stop):
+                # The driver binding accepts 'bytes' only
+                count = write_ex(
+                    self._handle, dev_address, flag, bytes(view[offset:end])
+                )
+                total += count
+                if count != end - offset:
+                    self._abort_chunked(total, len(view))
+
+            return total
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def _abort_chunked(self, transferred: int, size: int) -> NoReturn:
+        assert self._handle is not None
+
+        # The chunk carrying STOP may not have been issued, release the bus
+        reset(self._handle)
+        raise Ft4222Exception(
+            Ft4222Status.IO_ERROR,
+            f"I2C chunked transfer ended after {transferred} of {size} bytes!",
+        )
+
+    def _chunks(
+        self, size: int, first_flag: TransactionFlag, stop: bool
+    ) -> Iterator[Tuple[int, int, TransactionFlag]]:
+        assert self._handle is not None
+
+        if self._chunk_size is None:
+            # Whole USB packets per chunk, within the driver limit
+            packet_size = max(self.get_max_transfer_size(), 1)
+            self._chunk_size = (_MAX_CHUNK_SIZE // packet_size) * packet_size
+        chunk_size = self._chunk_size
+
+        start_bits = 0 if first_flag == TransactionFlag.NONE else first_flag
+        for offset in range(0, size, chunk_size):
+            end = min(offset + chunk_size, size)
+            bits = start_bits if offset == 0 else 0
+            if stop and end == size:
+                bits |= TransactionFlag.STOP
+            yield offset, end, TransactionFlag(bits) if bits else TransactionFlag.NONE
+
+    def read_registers(
+        self,
+        requests: Sequence[RegisterRead],
+        verify_ack: bool = True,
+        reuse_buffer: bool = False,
+    ) -> RegisterReadResult:
+        """Read registers of one or more I2C slaves in a single batch.
+
+        Each register is read by writing its address with a START condition
+        followed by a read with REPEATED START and STOP conditions.
+        The whole batch is validated before the first transaction, a failed
+        request does not abort the rest of the batch.
+
+        Args:
+            requests:       (dev_address, register, read_byte_count) tuples
+                            dev_address;        range <0, 65_535>
+                            register;           int <0, 255> or non-empty bytes
+                            read_byte_count;    range <1, 65_535>
+            verify_ack:     Check the controller status after each register
+                            address write (detects NACKed slave addresses)
+            reuse_buffer:   Read into a buffer owned by the I2C Master and
+                            reused by every batch (no allocation per batch)?
+                            The returned views are only valid until the next
+                            'read_registers()' call.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            RegisterReadResult: Read data and indices of failed requests
+        """
+        if self._handle is not None:
+            prepared: List[Tuple[int, bytes, int, int]] = []
+            offset = 0
+            for dev_address, register, read_byte_count in requests:
+                if not (0 <= dev_address < (2 ** 16)):
+                    raise ValueError("dev_address must be in range <0, 65_535>.")
+                if not (0 < read_byte_count < (2 ** 16)):
+                    raise ValueError("read_byte_count must be in range <1, 65_535>.")
+                prepared.append(
+                    (dev_address, _register_bytes(register), offset, read_byte_count)
+                )
+                offset += read_byte_count
+
+            if not reuse_buffer:
+                arena = memoryview(bytearray(offset))
+            else:
+                if len(self._arena) < offset:
+                    # Never resize, views of the previous batch may still exist
+                    self._arena = bytearray(offset)
+                arena = memoryview(self._arena)
+
+            data: List[memoryview] = []
+            failed: List[int] = []
+            read_flags = TransactionFlag.REPEATED_START | TransactionFlag.STOP
+
+            for idx, (dev_address, register, offset, count) in enumerate(prepared):
+                view = arena[offset : offset + count]
+                ok = isinstance(
+                    try_write_ex(
+                        self._handle, dev_address, TransactionFlag.START, register
+                    ),
+                    Ok,
+                )
+                if ok and verify_ack:
+                    status = self._wait_ready()
+                    ok = status is not None and not (
+                        status & (CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.DATA_NACK)
+                    )
+                if ok:
+                    result = try_read_ex_into(
+                        self._handle, dev_address, read_flags, view
+                    )
+                    ok = isinstance(result, Ok) and result.val == count
+
+                if ok:
+                    data.append(view)
+                else:
+                    reset(self._handle)
+                    data.append(view[:0])
+                    failed.append(idx)
+
+            return RegisterReadResult(data, failed)
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def write_registers(
+        self, requests: Sequence[RegisterWrite], verify_ack: bool = True
+    ) -> List[int]:
+        """Write registers of one or more I2C slaves in a single batch.
+
+        Each register is written by a single transaction with START and STOP
+        conditions, containing the register address followed by the data.
+        The whole batch is validated before the first transaction, a failed
+        request does not abort the rest of the batch.
+
+        Args:
+            requests:       (dev_address, register, write_data) tuples
+                            dev_address;        range <0, 65_535>
+                            register;           int <0, 255> or non-empty bytes
+                            write_data;         may be empty
+            verify_ack:     Check the controller status after each write
+                            (detects NACKed slave addresses and data)
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[int]:      Indices of the requests which were not acknowledged
+                            or failed
+        """
+        if self._handle is not None:
+            prepared: List[Tuple[int, bytes]] = []
+            for dev_address, register, write_data in requests:
+                if not (0 <= dev_address < (2 ** 16)):
+                    raise ValueError("dev_address must be in range <0, 65_535>.")
+                payload = _register_bytes(register) + write_data
+                if not (len(payload) < (2 ** 16)):
+                    raise ValueError(
+                        "register and write_data length must be less than 65_536."
+                    )
+                prepared.append((dev_address, payload))
+
+            failed: List[int] = []
+            for idx, (dev_address, payload) in enumerate(prepared):
+                result = try_write_ex(
+                    self._handle, dev_address, TransactionFlag.START_AND_STOP, payload
+                )
+                ok = isinstance(result, Ok) and result.val == len(payload)
+                if ok and verify_ack:
+                    status = self._wait_ready()
+                    ok = status is not None and not (
+                        status & (CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.DATA_NACK)
+                    )
+
+                if not ok:
+                    reset(self._handle)
+                    failed.append(idx)
+
+            return failed
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
+    def _wait_ready(self) -> Optional[CtrlStatus]:
+        assert self._handle is not None
+        handle = self._handle
+
+        def read_status() -> int:
+            # A failed driver call ends the wait as well (negative value)
+            status = try_get_status(handle)
+            return int(status.val) if isinstance(status, Ok) else -1
+
+        result = poll_until(
+            read_status,
+            lambda status: status < 0 or (status & _BUSY) == 0,
+            _STATUS_POLL_TIMEOUT,
+        )
+        if not result.ok or result.value < 0:
+            return None
+        return CtrlStatus(result.value)
+
+    def set_recovery_policy(self, policy: Optional[RecoveryPolicy]) -> None:
+        """Attach or detach an automatic error recovery policy.
+
+        With a policy attached, 'read()' and 'write()' (and transactions
+        run by 'run_with_recovery()') are checked for failures,
+        the controller or the bus is reset and the transaction is retried
+        according to the policy. Recovery counters restart from zero.
+
+        Args:
+            policy:     Recovery policy, or None to disable the recovery
+        """
+        self._recovery = BusRecovery(policy) if policy is not None else None
+
+    def get_recovery_stats(self) -> Optional[RecoveryStats]:
+        """Get the recovery counters of the attached policy.
+
+        Returns:
+            Optional[RecoveryStats]:    Counters, None if no policy is attached
+        """
+        return self._recovery.get_stats() if self._recovery is not None else None
+
+    def run_with_recovery(
+        self, transaction: Callable[[], ResultType], idempotent: bool = True
+    ) -> ResultType:
+        """Run a custom transaction under the attached recovery policy.
+
+        Args:
+            transaction:    Complete transaction ending with a STOP condition
+                            (e.g., a 'write_ex()' and 'read_ex()' sequence)
+            idempotent:     Can the transaction be repeated safely?
+
+        Raises:
+            Ft4222Exception:    Transaction failed even after retries
+
+        Returns:
+            ResultType:     Result of the transaction
+        """
+        if self._recovery is not None:
+            return self._recovery.run(self, transaction, idempotent)
+        return transaction()
+
     def get_status(self) -> CtrlStatus:
         """Get I2C Master controller status.
 
@@ -153,6 +764,69 @@ class I2CMaster(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
             )
 
+    def wait_idle(
+        self,
+        timeout: Optional[float] = 0.1,
+        strategy: PollStrategy = DEFAULT_STRATEGY,
+    ) -> WaitResult:
+        """Wait until the controller finishes the current operation.
+
+        The raw status byte is polled with adaptive intervals,
+        no exception is raised on timeout.
+
+        Args:
+            timeout:        Maximum wait in seconds, None waits forever
+            strategy:       Polling schedule
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            WaitResult:     Outcome, last status and polling statistics
+        """
+        return self._wait_status(_BUSY, timeout, strategy)
+
+    def wait_bus_free(
+        self,
+        timeout: Optional[float] = 0.1,
+        strategy: PollStrategy = DEFAULT_STRATEGY,
+    ) -> WaitResult:
+        """Wait until the controller is idle and the bus is released.
+
+        The bus stays busy after a transfer without a STOP condition,
+        or while another master (or a stuck slave) holds it.
+
+        Args:
+            timeout:        Maximum wait in seconds, None waits forever
+            strategy:       Polling schedule
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            WaitResult:     Outcome, last status and polling statistics
+        """
+        return self._wait_status(_BUSY_OR_BUS_BUSY, timeout, strategy)
+
+    def _wait_status(
+        self, busy_mask: int, timeout: Optional[float], strategy: PollStrategy
+    ) -> WaitResult:
+        if self._handle is not None:
+            handle = self._handle
+            result = poll_until(
+                lambda: get_status_byte(handle),
+                lambda status: (status & busy_mask) == 0,
+                timeout,
+                strategy,
+            )
+            return WaitResult(
+                result.ok, CtrlStatus(result.value), result.polls, result.elapsed
+            )
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
+            )
+
     def reset(self) -> None:
         """Reset the I2C Master.
 
@@ -189,3 +863,38 @@ class I2CMaster(
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Master has been uninitialized!"
             )
+
+
+def scan_masters(
+    masters: Mapping[KeyType, I2CMaster[Any]],
+    addresses: Iterable[int] = _DEFAULT_SCAN_RANGE,
+    method: ScanMethod = ScanMethod.READ,
+) -> Dict[KeyType, Set[int]]:
+    """Scan the buses of multiple I2C Masters concurrently.
+
+    Each master is scanned in its own thread. The driver calls release the GIL,
+    so the total duration is close to the duration of the slowest scan.
+
+    Args:
+        masters:        I2C Masters (on distinct devices) to scan, by any key
+        addresses:      7-bit addresses to probe;   range <0, 127>
+        method:         Probe transaction type
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        Dict[KeyType, Set[int]]:    Addresses of the responding slaves per master
+    """
+    address_list = list(addresses)
+    if len(masters) == 0:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=len(masters), thread_name_prefix="pyft4222-i2c-scan"
+    ) as executor:
+        futures = {
+            key: executor.submit(master.scan, address_list, method)
+            for key, master in masters.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,329 @@
+"""Module implementing TCA9548A/PCA954x I2C multiplexer support.
+
+The multiplexer keeps its channel selection until it is written again,
+so the currently selected channels are cached and the channel-select
+write is only issued when the selection actually changes. A write is only
+cached once the controller status shows it was acknowledged (a NACK does
+not fail the driver call itself).
+
+Example:
+    mux = I2CMux(i2c_master, 0x70)
+    sensor_bus = mux.channel(3)
+    data = sensor_bus.read_registers([(0x40, 0x00, 2)])
+"""
+
+import threading
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+from pyft4222.i2c.master import (
+    I2CMaster,
+    RegisterRead,
+    RegisterReadResult,
+    RegisterWrite,
+    ScanMethod,
+)
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.wrapper.i2c.master import CtrlStatus, TransactionFlag
+
+ResultType = TypeVar("ResultType")
+
+MuxAccess = Tuple[int, Callable[[I2CMaster[Any]], ResultType]]
+"""Queued access: (channel, function performing the access on the I2C Master)."""
+
+_FAILURE_MASK: CtrlStatus = (
+    CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.DATA_NACK | CtrlStatus.ARBITRATION_LOST
+)
+"""Controller status bits of a channel-select access which failed on the bus."""
+
+
+class MuxStats(NamedTuple):
+    """NamedTuple representing multiplexer channel-select counters."""
+
+    selects_issued: int
+    """Channel-select writes sent to the multiplexer."""
+    selects_skipped: int
+    """Channel-select writes skipped, the channel was already selected."""
+
+
+class I2CMux:
+    """A class managing the channel selection of an I2C multiplexer."""
+
+    _i2c_master: I2CMaster[Any]
+    _mux_address: int
+    _channel_count: int
+    _selected: Optional[int]
+    _lock: threading.RLock
+    _selects_issued: int
+    _selects_skipped: int
+
+    def __init__(
+        self,
+        i2c_master: I2CMaster[Any],
+        mux_address: int = 0x70,
+        channel_count: int = 8,
+    ):
+        """Initialize the multiplexer manager.
+
+        Note:
+            The selection is unknown until the first select,
+            use 'invalidate()' whenever it may have been changed externally
+            (e.g., mux reset pin, another bus master).
+
+        Args:
+            i2c_master:     Initialized I2C Master the multiplexer is connected to
+            mux_address:    Multiplexer slave address;  range <0, 127>
+            channel_count:  Number of downstream channels;  range <1, 8>
+        """
+        if not (0 <= mux_address < (2 ** 7)):
+            raise ValueError("mux_address must be in range <0, 127>.")
+        if not (1 <= channel_count <= 8):
+            raise ValueError("channel_count must be in range <1, 8>.")
+
+        self._i2c_master = i2c_master
+        self._mux_address = mux_address
+        self._channel_count = channel_count
+        self._selected = None
+        self._lock = threading.RLock()
+        self._selects_issued = 0
+        self._selects_skipped = 0
+
+    @property
+    def selected(self) -> Optional[int]:
+        """Cached channel mask, None if unknown."""
+        return self._selected
+
+    def select_mask(self, channel_mask: int) -> None:
+        """Select downstream channels, unless they are selected already.
+
+        Args:
+            channel_mask:   Bit mask of the channels to connect (0 disconnects all)
+
+        Raises:
+            Ft4222Exception:    Multiplexer not acknowledged, or unexpected error
+        """
+        if not (0 <= channel_mask < (1 << self._channel_count)):
+            raise ValueError(
+                f"channel_mask must be in range <0, {(1 << self._channel_count) - 1}>."
+            )
+
+        with self._lock:
+            if self._selected == channel_mask:
+                self._selects_skipped += 1
+                return
+
+            # The selection is unknown until the write succeeds
+            self._selected = None
+            self._i2c_master.write(self._mux_address, bytes((channel_mask,)))
+            self._check_ack()
+            self._selected = channel_mask
+            self._selects_issued += 1
+
+    def select(self, channel: int) -> None:
+        """Select a single downstream channel, unless it is selected already.
+
+        Args:
+            channel:    Channel index;  range <0, channel_count - 1>
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        self._check_channel(channel)
+        self.select_mask(1 << channel)
+
+    def read_selection(self) -> int:
+        """Read the channel mask from the multiplexer and update the cache.
+
+        Raises:
+            Ft4222Exception:    Multiplexer not acknowledged, or unexpected error
+
+        Returns:
+            int:        Selected channel mask
+        """
+        with self._lock:
+            self._selected = None
+            channel_mask = self._i2c_master.read(self._mux_address, 1)[0]
+            self._check_ack()
+            self._selected = channel_mask
+            return channel_mask
+
+    def invalidate(self) -> None:
+        """Forget the cached selection, the next access selects the channel again."""
+        with self._lock:
+            self._selected = None
+
+    def channel(self, channel: int) -> "MuxChannel":
+        """Get a virtual bus connected to a single downstream channel.
+
+        Args:
+            channel:    Channel index;  range <0, channel_count - 1>
+
+        Returns:
+            MuxChannel:     Virtual bus selecting the channel on each access
+        """
+        self._check_channel(channel)
+        return MuxChannel(self, channel)
+
+    def run(
+        self, channel: int, access: Callable[[I2CMaster[Any]], ResultType]
+    ) -> ResultType:
+        """Run an access on a downstream channel.
+
+        The multiplexer is locked for the duration of the access,
+        so virtual buses can be shared between threads.
+
+        Args:
+            channel:    Channel index;  range <0, channel_count - 1>
+            access:     Function performing the access on the I2C Master
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            ResultType:     Result of the access
+        """
+        with self._lock:
+            self.select(channel)
+            return access(self._i2c_master)
+
+    def run_grouped(
+        self, accesses: Sequence[MuxAccess[ResultType]], reorder: bool = True
+    ) -> List[ResultType]:
+        """Run queued accesses, grouping them by channel.
+
+        With 'reorder' enabled, the accesses are executed grouped by channel,
+        starting with the currently selected one. Accesses to the same channel
+        keep their relative order. Only enable it for independent accesses.
+
+        Args:
+            accesses:   Queued (channel, access) pairs
+            reorder:    Allow grouping the accesses by channel?
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[ResultType]:   Results in the order of 'accesses'
+        """
+        for channel, _ in accesses:
+            self._check_channel(channel)
+
+        with self._lock:
+            order = list(range(len(accesses)))
+            if reorder:
+                current = self._selected
+
+                def group_key(idx: int) -> Tuple[bool, int]:
+                    channel = accesses[idx][0]
+                    return (current != (1 << channel), channel)
+
+                order.sort(key=group_key)
+
+            results: List[Any] = [None] * len(accesses)
+            for idx in order:
+                channel, access = accesses[idx]
+                results[idx] = self.run(channel, access)
+
+            return results
+
+    def get_stats(self) -> MuxStats:
+        """Get channel-select counters.
+
+        Returns:
+            MuxStats:   Counters since the creation of the manager
+        """
+        with self._lock:
+            return MuxStats(self._selects_issued, self._selects_skipped)
+
+    def _check_ack(self) -> None:
+        result = self._i2c_master.wait_idle()
+        if result.ok and not (result.status & _FAILURE_MASK):
+            return
+
+        # Release the bus, the selection stays unknown
+        self._i2c_master.reset()
+        raise Ft4222Exception(
+            Ft4222Status.IO_ERROR,
+            f"I2C multiplexer 0x{self._mux_address:02X} has not acknowledged!",
+        )
+
+    def _check_channel(self, channel: int) -> None:
+        if not (0 <= channel < self._channel_count):
+            raise ValueError(
+                f"channel must be in range <0, {self._channel_count - 1}>."
+            )
+
+
+class MuxChannel:
+    """A virtual I2C bus behind a multiplexer channel.
+
+    Mirrors the transfer methods of 'I2CMaster', each call selects
+    the channel first (skipped when it is already selected).
+    """
+
+    _mux: I2CMux
+    _channel: int
+
+    def __init__(self, mux: I2CMux, channel: int):
+        self._mux = mux
+        self._channel = channel
+
+    @property
+    def channel(self) -> int:
+        return self._channel
+
+    def read(self, dev_address: int, read_byte_count: int) -> bytes:
+        """See 'I2CMaster.read()'."""
+        return self._mux.run(
+            self._channel, lambda m: m.read(dev_address, read_byte_count)
+        )
+
+    def write(self, dev_address: int, write_data: bytes) -> int:
+        """See 'I2CMaster.write()'."""
+        return self._mux.run(self._channel, lambda m: m.write(dev_address, write_data))
+
+    def read_ex(
+        self, dev_address: int, flags: TransactionFlag, read_byte_count: int
+    ) -> bytes:
+        """See 'I2CMaster.read_ex()'."""
+        return self._mux.run(
+            self._channel, lambda m: m.read_ex(dev_address, flags, read_byte_count)
+        )
+
+    def write_ex(
+        self, dev_address: int, flags: TransactionFlag, write_data: bytes
+    ) -> int:
+        """See 'I2CMaster.write_ex()'."""
+        return self._mux.run(
+            self._channel, lambda m: m.write_ex(dev_address, flags, write_data)
+        )
+
+    def read_registers(
+        self,
+        requests: Sequence[RegisterRead],
+        verify_ack: bool = True,
+        reuse_buffer: bool = False,
+    ) -> RegisterReadResult:
+        """See 'I2CMaster.read_registers()'."""
+        return self._mux.run(
+            self._channel,
+            lambda m: m.read_registers(requests, verify_ack, reuse_buffer),
+        )
+
+    def write_registers(
+        self, requests: Sequence[RegisterWrite], verify_ack: bool = True
+    ) -> List[int]:
+        """See 'I2CMaster.write_registers()'."""
+        return self._mux.run(
+            self._channel, lambda m: m.write_registers(requests, verify_ack)
+        )
+
+    def probe(
+        self,
+        dev_address: int,
+        method: ScanMethod = ScanMethod.READ,
+        reset_on_failure: bool = True,
+    ) -> bool:
+        """See 'I2CMaster.probe()'."""
+        return self._mux.run(
+            self._channel, lambda m: m.probe(dev_address, method, reset_on_failure)
+        )
@@ -0,0 +1,353 @@
+"""Module implementing PMBus transactions and data format conversions.
+
+Single transactions go through the 'SMBus' facade (with Packet Error
+Checking if enabled). Bulk reads are pipelined by 'I2CMaster.read_registers()',
+their PEC is verified directly on the returned memoryviews.
+
+Example:
+    pmbus = PMBus(i2c_master)
+    vin = pmbus.read_linear11(0x40, READ_VIN)
+    vout = pmbus.read_linear16(0x40, READ_VOUT)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pyft4222.i2c.master import I2CMaster
+from pyft4222.smbus import SMBus, crc8
+
+VOUT_MODE: int = 0x20
+READ_VIN: int = 0x88
+READ_IIN: int = 0x89
+READ_VOUT: int = 0x8B
+READ_IOUT: int = 0x8C
+READ_TEMPERATURE_1: int = 0x8D
+READ_POUT: int = 0x96
+READ_PIN: int = 0x97
+
+BulkRead = Tuple[int, int, int]
+"""Bulk read request: (dev_address, command, byte_count), byte_count 1 or 2."""
+
+
+def decode_linear11(word: int) -> float:
+    """Decode a LINEAR11 value (5-bit exponent, 11-bit mantissa).
+
+    Args:
+        word:       Raw 16-bit value
+
+    Returns:
+        float:      Decoded value
+    """
+    exponent = word >> 11
+    mantissa = word & 0x07FF
+    if exponent & 0x10:
+        exponent -= 0x20
+    if mantissa & 0x0400:
+        mantissa -= 0x0800
+    return mantissa * (2.0 ** exponent)
+
+
+def encode_linear11(value: float) -> int:
+    """Encode a value into the LINEAR11 format with the best precision.
+
+    Args:
+        value:      Value to encode
+
+    Raises:
+        ValueError:     Value out of the LINEAR11 range
+
+    Returns:
+        int:        Raw 16-bit value
+    """
+    for exponent in range(-16, 16):
+        mantissa = round(value / (2.0 ** exponent))
+        if -1024 <= mantissa <= 1023:
+            return ((exponent & 0x1F) << 11) | (mantissa & 0x07FF)
+
+    raise ValueError("value is out of the LINEAR11 range.")
+
+
+def decode_linear16(word: int, vout_mode: int) -> float:
+    """Decode a LINEAR16 value (output voltage) using the VOUT_MODE exponent.
+
+    Args:
+        word:       Raw unsigned 16-bit mantissa
+        vout_mode:  VOUT_MODE register value
+
+    Raises:
+        ValueError:     VOUT_MODE does not select the linear format
+
+    Returns:
+        float:      Decoded value
+    """
+    if (vout_mode >> 5) != 0:
+        raise ValueError("VOUT_MODE does not select the linear format.")
+
+    exponent = vout_mode & 0x1F
+    if exponent & 0x10:
+        exponent -= 0x20
+    return word * (2.0 ** exponent)
+
+
+class PMBus:
+    """A class encapsulating PMBus transactions."""
+
+    _i2c_master: I2CMaster[Any]
+    _smbus: SMBus
+    _vout_modes: Dict[int, int]
+
+    def __init__(self, i2c_master: I2CMaster[Any], pec: bool = True):
+        """Initialize the PMBus helper.
+
+        Args:
+            i2c_master:     Initialized I2C Master
+            pec:            Use Packet Error Checking?
+        """
+        self._i2c_master = i2c_master
+        self._smbus = SMBus(i2c_master, pec)
+        self._vout_modes = {}
+
+    @property
+    def pec(self) -> bool:
+        return self._smbus.pec
+
+    def send_byte(self, dev_address: int, command: int) -> None:
+        """Send a command without data (e.g., CLEAR_FAULTS).
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+        """
+        self._smbus.write_byte(dev_address, command)
+
+    def read_byte(self, dev_address: int, command: int) -> int:
+        """Read a byte command.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            int:        Read byte
+        """
+        return self._smbus.read_byte_data(dev_address, command)
+
+    def write_byte(self, dev_address: int, command: int, value: int) -> None:
+        """Write a byte command.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+            value:          Byte to write;          range <0, 255>
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+        """
+        self._smbus.write_byte_data(dev_address, command, value)
+
+    def read_word(self, dev_address: int, command: int) -> int:
+        """Read a word command.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            int:        Read word (little-endian on the bus)
+        """
+        return self._smbus.read_word_data(dev_address, command)
+
+    def write_word(self, dev_address: int, command: int, value: int) -> None:
+        """Write a word command.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+            value:          Word to write;          range <0, 65_535>
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+        """
+        self._smbus.write_word_data(dev_address, command, value)
+
+    def block_read(self, dev_address: int, command: int) -> bytes:
+        """Read a block command (e.g., MFR_ID).
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            bytes:      Block data (without the byte count)
+        """
+        return bytes(self._smbus.read_block_data(dev_address, command))
+
+    def block_write(self, dev_address: int, command: int, data: bytes) -> None:
+        """Write a block command.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+            data:           Block data;             length <0, 32>
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+        """
+        self._smbus.write_block_data(dev_address, command, data)
+
+    def process_call(self, dev_address: int, command: int, value: int) -> int:
+        """Write a word and read a word back in one transaction.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+            value:          Word to write;          range <0, 65_535>
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            int:        Read word
+        """
+        return self._smbus.process_call(dev_address, command, value)
+
+    def read_linear11(self, dev_address: int, command: int) -> float:
+        """Read and decode a LINEAR11 word command (e.g., READ_IOUT).
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            float:      Decoded value
+        """
+        return decode_linear11(self.read_word(dev_address, command))
+
+    def read_linear16(self, dev_address: int, command: int = READ_VOUT) -> float:
+        """Read and decode a LINEAR16 word command (e.g., READ_VOUT).
+
+        The VOUT_MODE of each device is read once and cached,
+        call 'invalidate_vout_mode()' after changing it.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+            command:        PMBus command code (READ_VOUT by default)
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            float:      Decoded value
+        """
+        return decode_linear16(
+            self.read_word(dev_address, command), self.get_vout_mode(dev_address)
+        )
+
+    def get_vout_mode(self, dev_address: int) -> int:
+        """Get the (cached) VOUT_MODE of a device.
+
+        Args:
+            dev_address:    7-bit slave address;    range <0, 127>
+
+        Raises:
+            OSError:    Transaction not acknowledged, PEC mismatch or failure
+
+        Returns:
+            int:        VOUT_MODE register value
+        """
+        vout_mode = self._vout_modes.get(dev_address)
+        if vout_mode is None:
+            vout_mode = self.read_byte(dev_address, VOUT_MODE)
+            self._vout_modes[dev_address] = vout_mode
+        return vout_mode
+
+    def invalidate_vout_mode(self, dev_address: Optional[int] = None) -> None:
+        """Forget the cached VOUT_MODE of one or all devices.
+
+        Args:
+            dev_address:    7-bit slave address, None forgets all devices
+        """
+        if dev_address is None:
+            self._vout_modes.clear()
+        else:
+            self._vout_modes.pop(dev_address, None)
+
+    def read_bulk(self, requests: Sequence[BulkRead]) -> List[Optional[int]]:
+        """Read many byte or word commands from many devices in one pipeline.
+
+        The whole batch is executed by 'I2CMaster.read_registers()'
+        (into its reused buffer, the data are decoded before returning).
+        A failed request does not abort the rest of the batch.
+
+        Args:
+            requests:   (dev_address, command, byte_count) tuples
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[Optional[int]]:    Little-endian values, None for requests
+                                    not acknowledged or failing the PEC check
+        """
+        pec = self.pec
+        for _, _, byte_count in requests:
+            if byte_count not in (1, 2):
+                raise ValueError("byte_count must be either 1 or 2.")
+
+        result = self._i2c_master.read_registers(
+            [
+                (dev_address, command, byte_count + int(pec))
+                for dev_address, command, byte_count in requests
+            ],
+            reuse_buffer=True,
+        )
+        failed = set(result.failed)
+
+        values: List[Optional[int]] = []
+        for idx, ((dev_address, command, byte_count), view) in enumerate(
+            zip(requests, result.data)
+        ):
+            if idx in failed:
+                values.append(None)
+                continue
+            if pec:
+                header = bytes((dev_address << 1, command, (dev_address << 1) | 1))
+                if crc8(view[:byte_count], crc8(header)) != view[byte_count]:
+                    values.append(None)
+                    continue
+            values.append(int.from_bytes(view[:byte_count], "little"))
+
+        return values
+
+    def read_bulk_linear11(
+        self, requests: Sequence[Tuple[int, int]]
+    ) -> List[Optional[float]]:
+        """Read many LINEAR11 word commands in one pipeline (see 'read_bulk()').
+
+        Args:
+            requests:   (dev_address, command) tuples
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[Optional[float]]:  Decoded values, None for failed requests
+        """
+        words = self.read_bulk(
+            [(dev_address, command, 2) for dev_address, command in requests]
+        )
+        return [decode_linear11(word) if word is not None else None for word in words]
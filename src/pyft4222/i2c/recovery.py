@@ -0,0 +1,257 @@
+"""Module implementing automatic I2C Master error recovery.
+
+Attach a 'RecoveryPolicy' to an I2C Master using 'set_recovery_policy()'.
+Failed transactions are classified from the controller status,
+the controller (or the bus) is reset and idempotent transactions
+are retried with a bounded exponential backoff.
+"""
+
+import threading
+import time
+from enum import Enum, auto
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.wrapper.i2c.master import CtrlStatus
+
+if TYPE_CHECKING:
+    from pyft4222.i2c.master import I2CMaster
+
+ResultType = TypeVar("ResultType")
+
+
+class Fault(Enum):
+    """Enum representing classified I2C transaction failures."""
+
+    NONE = auto()
+    """Transaction completed successfully."""
+    ADDRESS_NACK = auto()
+    """Slave address not acknowledged (absent or busy slave)."""
+    DATA_NACK = auto()
+    """Data not acknowledged by the slave."""
+    ARBITRATION_LOST = auto()
+    """Another master took over the bus."""
+    BUS_STUCK = auto()
+    """Bus stays busy after the transaction (e.g., SDA held low by a slave)."""
+    CONTROLLER_STUCK = auto()
+    """Controller stays busy after the transaction."""
+    DRIVER_ERROR = auto()
+    """The driver call itself failed."""
+
+
+def classify_status(status: CtrlStatus) -> Fault:
+    """Classify the controller status read after a finished transaction.
+
+    Args:
+        status:     Controller status
+
+    Returns:
+        Fault:      Failure classification
+    """
+    if status & CtrlStatus.CONTROLLER_BUSY:
+        return Fault.CONTROLLER_STUCK
+    if status & CtrlStatus.ARBITRATION_LOST:
+        return Fault.ARBITRATION_LOST
+    if status & CtrlStatus.SLAVE_ADDR_NACK:
+        return Fault.ADDRESS_NACK
+    if status & CtrlStatus.DATA_NACK:
+        return Fault.DATA_NACK
+    if status & CtrlStatus.BUS_BUSY:
+        return Fault.BUS_STUCK
+    return Fault.NONE
+
+
+class RecoveryPolicy(NamedTuple):
+    """NamedTuple representing an I2C error recovery configuration."""
+
+    max_retries: int = 3
+    """Maximum number of retries of a single idempotent transaction."""
+    initial_backoff: float = 0.0005
+    """Delay (in seconds) before the first retry."""
+    max_backoff: float = 0.05
+    """Maximum delay (in seconds) between retries."""
+    backoff_factor: float = 2.0
+    """Delay multiplier applied after each retry."""
+    retry_on: FrozenSet[Fault] = frozenset(
+        (
+            Fault.DATA_NACK,
+            Fault.ARBITRATION_LOST,
+            Fault.BUS_STUCK,
+            Fault.CONTROLLER_STUCK,
+            Fault.DRIVER_ERROR,
+        )
+    )
+    """Faults worth retrying ('ADDRESS_NACK' is usually a missing slave)."""
+    retry_writes: bool = False
+    """Retry writes as well (only safe for idempotent register writes)."""
+    check_status: bool = True
+    """Read the controller status after each transaction.
+
+    The driver does not report NACKs nor a stuck bus by a return code,
+    disabling the check saves one USB round-trip per transaction.
+    """
+    status_timeout: float = 0.01
+    """Maximum time (in seconds) to wait for the controller and the bus
+    to become idle before the status is classified."""
+
+
+class RecoveryStats(NamedTuple):
+    """NamedTuple representing recovery counters."""
+
+    transactions: int
+    retries: int
+    failures: int
+    """Transactions failed even after retries."""
+    controller_resets: int
+    bus_resets: int
+    address_nacks: int
+    data_nacks: int
+    arbitration_losses: int
+    bus_stuck: int
+    controller_stuck: int
+    driver_errors: int
+
+
+class BusRecovery:
+    """A class executing I2C transactions according to a 'RecoveryPolicy'."""
+
+    policy: RecoveryPolicy
+
+    _lock: threading.Lock
+    _transactions: int
+    _retries: int
+    _failures: int
+    _controller_resets: int
+    _bus_resets: int
+    _faults: Dict[Fault, int]
+
+    def __init__(self, policy: RecoveryPolicy):
+        if policy.max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        if not (0 <= policy.initial_backoff <= policy.max_backoff):
+            raise ValueError("Backoff must satisfy 0 <= initial <= max.")
+
+        self.policy = policy
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def run(
+        self,
+        i2c_master: "I2CMaster[Any]",
+        transaction: Callable[[], ResultType],
+        idempotent: bool,
+    ) -> ResultType:
+        """Run a transaction, recover from failures and retry it if allowed.
+
+        Args:
+            i2c_master:     I2C Master executing the transaction
+            transaction:    Complete transaction (ending with a STOP condition)
+            idempotent:     Can the transaction be repeated safely?
+
+        Raises:
+            Ft4222Exception:    Transaction failed even after retries
+
+        Returns:
+            ResultType:     Result of the transaction
+        """
+        policy = self.policy
+        delay = policy.initial_backoff
+        attempt = 0
+
+        while True:
+            error: Optional[Ft4222Exception] = None
+            try:
+                result = transaction()
+                fault = (
+                    self._check_status(i2c_master)
+                    if policy.check_status
+                    else Fault.NONE
+                )
+            except Ft4222Exception as e:
+                fault = Fault.DRIVER_ERROR
+                error = e
+
+            with self._lock:
+                self._transactions += 1 if attempt == 0 else 0
+                if fault != Fault.NONE:
+                    self._faults[fault] += 1
+
+            if fault == Fault.NONE:
+                return result
+
+            self._recover(i2c_master, fault)
+
+            if (
+                not idempotent
+                or fault not in policy.retry_on
+                or attempt >= policy.max_retries
+            ):
+                with self._lock:
+                    self._failures += 1
+                if error is None:
+                    error = Ft4222Exception(
+                        Ft4222Status.IO_ERROR, f"I2C transaction failed: {fault.name}"
+                    )
+                raise error
+
+            time.sleep(delay)
+            delay = min(delay * policy.backoff_factor, policy.max_backoff)
+            attempt += 1
+            with self._lock:
+                self._retries += 1
+
+    def get_stats(self) -> RecoveryStats:
+        """Get the recovery counters.
+
+        Returns:
+            RecoveryStats:  Counters accumulated since the last reset
+        """
+        with self._lock:
+            return RecoveryStats(
+                self._transactions,
+                self._retries,
+                self._failures,
+                self._controller_resets,
+                self._bus_resets,
+                self._faults[Fault.ADDRESS_NACK],
+                self._faults[Fault.DATA_NACK],
+                self._faults[Fault.ARBITRATION_LOST],
+                self._faults[Fault.BUS_STUCK],
+                self._faults[Fault.CONTROLLER_STUCK],
+                self._faults[Fault.DRIVER_ERROR],
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the recovery counters."""
+        with self._lock:
+            self._transactions = 0
+            self._retries = 0
+            self._failures = 0
+            self._controller_resets = 0
+            self._bus_resets = 0
+            self._faults = {fault: 0 for fault in Fault}
+
+    def _check_status(self, i2c_master: "I2CMaster[Any]") -> Fault:
+        return classify_status(
+            i2c_master.wait_bus_free(self.policy.status_timeout).status
+        )
+
+    def _recover(self, i2c_master: "I2CMaster[Any]", fault: Fault) -> None:
+        if fault == Fault.BUS_STUCK:
+            # Nine clock pulses release a slave holding SDA low
+            i2c_master.reset_bus()
+            with self._lock:
+                self._bus_resets += 1
+
+        i2c_master.reset()
+        with self._lock:
+            self._controller_resets += 1
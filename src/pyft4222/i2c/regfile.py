@@ -0,0 +1,302 @@
+"""Module implementing register-file emulation on top of the I2C Slave.
+
+'RegisterFileEngine' serves a byte-addressable backing store the way
+a typical register-pointer device does: the first byte(s) of every write
+set the register pointer, the remaining bytes are written starting at
+the pointer (with auto-increment), reads return data starting at the pointer.
+
+The FT4222 can only answer a read from its Tx queue, so a dedicated thread
+drains the Rx queue and pre-stages the next expected bytes right after every
+pointer write, before the master issues its repeated START.
+
+Note:
+    The driver does not report the Tx queue level, the engine cannot see
+    how many staged bytes the master actually consumed. Staged bytes left
+    over from the previous transaction are flushed by a controller reset
+    ('flush_stale'), reads not preceded by a pointer write return whatever
+    is left in the Tx queue (or the response word).
+
+Note:
+    The Rx queue does not keep transaction boundaries. When the master
+    issues several writes before the engine drains the queue, they arrive
+    in a single read. With a fixed write length ('frame_size') the engine
+    splits them again, otherwise the merged data are handled as one write
+    starting at the first pointer, which corrupts the store. Use
+    'frame_size' whenever the master writes a fixed number of bytes
+    (e.g., 'address_width' for a master only reading registers).
+
+Example:
+    registers = bytearray(256)
+    with RegisterFileEngine(i2c_slave, registers) as engine:
+        registers[0x0F] = 0xA5      # WHO_AM_I
+        run_test()
+    print(engine.get_stats())
+"""
+
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from pyft4222.i2c.slave import I2CSlave
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.polling import PollStrategy
+from pyft4222.worker import PollingWorker
+from pyft4222.wrapper import WritableBuffer
+
+_MAX_READ_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes read by a single driver call."""
+
+WriteCallback = Callable[[int, memoryview], None]
+"""Called with (register address, written data) after each register write."""
+
+
+class RegisterFileStats(NamedTuple):
+    """NamedTuple representing register-file engine counters."""
+
+    transactions: int
+    """Number of write transactions received from the master."""
+    pointer_writes: int
+    """Number of transactions setting the register pointer."""
+    bytes_written: int
+    """Number of register bytes written by the master."""
+    bytes_staged: int
+    """Number of bytes pre-staged in the Tx queue."""
+    stale_flushes: int
+    """Number of controller resets dropping previously staged bytes."""
+    underruns: int
+    """Number of stagings finished later than the deadline."""
+    merged_writes: int
+    """Number of write transactions split from a preceding one
+    sharing the same Rx queue read (only detected with 'frame_size')."""
+    stage_latency: HistogramSnapshot
+    """Time from detecting a pointer write to finishing the staging (seconds)."""
+
+
+class RegisterFileEngine(PollingWorker):
+    """A class emulating a register-pointer device using the I2C Slave.
+
+    'start()' stages the data at the current pointer right away,
+    so a read without a preceding pointer write returns valid data too.
+    """
+
+    _worker_name = "Register file engine"
+    _thread_name = "pyft4222-regfile"
+
+    _i2c_slave: I2CSlave[Any]
+    _store: memoryview
+    _address_width: int
+    _prefetch: int
+    _deadline: float
+    _frame_size: Optional[int]
+    _flush_stale: bool
+    _on_write: Optional[WriteCallback]
+    _rx_view: memoryview
+    _partial: bytearray
+    _pointer: int
+    _staged: bool
+
+    _transactions: int
+    _pointer_writes: int
+    _bytes_written: int
+    _bytes_staged: int
+    _stale_flushes: int
+    _underruns: int
+    _merged_writes: int
+    _stage_latency: Histogram
+
+    def __init__(
+        self,
+        i2c_slave: I2CSlave[Any],
+        store: WritableBuffer,
+        *,
+        address_width: int = 1,
+        prefetch: int = 16,
+        poll_strategy: PollStrategy = PollStrategy(
+            spin_polls=8, initial_interval=0.00005, max_interval=0.0005
+        ),
+        deadline: float = 0.001,
+        frame_size: Optional[int] = None,
+        flush_stale: bool = True,
+        on_write: Optional[WriteCallback] = None,
+    ):
+        """Initialize the engine.
+
+        Note:
+            The store is served in place (a 'bytearray' or a contiguous
+            NumPy 'uint8' array), changes made by the application are
+            visible to the next staging. Accesses wrap around its end.
+
+        Args:
+            i2c_slave:      Initialized I2C Slave
+            store:          Backing store;  size <1, 65_536>
+            address_width:  Register pointer size in bytes (big-endian);  range <1, 2>
+            prefetch:       Number of bytes staged after each pointer write;
+                            range <1, 65_535>
+            poll_strategy:  Rx queue polling schedule, restarted after each
+                            transaction
+            deadline:       Maximum pointer-write-to-staged time (seconds),
+                            slower stagings are counted as underruns
+                            (the default is about one USB round-trip
+                            of a USB-attached master)
+            frame_size:     Length of every write transaction (pointer
+                            included), None if the lengths vary;
+                            range <address_width, 65_535>
+            flush_stale:    Reset the controller to drop staged bytes
+                            left over from the previous transaction?
+            on_write:       Called after each register write
+        """
+        view = memoryview(store).cast("B")
+        if not (0 < view.nbytes <= (2 ** 16)):
+            raise ValueError("store size must be in range <1, 65_536>.")
+        if address_width not in (1, 2):
+            raise ValueError("address_width must be in range <1, 2>.")
+        if not (0 < prefetch < (2 ** 16)):
+            raise ValueError("prefetch must be in range <1, 65_535>.")
+        if frame_size is not None and not (address_width <= frame_size < (2 ** 16)):
+            raise ValueError("frame_size must be in range <address_width, 65_535>.")
+
+        super().__init__(poll_strategy)
+        self._i2c_slave = i2c_slave
+        self._store = view
+        self._address_width = address_width
+        self._prefetch = prefetch
+        self._deadline = deadline
+        self._frame_size = frame_size
+        self._flush_stale = flush_stale
+        self._on_write = on_write
+        self._rx_view = memoryview(bytearray(_MAX_READ_SIZE))
+        self._partial = bytearray()
+        self._pointer = 0
+        self._staged = False
+        self._stage_latency = Histogram.exponential(0.00001)
+        self.reset_stats()
+
+    @property
+    def pointer(self) -> int:
+        """Current register pointer."""
+        return self._pointer
+
+    def get_stats(self) -> RegisterFileStats:
+        """Get a snapshot of the engine counters.
+
+        Returns:
+            RegisterFileStats:  Counters accumulated since the last reset
+        """
+        with self._lock:
+            return RegisterFileStats(
+                self._transactions,
+                self._pointer_writes,
+                self._bytes_written,
+                self._bytes_staged,
+                self._stale_flushes,
+                self._underruns,
+                self._merged_writes,
+                self._stage_latency.snapshot(),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the engine counters."""
+        with self._lock:
+            self._transactions = 0
+            self._pointer_writes = 0
+            self._bytes_written = 0
+            self._bytes_staged = 0
+            self._stale_flushes = 0
+            self._underruns = 0
+            self._merged_writes = 0
+            self._stage_latency.reset()
+
+    def _on_start(self) -> None:
+        self._partial.clear()
+        self._stage()
+
+    def _poll(self) -> bool:
+        rx_count = self._i2c_slave.get_rx_status()
+        if rx_count <= 0:
+            return False
+
+        detected_at = time.perf_counter()
+        bytes_read = self._i2c_slave.readinto(
+            self._rx_view[: min(rx_count, _MAX_READ_SIZE)]
+        )
+        if self._handle_rx(self._rx_view[:bytes_read]):
+            self._stage()
+            self._record_stage(time.perf_counter() - detected_at)
+        return True
+
+    def _handle_rx(self, data: memoryview) -> bool:
+        """Handle the data of one Rx queue read.
+
+        Returns:
+            bool:       Has the register pointer been set?
+        """
+        frame_size = self._frame_size
+        if frame_size is None:
+            if len(data) < self._address_width:
+                return False
+            self._handle_write(data)
+            return True
+
+        if self._partial:
+            # The rest of a transaction split between two reads
+            self._partial += data
+            data = memoryview(bytes(self._partial))
+            self._partial.clear()
+
+        frame_count = len(data) // frame_size
+        for idx in range(frame_count):
+            self._handle_write(data[idx * frame_size : (idx + 1) * frame_size])
+        self._partial += data[frame_count * frame_size :]
+
+        if frame_count > 1:
+            with self._lock:
+                self._merged_writes += frame_count - 1
+        return frame_count > 0
+
+    def _handle_write(self, data: memoryview) -> None:
+        size = self._store.nbytes
+        width = self._address_width
+        address = int.from_bytes(data[:width], "big") % size
+        payload = data[width:]
+
+        offset = 0
+        while offset < len(payload):
+            copy_len = min(len(payload) - offset, size - address)
+            self._store[address : address + copy_len] = payload[
+                offset : offset + copy_len
+            ]
+            if self._on_write is not None:
+                self._on_write(address, payload[offset : offset + copy_len])
+            address = (address + copy_len) % size
+            offset += copy_len
+
+        self._pointer = address
+        with self._lock:
+            self._transactions += 1
+            self._pointer_writes += 1
+            self._bytes_written += len(payload)
+
+    def _stage(self) -> None:
+        if self._staged and self._flush_stale:
+            self._i2c_slave.reset()
+            with self._lock:
+                self._stale_flushes += 1
+
+        store = self._store
+        end = self._pointer + self._prefetch
+        if end <= store.nbytes:
+            data = store[self._pointer : end].tobytes()
+        else:
+            # Wrap around, the store may be shorter than the prefetch
+            repeats = -(-end // store.nbytes)
+            data = (store.tobytes() * repeats)[self._pointer : end]
+
+        self._i2c_slave.write(data)
+        self._staged = True
+        with self._lock:
+            self._bytes_staged += self._prefetch
+
+    def _record_stage(self, latency: float) -> None:
+        self._stage_latency.record(latency)
+        if latency > self._deadline:
+            with self._lock:
+                self._underruns += 1
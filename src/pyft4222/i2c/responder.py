@@ -0,0 +1,295 @@
+"""Module implementing a pre-staged command/response pipeline for the I2C Slave.
+
+With clock stretching enabled, the FT4222 holds SCL low after the read
+header until the Tx queue contains data. Every microsecond spent between
+receiving a command and queuing its response stalls the external master.
+
+'ResponsePipeline' dispatches each received command to the handler
+registered for its longest matching prefix. It also learns which command
+usually follows which, precomputes the response of the predicted next
+command and queues it right behind the current response. When the
+prediction holds, the response is already in the Tx queue and the master
+is not stalled at all. A wrong prediction is flushed by a controller reset.
+
+Note:
+    The master must read exactly as many bytes as the handler returns,
+    otherwise the Tx queue gets out of step with the commands. Only handlers
+    registered with 'predictable=True' (pure functions of the command bytes)
+    are precomputed.
+
+Note:
+    The Rx queue does not keep transaction boundaries, commands written
+    before the pipeline drains the queue arrive in a single read. Commands
+    of routes registered with a 'length' are split from the data following
+    them, the rest of a read is handled as one command.
+
+Example:
+    pipeline = ResponsePipeline(i2c_slave)
+    pipeline.register(b"\\x0F", lambda cmd: b"\\xA5")
+    pipeline.register(b"\\x28", lambda cmd: sensor.sample(), predictable=False)
+    with pipeline:
+        run_test()
+    print(pipeline.get_stats().stretch.percentile(0.99))
+"""
+
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from pyft4222.i2c.slave import I2CSlave
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.polling import PollStrategy
+from pyft4222.worker import PollingWorker
+
+_MAX_READ_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes read by a single driver call."""
+
+Handler = Callable[[bytes], bytes]
+"""Function computing the response to a received command."""
+
+
+class ResponderStats(NamedTuple):
+    """NamedTuple representing response pipeline counters."""
+
+    transactions: int
+    """Number of commands received from the master."""
+    hits: int
+    """Commands whose response had been pre-staged."""
+    misses: int
+    """Commands whose response had to be computed after receiving them."""
+    unmatched: int
+    """Commands without a registered handler (nothing queued)."""
+    flushes: int
+    """Controller resets dropping mispredicted responses."""
+    merged: int
+    """Commands split from a preceding one sharing the same Rx queue read."""
+    stretch: HistogramSnapshot
+    """Upper bound of the clock stretch per transaction (seconds).
+
+    Measured from the last idle Rx queue poll to queuing the response,
+    zero for pre-staged responses.
+    """
+
+
+class _Route(NamedTuple):
+    handler: Handler
+    predictable: bool
+    length: Optional[int]
+
+
+class ResponsePipeline(PollingWorker):
+    """A class answering master commands with handler-computed responses."""
+
+    _worker_name = "Response pipeline"
+    _thread_name = "pyft4222-responder"
+
+    _i2c_slave: I2CSlave[Any]
+    _clock_stretch: bool
+    _prestage: bool
+    _routes: Dict[bytes, _Route]
+    _prefix_lengths: Tuple[int, ...]
+    _successors: Dict[bytes, bytes]
+    _last_command: Optional[bytes]
+    _staged_command: Optional[bytes]
+    _rx_view: memoryview
+    _partial: bytes
+    _idle_at: float
+
+    _transactions: int
+    _hits: int
+    _misses: int
+    _unmatched: int
+    _flushes: int
+    _merged: int
+    _stretch: Histogram
+
+    def __init__(
+        self,
+        i2c_slave: I2CSlave[Any],
+        *,
+        clock_stretch: bool = True,
+        prestage: bool = True,
+        poll_strategy: PollStrategy = PollStrategy(
+            spin_polls=8, initial_interval=0.00005, max_interval=0.0005
+        ),
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            i2c_slave:      Initialized I2C Slave
+            clock_stretch:  Enable clock stretching while the pipeline runs?
+            prestage:       Queue the predicted next response ahead of time?
+            poll_strategy:  Rx queue polling schedule, restarted after each
+                            transaction
+        """
+        super().__init__(poll_strategy)
+        self._i2c_slave = i2c_slave
+        self._clock_stretch = clock_stretch
+        self._prestage = prestage
+        self._routes = {}
+        self._prefix_lengths = ()
+        self._successors = {}
+        self._last_command = None
+        self._staged_command = None
+        self._rx_view = memoryview(bytearray(_MAX_READ_SIZE))
+        self._partial = b""
+        self._idle_at = 0.0
+        self._stretch = Histogram.exponential(0.00001)
+        self.reset_stats()
+
+    def register(
+        self,
+        prefix: bytes,
+        handler: Handler,
+        predictable: bool = True,
+        length: Optional[int] = None,
+    ) -> None:
+        """Register a handler for commands starting with the given prefix.
+
+        The longest matching prefix wins. Registering an existing prefix
+        replaces its handler. Call before 'start()'.
+
+        Args:
+            prefix:         Non-empty command prefix
+            handler:        Function returning the (non-empty) response
+            predictable:    Is the response a pure function of the command?
+                            Only predictable responses are pre-staged.
+            length:         Command length (prefix included) if fixed,
+                            lets commands merged in the Rx queue be split;
+                            range <len(prefix), 65_535>
+        """
+        if len(prefix) == 0:
+            raise ValueError("prefix must not be empty.")
+        if length is not None and not (len(prefix) <= length < (2 ** 16)):
+            raise ValueError("length must be in range <len(prefix), 65_535>.")
+        if self._thread is not None:
+            raise RuntimeError("Response pipeline is running!")
+
+        self._routes[bytes(prefix)] = _Route(handler, predictable, length)
+        self._prefix_lengths = tuple(
+            sorted({len(key) for key in self._routes}, reverse=True)
+        )
+
+    def get_stats(self) -> ResponderStats:
+        """Get a snapshot of the pipeline counters.
+
+        Returns:
+            ResponderStats:     Counters accumulated since the last reset
+        """
+        with self._lock:
+            return ResponderStats(
+                self._transactions,
+                self._hits,
+                self._misses,
+                self._unmatched,
+                self._flushes,
+                self._merged,
+                self._stretch.snapshot(),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the pipeline counters."""
+        with self._lock:
+            self._transactions = 0
+            self._hits = 0
+            self._misses = 0
+            self._unmatched = 0
+            self._flushes = 0
+            self._merged = 0
+            self._stretch.reset()
+
+    def _on_start(self) -> None:
+        self._partial = b""
+        self._i2c_slave.set_clock_stretch(self._clock_stretch)
+        self._idle_at = time.perf_counter()
+
+    def _poll(self) -> bool:
+        rx_count = self._i2c_slave.get_rx_status()
+        if rx_count > 0:
+            bytes_read = self._i2c_slave.readinto(
+                self._rx_view[: min(rx_count, _MAX_READ_SIZE)]
+            )
+            for command in self._split(bytes(self._rx_view[:bytes_read])):
+                self._handle_command(command, self._idle_at)
+
+        self._idle_at = time.perf_counter()
+        return rx_count > 0
+
+    def _split(self, data: bytes) -> List[bytes]:
+        """Split the data of one Rx queue read into commands.
+
+        An incomplete fixed-length command is kept for the next read.
+        """
+        data = self._partial + data
+        self._partial = b""
+
+        commands: List[bytes] = []
+        offset = 0
+        while offset < len(data):
+            route = self._route(data[offset:])
+            if route is None or route.length is None:
+                commands.append(data[offset:])
+                break
+            if offset + route.length > len(data):
+                self._partial = data[offset:]
+                break
+            commands.append(data[offset : offset + route.length])
+            offset += route.length
+
+        if len(commands) > 1:
+            with self._lock:
+                self._merged += len(commands) - 1
+        return commands
+
+    def _handle_command(self, command: bytes, idle_at: float) -> None:
+        if self._last_command is not None:
+            self._successors[self._last_command] = command
+        self._last_command = command
+
+        staged, self._staged_command = self._staged_command, None
+        if staged == command:
+            with self._lock:
+                self._transactions += 1
+                self._hits += 1
+            self._stretch.record(0.0)
+            self._stage_prediction(command)
+            return
+
+        if staged is not None:
+            # Drop the mispredicted response before queuing the right one
+            self._i2c_slave.reset()
+            with self._lock:
+                self._flushes += 1
+
+        route = self._route(command)
+        if route is None:
+            with self._lock:
+                self._transactions += 1
+                self._unmatched += 1
+            return
+
+        self._i2c_slave.write(route.handler(command))
+        self._stretch.record(time.perf_counter() - idle_at)
+        with self._lock:
+            self._transactions += 1
+            self._misses += 1
+        self._stage_prediction(command)
+
+    def _stage_prediction(self, command: bytes) -> None:
+        if not self._prestage:
+            return
+
+        predicted = self._successors.get(command)
+        if predicted is None:
+            return
+
+        route = self._route(predicted)
+        if route is not None and route.predictable:
+            self._i2c_slave.write(route.handler(predicted))
+            self._staged_command = predicted
+
+    def _route(self, command: bytes) -> Optional[_Route]:
+        for length in self._prefix_lengths:
+            route = self._routes.get(command[:length])
+            if route is not None:
+                return route
+        return None
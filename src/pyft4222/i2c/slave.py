@@ -1,12 +1,14 @@
-from typing import Generic
+from typing import Generic, Optional
 
 from pyft4222.handle import GenericProtocolHandle, StreamHandleType
-from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.metrics import SlaveMonitor
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status, WritableBuffer
 from pyft4222.wrapper.i2c.slave import (
     I2cSlaveHandle,
     get_address,
     get_rx_status,
     read,
+    readinto,
     reset,
     set_address,
     set_clock_stretch,
@@ -21,6 +23,8 @@ class I2CSlave(
 ):
     """A class encapsulating I2C Slave functions."""
 
+    _monitor: Optional[SlaveMonitor]
+
     def __init__(self, ft_handle: I2cSlaveHandle, stream_handle: StreamHandleType):
         """Initialize the class with given FT4222 handle and a mode class type.
 
@@ -29,6 +33,7 @@ class I2CSlave(
             stream_handle:  Calling stream mode handle. Used in 'uninitialize()' method.
         """
         super().__init__(ft_handle, stream_handle)
+        self._monitor = None
 
     def get_address(self) -> int:
         """Get the address of I2C Slave device.
@@ -65,6 +70,17 @@ class I2CSlave(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Slave has been uninitialized!"
             )
 
+    def set_monitor(self, monitor: Optional[SlaveMonitor]) -> None:
+        """Attach (or detach) a latency monitor.
+
+        While attached, every Rx queue poll and every read is timestamped,
+        see 'SlaveMonitor' for the recorded histograms.
+
+        Args:
+            monitor:    Monitor to attach, 'None' disables instrumentation
+        """
+        self._monitor = monitor
+
     def get_rx_status(self) -> int:
         """Get number of bytes in Rx queue.
 
@@ -75,7 +91,10 @@ class I2CSlave(
             int:                Number of bytes in Rx queue
         """
         if self._handle is not None:
-            return get_rx_status(self._handle)
+            rx_count = get_rx_status(self._handle)
+            if self._monitor is not None:
+                self._monitor.on_rx_status(rx_count)
+            return rx_count
         else:
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Slave has been uninitialized!"
@@ -95,7 +114,10 @@ class I2CSlave(
         """
         if self._handle is not None:
             if 0 < read_byte_count < (2 ** 16):
-                return read(self._handle, read_byte_count)
+                data = read(self._handle, read_byte_count)
+                if self._monitor is not None:
+                    self._monitor.on_read(len(data))
+                return data
             else:
                 raise ValueError("read_byte_count must be in range <1, 65_535>.")
         else:
@@ -103,6 +125,37 @@ class I2CSlave(
                 Ft4222Status.DEVICE_NOT_OPENED, "I2C Slave has been uninitialized!"
             )
 
+    def readinto(self, buffer: WritableBuffer) -> int:
+        """Read data from the Rx queue into the given buffer.
+
+        Unlike 'read()', this method does not allocate any memory.
+        At most as many bytes as the buffer size are read.
+
+        Args:
+            buffer:             Writable buffer to read into;    size <1, 65_535>
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:                Number of bytes read into the buffer
+        """
+        if self._handle is not None:
+            view = memoryview(buffer)
+            if view.readonly:
+                raise ValueError("buffer must be writable.")
+            if 0 < view.nbytes < (2 ** 16):
+                bytes_read = readinto(self._handle, buffer)
+                if self._monitor is not None:
+                    self._monitor.on_read(bytes_read)
+                return bytes_read
+            else:
+                raise ValueError("buffer size must be in range <1, 65_535>.")
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "I2C Slave has been uninitialized!"
+            )
+
     def write(self, write_data: bytes) -> int:
         """Write data into Tx queue.
 
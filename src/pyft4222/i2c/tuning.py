@@ -0,0 +1,334 @@
+"""Module implementing per-target I2C speed tuning.
+
+'tune_speeds()' finds the highest reliable speed of each target address,
+'SpeedTieredSession' then runs every access at the speed of its target,
+re-initializing the I2C Master only when the speed tier changes.
+
+Warning:
+    Traffic at a speed above the limit of a device may still confuse it,
+    even when it is not addressed. Verify the whole bus behaves correctly
+    before mixing speed tiers.
+"""
+
+import time
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pyft4222.i2c.master import I2CMaster, ScanMethod
+from pyft4222.i2c.recovery import Fault, classify_status
+from pyft4222.stream import ProtocolStream
+from pyft4222.wrapper import Ft4222Exception
+
+ResultType = TypeVar("ResultType")
+
+Verifier = Callable[[I2CMaster[ProtocolStream], int], bool]
+"""Function checking the communication with an address at the current speed."""
+
+DEFAULT_SPEEDS: Tuple[int, ...] = (100, 400, 1000, 3400)
+"""Standard, Fast, Fast-mode Plus and High speed I2C (in kbit/s)."""
+
+
+class TuningResult(NamedTuple):
+    """NamedTuple representing the speed tuning result of one address."""
+
+    address: int
+    max_kbps: Optional[int]
+    """Highest speed passing all trials, None if even the lowest one failed."""
+    failed_kbps: Optional[int]
+    """Lowest tested speed which failed, None if all speeds passed."""
+
+
+def readback_verifier(read_byte_count: int = 4, trials: int = 3) -> Verifier:
+    """Get a verifier reading the same data repeatedly.
+
+    The target must acknowledge its address and return identical data
+    on each read (e.g., an ID register or a static memory location).
+    Every read must return all requested bytes and leave a clean
+    controller status (a NACK or a lost arbitration does not fail
+    the driver call itself).
+
+    Args:
+        read_byte_count:    Number of bytes per read;   range <1, 65_535>
+        trials:             Positive number of reads that must match
+
+    Returns:
+        Verifier:           Verification function
+    """
+    if not (0 < read_byte_count < (2 ** 16)):
+        raise ValueError("read_byte_count must be in range <1, 65_535>.")
+    if trials < 1:
+        raise ValueError("trials must be a positive number.")
+
+    def verify(i2c_master: I2CMaster[ProtocolStream], address: int) -> bool:
+        if not i2c_master.probe(address, ScanMethod.READ):
+            return False
+
+        reference: Optional[bytes] = None
+        try:
+            for _ in range(trials):
+                data = i2c_master.read(address, read_byte_count)
+                status = i2c_master.wait_idle().status
+                if classify_status(status) != Fault.NONE:
+                    break
+                if len(data) != read_byte_count:
+                    break
+                if reference is not None and data != reference:
+                    return False
+                reference = data
+            else:
+                return True
+        except Ft4222Exception:
+            pass
+
+        i2c_master.reset()
+        return False
+
+    return verify
+
+
+def tune_speeds(
+    stream: ProtocolStream,
+    addresses: Iterable[int],
+    speeds: Sequence[int] = DEFAULT_SPEEDS,
+    verifier: Optional[Verifier] = None,
+) -> Dict[int, TuningResult]:
+    """Find the highest reliable I2C speed of each address.
+
+    Speeds are tested in rising order, the I2C Master is re-initialized
+    once per speed. An address is no longer tested after its first failure.
+
+    Args:
+        stream:         Data stream handle (not initialized in any mode)
+        addresses:      7-bit target addresses
+        speeds:         Speeds to test in kbit/s;   range <60, 3400>
+        verifier:       Communication check (default: 'readback_verifier()')
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        Dict[int, TuningResult]:    Tuning result per address
+    """
+    speed_list = sorted(speeds)
+    if not all(60 <= kbps <= 3400 for kbps in speed_list):
+        raise ValueError("speeds must be in range <60, 3400>.")
+    verify = verifier if verifier is not None else readback_verifier()
+
+    candidates = list(addresses)
+    max_kbps: Dict[int, Optional[int]] = {address: None for address in candidates}
+    failed_kbps: Dict[int, Optional[int]] = {address: None for address in candidates}
+
+    for kbps in speed_list:
+        if not candidates:
+            break
+
+        with stream.init_i2c_master(kbps) as i2c_master:
+            passed = []
+            for address in candidates:
+                if verify(i2c_master, address):
+                    max_kbps[address] = kbps
+                    passed.append(address)
+                else:
+                    failed_kbps[address] = kbps
+            candidates = passed
+
+    return {
+        address: TuningResult(address, max_kbps[address], failed_kbps[address])
+        for address in max_kbps
+    }
+
+
+class SessionStats(NamedTuple):
+    """NamedTuple representing speed-tiered session counters."""
+
+    accesses: int
+    reconfigurations: int
+    """Number of I2C Master (re-)initializations."""
+    reconfiguration_seconds: float
+    """Total time spent re-initializing the I2C Master."""
+
+
+class SpeedTieredSession:
+    """A class running accesses at the speed tier of their target.
+
+    The I2C Master is only re-initialized when an access needs
+    a different speed than the current one.
+
+    Example:
+        results = tune_speeds(stream, [0x40, 0x50])
+        speeds = {r.address: r.max_kbps for r in results.values() if r.max_kbps}
+        with SpeedTieredSession(stream, speeds) as session:
+            data = session.run(0x40, lambda m: m.read(0x40, 2))
+    """
+
+    _stream: ProtocolStream
+    _speeds: Dict[int, int]
+    _default_kbps: int
+    _configure: Optional[Callable[[I2CMaster[ProtocolStream]], None]]
+    _i2c_master: Optional[I2CMaster[ProtocolStream]]
+    _kbps: Optional[int]
+
+    _accesses: int
+    _reconfigurations: int
+    _reconfiguration_seconds: float
+
+    def __init__(
+        self,
+        stream: ProtocolStream,
+        speeds: Mapping[int, int],
+        default_kbps: int = 100,
+        configure: Optional[Callable[[I2CMaster[ProtocolStream]], None]] = None,
+    ):
+        """Initialize the session.
+
+        Args:
+            stream:         Data stream handle (not initialized in any mode)
+            speeds:         Speed in kbit/s per target address
+            default_kbps:   Speed of addresses missing in 'speeds'
+            configure:      Called after each I2C Master initialization
+                            (e.g., to attach a recovery policy)
+        """
+        if not all(60 <= kbps <= 3400 for kbps in (*speeds.values(), default_kbps)):
+            raise ValueError("Speeds must be in range <60, 3400>.")
+
+        self._stream = stream
+        self._speeds = dict(speeds)
+        self._default_kbps = default_kbps
+        self._configure = configure
+        self._i2c_master = None
+        self._kbps = None
+        self._accesses = 0
+        self._reconfigurations = 0
+        self._reconfiguration_seconds = 0.0
+
+    def __enter__(self) -> "SpeedTieredSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+        return False
+
+    @property
+    def current_kbps(self) -> Optional[int]:
+        """Speed of the currently initialized I2C Master, None if not initialized."""
+        return self._kbps
+
+    def speed_of(self, address: int) -> int:
+        """Get the speed used for the given address.
+
+        Args:
+            address:    Target address
+
+        Returns:
+            int:        Speed in kbit/s
+        """
+        return self._speeds.get(address, self._default_kbps)
+
+    def run(
+        self,
+        address: int,
+        access: Callable[[I2CMaster[ProtocolStream]], ResultType],
+    ) -> ResultType:
+        """Run an access at the speed tier of the given address.
+
+        Args:
+            address:    Target address (selects the speed tier)
+            access:     Function performing the access on the I2C Master
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            ResultType:     Result of the access
+        """
+        i2c_master = self._master_for(self.speed_of(address))
+        self._accesses += 1
+        return access(i2c_master)
+
+    def run_grouped(
+        self,
+        accesses: Sequence[
+            Tuple[int, Callable[[I2CMaster[ProtocolStream]], ResultType]]
+        ],
+    ) -> List[ResultType]:
+        """Run independent accesses grouped by speed tier.
+
+        The current tier is served first, then the remaining tiers
+        in descending speed order. Accesses within a tier keep their order.
+
+        Args:
+            accesses:   (address, access) pairs
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            List[ResultType]:   Results in the order of 'accesses'
+        """
+        current = self._kbps
+
+        def tier_key(idx: int) -> Tuple[bool, int]:
+            kbps = self.speed_of(accesses[idx][0])
+            return (kbps != current, -kbps)
+
+        results: List[Any] = [None] * len(accesses)
+        for idx in sorted(range(len(accesses)), key=tier_key):
+            address, access = accesses[idx]
+            results[idx] = self.run(address, access)
+
+        return results
+
+    def get_stats(self) -> SessionStats:
+        """Get the session counters.
+
+        Returns:
+            SessionStats:   Counters since the creation of the session
+        """
+        return SessionStats(
+            self._accesses, self._reconfigurations, self._reconfiguration_seconds
+        )
+
+    def close(self) -> None:
+        """Un-initialize the I2C Master, the stream can be used in any mode again.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        if self._i2c_master is not None:
+            self._i2c_master.uninitialize()
+            self._i2c_master = None
+            self._kbps = None
+
+    def _master_for(self, kbps: int) -> I2CMaster[ProtocolStream]:
+        if self._i2c_master is not None and self._kbps == kbps:
+            return self._i2c_master
+
+        start = time.perf_counter()
+        self.close()
+        i2c_master = self._stream.init_i2c_master(kbps)
+        if self._configure is not None:
+            self._configure(i2c_master)
+        self._i2c_master = i2c_master
+        self._kbps = kbps
+
+        self._reconfigurations += 1
+        self._reconfiguration_seconds += time.perf_counter() - start
+        return i2c_master
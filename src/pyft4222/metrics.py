@@ -0,0 +1,293 @@
+"""Module implementing lightweight metrics used for instrumentation.
+
+The histograms use fixed bucket bounds, recording a value is a single
+binary search. Snapshots are immutable and can be published or compared
+without holding any lock.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class HistogramSnapshot(NamedTuple):
+    """NamedTuple representing an immutable copy of a histogram."""
+
+    bounds: Tuple[float, ...]
+    """Upper (inclusive) bounds of the buckets, the last bucket is unbounded."""
+    counts: Tuple[int, ...]
+    """Weighted counts, one more than bounds (overflow bucket)."""
+    count: int
+    """Total weight of all recorded values."""
+    total: float
+    """Weighted sum of all recorded values."""
+    minimum: float
+    """Smallest recorded value (NaN if empty)."""
+    maximum: float
+    """Largest recorded value (NaN if empty)."""
+
+    @property
+    def mean(self) -> float:
+        return (self.total / self.count) if self.count > 0 else math.nan
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile from the bucket counts.
+
+        Args:
+            fraction:       Percentile as a fraction;   range <0.0, 1.0>
+
+        Returns:
+            float:          Upper bound of the bucket containing the percentile
+        """
+        if not (0.0 <= fraction <= 1.0):
+            raise ValueError("fraction must be in range <0.0, 1.0>.")
+        if self.count == 0:
+            return math.nan
+
+        threshold = fraction * self.count
+        accumulated = 0
+        for idx, bucket_count in enumerate(self.counts):
+            accumulated += bucket_count
+            if accumulated >= threshold and bucket_count > 0:
+                return self.bounds[idx] if idx < len(self.bounds) else self.maximum
+
+        return self.maximum
+
+
+class Histogram:
+    """A thread-safe histogram with fixed bucket bounds."""
+
+    _bounds: Tuple[float, ...]
+    _counts: List[int]
+    _count: int
+    _total: float
+    _minimum: float
+    _maximum: float
+    _lock: threading.Lock
+
+    def __init__(self, bounds: Sequence[float]):
+        """Initialize the histogram with the given bucket bounds.
+
+        Args:
+            bounds:     Strictly increasing upper bucket bounds
+        """
+        if len(bounds) == 0 or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("bounds must be a non-empty increasing sequence.")
+
+        self._bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def exponential(
+        cls, start: float, factor: float = 2.0, bucket_count: int = 24
+    ) -> "Histogram":
+        """Create a histogram with exponentially growing bucket bounds.
+
+        Args:
+            start:          Upper bound of the first bucket
+            factor:         Ratio of two neighbouring bounds
+            bucket_count:   Number of bounded buckets
+
+        Returns:
+            Histogram:      Empty histogram
+        """
+        return cls([start * (factor ** idx) for idx in range(bucket_count)])
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        with self._lock:
+            self._counts = [0] * (len(self._bounds) + 1)
+            self._count = 0
+            self._total = 0.0
+            self._minimum = math.inf
+            self._maximum = -math.inf
+
+    def record(self, value: float, weight: int = 1) -> None:
+        """Record a value.
+
+        Args:
+            value:      Value to record
+            weight:     Number of occurrences of the value
+        """
+        idx = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[idx] += weight
+            self._count += weight
+            self._total += value * weight
+            if value < self._minimum:
+                self._minimum = value
+            if value > self._maximum:
+                self._maximum = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get an immutable copy of the histogram.
+
+        Returns:
+            HistogramSnapshot:  Copy of the current histogram state
+        """
+        with self._lock:
+            empty = self._count == 0
+            return HistogramSnapshot(
+                self._bounds,
+                tuple(self._counts),
+                self._count,
+                self._total,
+                math.nan if empty else self._minimum,
+                math.nan if empty else self._maximum,
+            )
+
+
+class SlaveMonitorSnapshot(NamedTuple):
+    """NamedTuple representing the state of a 'SlaveMonitor'."""
+
+    latency: HistogramSnapshot
+    """Time (s) from the first poll reporting a byte to its read (per byte)."""
+    arrival_window: HistogramSnapshot
+    """Time (s) between the two polls bracketing a byte's arrival (per byte).
+
+    Adding it to 'latency' gives the upper bound of the real latency.
+    """
+    queue_depth: HistogramSnapshot
+    """Number of bytes in the Rx queue reported by each poll."""
+    read_size: HistogramSnapshot
+    """Number of bytes returned by each read."""
+    polls: int
+    """Number of observed Rx queue polls."""
+    reads: int
+    """Number of observed reads."""
+
+
+class SlaveMonitor:
+    """A class measuring how long received data wait before being read.
+
+    Attach it to an SPI or I2C Slave using its 'set_monitor()' method.
+    Each 'get_rx_status()' call timestamps newly reported bytes,
+    each read consumes them in FIFO order and records their waiting time.
+
+    Bytes first reported by a poll arrived between that poll and
+    the previous one, this window is recorded as 'arrival_window'.
+    """
+
+    latency: Histogram
+    arrival_window: Histogram
+    queue_depth: Histogram
+    read_size: Histogram
+
+    _lock: threading.Lock
+    _pending: Deque[List[float]]
+    _pending_bytes: int
+    _last_poll: Optional[float]
+    _polls: int
+    _reads: int
+
+    def __init__(self) -> None:
+        self.latency = Histogram.exponential(1e-6)
+        self.arrival_window = Histogram.exponential(1e-6)
+        self.queue_depth = Histogram.exponential(1.0, bucket_count=17)
+        self.read_size = Histogram.exponential(1.0, bucket_count=17)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded data."""
+        for histogram in (
+            self.latency,
+            self.arrival_window,
+            self.queue_depth,
+            self.read_size,
+        ):
+            histogram.reset()
+
+        with self._lock:
+            self._pending = deque()
+            self._pending_bytes = 0
+            self._last_poll = None
+            self._polls = 0
+            self._reads = 0
+
+    def on_rx_status(self, rx_count: int, timestamp: Optional[float] = None) -> None:
+        """Record the result of an Rx queue poll.
+
+        Args:
+            rx_count:       Number of bytes reported in the Rx queue
+            timestamp:      'time.perf_counter()' time of the poll completion
+        """
+        now = time.perf_counter() if timestamp is None else timestamp
+        self.queue_depth.record(rx_count)
+
+        with self._lock:
+            self._polls += 1
+            window_start = self._last_poll if self._last_poll is not None else now
+            self._last_poll = now
+
+            new_bytes = rx_count - self._pending_bytes
+            if new_bytes > 0:
+                self._pending.append([window_start, now, new_bytes])
+                self._pending_bytes = rx_count
+            elif new_bytes < 0:
+                # Data were consumed without being observed (e.g., reset)
+                self._consume(-new_bytes, None)
+
+    def on_read(self, byte_count: int, timestamp: Optional[float] = None) -> None:
+        """Record a completed read.
+
+        Args:
+            byte_count:     Number of bytes returned by the read
+            timestamp:      'time.perf_counter()' time of the read completion
+        """
+        now = time.perf_counter() if timestamp is None else timestamp
+        self.read_size.record(byte_count)
+
+        with self._lock:
+            self._reads += 1
+            unobserved = byte_count - self._pending_bytes
+            if unobserved > 0:
+                # Bytes arrived after the last poll, they waited at most since then
+                window_start = self._last_poll if self._last_poll is not None else now
+                self._pending.append([window_start, now, unobserved])
+                self._pending_bytes += unobserved
+
+            self._consume(byte_count, now)
+
+    def _consume(self, byte_count: int, read_at: Optional[float]) -> None:
+        self._pending_bytes -= byte_count
+        while byte_count > 0 and self._pending:
+            segment = self._pending[0]
+            window_start, first_seen, segment_bytes = segment
+            taken = min(byte_count, int(segment_bytes))
+
+            if read_at is not None:
+                self.latency.record(read_at - first_seen, taken)
+                self.arrival_window.record(first_seen - window_start, taken)
+
+            byte_count -= taken
+            if taken == segment_bytes:
+                self._pending.popleft()
+            else:
+                segment[2] = segment_bytes - taken
+
+        if self._pending_bytes < 0:
+            self._pending_bytes = 0
+
+    def snapshot(self) -> SlaveMonitorSnapshot:
+        """Get an immutable copy of all histograms and counters.
+
+        Returns:
+            SlaveMonitorSnapshot:   Current monitor state
+        """
+        with self._lock:
+            polls = self._polls
+            reads = self._reads
+
+        return SlaveMonitorSnapshot(
+            self.latency.snapshot(),
+            self.arrival_window.snapshot(),
+            self.queue_depth.snapshot(),
+            self.read_size.snapshot(),
+            polls,
+            reads,
+        )
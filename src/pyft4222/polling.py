@@ -0,0 +1,94 @@
+"""Module implementing adaptive polling shared by the status wait helpers.
+
+Every poll of the FT4222 is a USB round-trip. A fixed short interval wastes
+round-trips on long waits, a fixed long interval adds latency to short ones.
+'PollStrategy' polls back-to-back first and then backs off exponentially.
+"""
+
+import time
+from typing import Callable, Iterator, NamedTuple, Optional
+
+
+class PollStrategy(NamedTuple):
+    """NamedTuple representing an adaptive polling schedule."""
+
+    spin_polls: int = 2
+    """Number of initial polls issued back-to-back (without sleeping)."""
+    initial_interval: float = 0.0001
+    """Sleep (in seconds) after the first non-spinning poll."""
+    max_interval: float = 0.002
+    """Maximum sleep (in seconds) between two polls."""
+    growth: float = 2.0
+    """Interval multiplier applied after each sleep."""
+
+    def intervals(self) -> Iterator[float]:
+        """Generate the sleep intervals between consecutive polls.
+
+        Yields:
+            float:      Sleep in seconds (0.0 for back-to-back polls)
+        """
+        for _ in range(self.spin_polls):
+            yield 0.0
+
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.growth, self.max_interval)
+
+
+DEFAULT_STRATEGY: PollStrategy = PollStrategy()
+"""Default polling schedule."""
+
+
+class PollResult(NamedTuple):
+    """NamedTuple representing the outcome of a polling loop."""
+
+    ok: bool
+    """Has the condition been met before the timeout?"""
+    value: int
+    """Last polled value."""
+    polls: int
+    """Number of polls issued."""
+    elapsed: float
+    """Time spent polling in seconds."""
+
+
+def poll_until(
+    read: Callable[[], int],
+    done: Callable[[int], bool],
+    timeout: Optional[float],
+    strategy: PollStrategy = DEFAULT_STRATEGY,
+) -> PollResult:
+    """Poll a value until it satisfies a condition or the timeout expires.
+
+    The value is polled at least once, even with a zero timeout.
+
+    Args:
+        read:       Function returning the polled value
+        done:       Condition the value must satisfy
+        timeout:    Maximum wait in seconds, None waits forever
+        strategy:   Polling schedule
+
+    Returns:
+        PollResult: Outcome, last value and polling statistics
+    """
+    start = time.perf_counter()
+    deadline = (start + timeout) if timeout is not None else None
+    polls = 0
+    intervals = strategy.intervals()
+
+    while True:
+        value = read()
+        polls += 1
+        now = time.perf_counter()
+
+        if done(value):
+            return PollResult(True, value, polls, now - start)
+        if deadline is not None and now >= deadline:
+            return PollResult(False, value, polls, now - start)
+
+        interval = next(intervals)
+        if interval > 0.0:
+            if deadline is not None:
+                interval = min(interval, deadline - now)
+            time.sleep(interval)
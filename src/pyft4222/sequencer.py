@@ -0,0 +1,299 @@
+"""Module implementing a compiled GPIO bit-bang sequencer.
+
+A sequence is declared as a list of 'Step' (port, level, hold) entries.
+'compile_steps()' drops writes which do not change a port state, merges
+their hold times and schedules every remaining write at an absolute offset
+from the sequence start, so timing errors do not accumulate.
+
+'Sequencer' binds the writes to precompiled driver calls (see
+'Gpio.bind_write()') and runs them from a dedicated thread. Long waits
+sleep, the last 'spin_threshold' seconds before each write are busy-waited.
+The lateness of every write against its schedule is recorded.
+
+Note:
+    Each write is a USB round-trip. The achievable resolution is limited
+    by the USB latency (typically hundreds of microseconds), not by Python.
+
+Example:
+    reset_pulse = [
+        Step(PortId.PORT_0, False, 0.001),
+        Step(PortId.PORT_0, True, 0.0),
+    ]
+    with Sequencer(gpio, reset_pulse) as sequencer:
+        pass
+    print(sequencer.get_result())
+"""
+
+import threading
+import time
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pyft4222.gpio import Gpio
+from pyft4222.metrics import Histogram, HistogramSnapshot
+from pyft4222.wrapper.gpio import PortId
+
+
+class Step(NamedTuple):
+    """NamedTuple representing a single sequence step."""
+
+    port: PortId
+    level: bool
+    hold: float
+    """Time (in seconds) from this write to the next step."""
+
+
+class CompiledSequence(NamedTuple):
+    """NamedTuple representing a sequence ready to be run."""
+
+    writes: Tuple[Tuple[PortId, bool], ...]
+    """Port writes which change the port state."""
+    offsets: Tuple[float, ...]
+    """Scheduled time of each write relative to the sequence start (seconds)."""
+    duration: float
+    """Total duration of the sequence including the last hold (seconds)."""
+
+
+class SequenceResult(NamedTuple):
+    """NamedTuple representing the timing achieved by a sequencer run."""
+
+    writes: int
+    """Number of writes issued."""
+    duration: float
+    """Time from the sequence start to the end of the last hold (seconds)."""
+    lateness: HistogramSnapshot
+    """Delay of each write start against its schedule (seconds)."""
+    max_call_time: float
+    """Longest single driver call (seconds)."""
+
+
+def compile_steps(steps: Iterable[Step]) -> CompiledSequence:
+    """Compile steps into a minimal list of scheduled writes.
+
+    Steps setting a port to the level it already has are removed,
+    their hold time is added to the previous write. The first write
+    of each port is always kept (its initial state is unknown).
+
+    Args:
+        steps:      Sequence steps
+
+    Returns:
+        CompiledSequence:   Scheduled writes
+    """
+    writes: List[Tuple[PortId, bool]] = []
+    offsets: List[float] = []
+    levels: Dict[PortId, bool] = {}
+    offset = 0.0
+
+    for step in steps:
+        if step.hold < 0:
+            raise ValueError("hold must not be negative.")
+
+        level = bool(step.level)
+        if levels.get(step.port) != level:
+            levels[step.port] = level
+            writes.append((step.port, level))
+            offsets.append(offset)
+        offset += step.hold
+
+    return CompiledSequence(tuple(writes), tuple(offsets), offset)
+
+
+class Sequencer:
+    """A class running a compiled GPIO sequence from a dedicated thread."""
+
+    _sequence: CompiledSequence
+    _calls: Tuple[Callable[[], None], ...]
+    _spin_threshold: float
+    _repeat: int
+
+    _stop_event: threading.Event
+    _thread: Optional[threading.Thread]
+    _error: Optional[BaseException]
+    _result: Optional[SequenceResult]
+    _lateness: Histogram
+
+    def __init__(
+        self,
+        gpio: Gpio[Any],
+        steps: Iterable[Step],
+        *,
+        spin_threshold: float = 0.002,
+        repeat: int = 1,
+    ):
+        """Compile the steps and bind them to the given GPIO.
+
+        Args:
+            gpio:           Initialized GPIO, used ports configured as outputs
+            steps:          Sequence steps
+            spin_threshold: Busy-wait this long (in seconds) before each write,
+                            longer waits sleep first
+            repeat:         Number of back-to-back sequence repetitions
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        if spin_threshold < 0:
+            raise ValueError("spin_threshold must not be negative.")
+        if repeat <= 0:
+            raise ValueError("repeat must be a positive number.")
+
+        self._sequence = compile_steps(steps)
+        self._calls = tuple(
+            gpio.bind_write(port, level) for port, level in self._sequence.writes
+        )
+        self._spin_threshold = spin_threshold
+        self._repeat = repeat
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._result = None
+        self._lateness = Histogram.exponential(0.00001)
+
+    def __enter__(self) -> "Sequencer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        self.join()
+        return False
+
+    @property
+    def sequence(self) -> CompiledSequence:
+        """Compiled sequence."""
+        return self._sequence
+
+    def run(self) -> SequenceResult:
+        """Run the sequence in the calling thread.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            SequenceResult:     Achieved timing
+        """
+        self._stop_event.clear()
+        self._lateness.reset()
+        self._result = self._run()
+        return self._result
+
+    def start(self) -> None:
+        """Start running the sequence in a dedicated thread."""
+        if self._thread is not None:
+            raise RuntimeError("Sequencer is already running!")
+
+        self._stop_event.clear()
+        self._error = None
+        self._result = None
+        self._lateness.reset()
+        self._thread = threading.Thread(
+            target=self._thread_main, name="pyft4222-sequencer", daemon=True
+        )
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> Optional[SequenceResult]:
+        """Wait for the sequence started by 'start()' to finish.
+
+        Args:
+            timeout:    Maximum wait in seconds, None waits forever
+
+        Raises:
+            Ft4222Exception:    If the sequence failed on a device error
+
+        Returns:
+            Optional[SequenceResult]:   Achieved timing, None on timeout
+        """
+        if self._thread is None:
+            return self._result
+
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return None
+        self._thread = None
+
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def stop(self) -> Optional[SequenceResult]:
+        """Abort the sequence after the current write and wait for the thread.
+
+        Raises:
+            Ft4222Exception:    If the sequence failed on a device error
+
+        Returns:
+            Optional[SequenceResult]:   Achieved timing of the issued writes
+        """
+        self._stop_event.set()
+        return self.join()
+
+    def get_result(self) -> Optional[SequenceResult]:
+        """Get the timing of the last finished run, None if there is none."""
+        return self._result
+
+    def _thread_main(self) -> None:
+        try:
+            self._result = self._run()
+        except BaseException as e:
+            self._error = e
+
+    def _run(self) -> SequenceResult:
+        calls = self._calls
+        offsets = self._sequence.offsets
+        period = self._sequence.duration
+        spin_threshold = self._spin_threshold
+        stop_event = self._stop_event
+        perf_counter = time.perf_counter
+        lateness = self._lateness
+        max_call_time = 0.0
+        writes = 0
+
+        stopped = False
+        start = perf_counter()
+        for repetition in range(self._repeat):
+            if stopped:
+                break
+            base = start + repetition * period
+            for call, offset in zip(calls, offsets):
+                target = base + offset
+                remaining = target - perf_counter()
+                if remaining > spin_threshold and stop_event.wait(
+                    remaining - spin_threshold
+                ):
+                    stopped = True
+                    break
+                while perf_counter() < target:
+                    pass
+
+                issued = perf_counter()
+                call()
+                done = perf_counter()
+                lateness.record(issued - target)
+                max_call_time = max(max_call_time, done - issued)
+                writes += 1
+
+        # Keep the last level for its hold time
+        end = start + self._repeat * period
+        remaining = end - perf_counter()
+        if remaining > 0 and not stopped:
+            stop_event.wait(remaining)
+
+        return SequenceResult(
+            writes, perf_counter() - start, lateness.snapshot(), max_call_time
+        )
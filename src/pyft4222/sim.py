@@ -0,0 +1,283 @@
+"""Module implementing simulated FT4222 endpoints for hardware-less testing.
+
+The simulated classes implement the same methods as their hardware
+counterparts (e.g., 'SimSpiMaster' mirrors 'SpiMasterSingle'), so code
+written against the real handles can be run in CI without a device.
+"""
+
+import threading
+import time
+
+from pyft4222.wrapper import WritableBuffer
+from pyft4222.wrapper.common import ClockRate
+from pyft4222.wrapper.gpio import PortId
+from pyft4222.wrapper.spi.master import ClkDiv
+
+
+class SimSpiLink:
+    """An in-memory SPI link between a simulated master and a simulated slave.
+
+    Data written by the master are appended to the slave Rx queue,
+    data written by the slave are shifted out on the next master transfers.
+
+    Attributes:
+        master:     Master side of the link (mirrors 'SpiMasterSingle')
+        slave:      Slave side of the link (mirrors 'SpiSlaveRaw')
+    """
+
+    master: "SimSpiMaster"
+    slave: "SimSpiSlave"
+
+    clk_rate: ClockRate
+    clk_div: ClkDiv
+    realtime: bool
+    rx_capacity: int
+    corrupt_every: int
+    overflowed_bytes: int
+
+    _lock: threading.Lock
+    _rx_queue: bytearray
+    _tx_queue: bytearray
+    _byte_counter: int
+
+    def __init__(
+        self,
+        clk_rate: ClockRate = ClockRate.SYS_CLK_60,
+        clk_div: ClkDiv = ClkDiv.CLK_DIV_16,
+        *,
+        realtime: bool = False,
+        rx_capacity: int = 2 ** 20,
+        corrupt_every: int = 0,
+    ):
+        """Initialize the simulated link.
+
+        Args:
+            clk_rate:       Simulated system clock rate
+            clk_div:        Simulated SPI clock divisor
+            realtime:       Block the master for the duration of each transfer?
+            rx_capacity:    Slave Rx queue size, excess bytes are dropped
+            corrupt_every:  Invert every n-th transferred byte (0 disables)
+        """
+        self.clk_rate = clk_rate
+        self.clk_div = clk_div
+        self.realtime = realtime
+        self.rx_capacity = rx_capacity
+        self.corrupt_every = corrupt_every
+        self.overflowed_bytes = 0
+
+        self._lock = threading.Lock()
+        self._rx_queue = bytearray()
+        self._tx_queue = bytearray()
+        self._byte_counter = 0
+
+        self.master = SimSpiMaster(self)
+        self.slave = SimSpiSlave(self)
+
+    @property
+    def spi_clock(self) -> float:
+        """Simulated SPI clock frequency in Hz."""
+        return self.clk_rate.frequency / self.clk_div.divisor
+
+    def _transfer(self, mosi: bytes) -> bytes:
+        if self.realtime:
+            deadline = time.perf_counter() + (len(mosi) * 8) / self.spi_clock
+            while time.perf_counter() < deadline:
+                pass
+
+        with self._lock:
+            data = bytearray(mosi)
+            if self.corrupt_every > 0:
+                first = (-self._byte_counter) % self.corrupt_every
+                for idx in range(first, len(data), self.corrupt_every):
+                    data[idx] ^= 0xFF
+            self._byte_counter += len(data)
+
+            free = self.rx_capacity - len(self._rx_queue)
+            if len(data) > free:
+                self.overflowed_bytes += len(data) - free
+                del data[free:]
+            self._rx_queue += data
+
+            miso = bytes(self._tx_queue[: len(mosi)])
+            del self._tx_queue[: len(mosi)]
+
+        return miso.ljust(len(mosi), b"\x00")
+
+
+class SimSpiMaster:
+    """Simulated SPI Master in single I/O mode."""
+
+    _link: SimSpiLink
+
+    def __init__(self, link: SimSpiLink):
+        self._link = link
+
+    def single_write(self, write_data: bytes, end_transaction: bool = True) -> int:
+        """Write data to the simulated SPI slave.
+
+        Args:
+            write_data:         Non-empty list of data to write
+            end_transaction:    Ignored
+
+        Returns:
+            int:                Number of bytes written
+        """
+        if len(write_data) == 0:
+            raise ValueError("write_data must not be empty.")
+
+        self._link._transfer(bytes(write_data))
+        return len(write_data)
+
+    def single_read_write(
+        self, write_data: bytes, end_transaction: bool = True
+    ) -> bytes:
+        """Write and read data concurrently from the simulated SPI slave.
+
+        Args:
+            write_data:         Non-empty list of data to write
+            end_transaction:    Ignored
+
+        Returns:
+            bytes:              Read data (zeros when the slave Tx queue is empty)
+        """
+        if len(write_data) == 0:
+            raise ValueError("write_data must not be empty.")
+
+        return self._link._transfer(bytes(write_data))
+
+
+class SimSpiSlave:
+    """Simulated SPI Slave in raw mode."""
+
+    _link: SimSpiLink
+
+    def __init__(self, link: SimSpiLink):
+        self._link = link
+
+    def get_rx_status(self) -> int:
+        """Get number of bytes in the Rx queue.
+
+        Returns:
+            int:                Number of bytes in the Rx queue
+        """
+        with self._link._lock:
+            return len(self._link._rx_queue)
+
+    def read(self, read_byte_count: int) -> bytes:
+        """Read data from the Rx queue.
+
+        Args:
+            read_byte_count:    Number of bytes to read;    range <1, 65_535>
+
+        Returns:
+            bytes:              Read data
+        """
+        buffer = bytearray(read_byte_count)
+        return bytes(buffer[: self.readinto(buffer)])
+
+    def readinto(self, buffer: WritableBuffer) -> int:
+        """Read data from the Rx queue into the given buffer.
+
+        Args:
+            buffer:             Writable buffer to read into;   size <1, 65_535>
+
+        Returns:
+            int:                Number of bytes read into the buffer
+        """
+        view = memoryview(buffer).cast("B")
+        if not (0 < len(view) < (2 ** 16)):
+            raise ValueError("buffer size must be in range <1, 65_535>.")
+
+        with self._link._lock:
+            rx_queue = self._link._rx_queue
+            count = min(len(view), len(rx_queue))
+            view[:count] = rx_queue[:count]
+            del rx_queue[:count]
+
+        return count
+
+    def write(self, write_data: bytes) -> int:
+        """Write data into the Tx queue.
+
+        Args:
+            write_data:     Non-empty list of bytes to write;   length <1, 65_535>
+
+        Returns:
+            int:            Number of bytes written
+        """
+        if not (0 < len(write_data) < (2 ** 16)):
+            raise ValueError("write_data length must be in range <1, 65_535>.")
+
+        with self._link._lock:
+            self._link._tx_queue += write_data
+
+        return len(write_data)
+
+
+class SimGpio:
+    """Simulated GPIO (mirrors 'Gpio'), all four ports looped back.
+
+    Attributes:
+        call_latency:   Simulated duration of each driver call (seconds)
+        driver_calls:   Number of simulated driver calls issued so far
+    """
+
+    call_latency: float
+    driver_calls: int
+
+    _states: int
+    _shadow: int
+    _shadow_valid: int
+
+    def __init__(self, call_latency: float = 0.0):
+        """Initialize the simulated GPIO.
+
+        Args:
+            call_latency:   Simulated duration of each driver call (e.g., USB
+                            round-trip) in seconds, 0.0 disables the delay
+        """
+        self.call_latency = call_latency
+        self.driver_calls = 0
+        self._states = 0
+        self._shadow = 0
+        self._shadow_valid = 0
+
+    def _driver_call(self) -> None:
+        self.driver_calls += 1
+        if self.call_latency > 0.0:
+            end = time.perf_counter() + self.call_latency
+            while time.perf_counter() < end:
+                pass
+
+    def read(self, port_id: PortId) -> bool:
+        """Read state of the given GPIO port."""
+        self._driver_call()
+        return bool(self._states & (1 << port_id))
+
+    def write(self, port_id: PortId, state: bool) -> None:
+        """Set state of the given GPIO port."""
+        self._driver_call()
+        bit = 1 << port_id
+        self._states = (self._states | bit) if state else (self._states & ~bit)
+        self._shadow = self._states
+        self._shadow_valid |= bit
+
+    def read_all(self) -> int:
+        """Read states of all GPIO ports (one driver call per port)."""
+        for _ in PortId:
+            self._driver_call()
+        return self._states
+
+    def write_mask(self, mask: int, states: int) -> int:
+        """Set states of the ports selected by a bit mask, see 'Gpio.write_mask()'."""
+        if not (0 <= mask < (2 ** len(PortId))):
+            raise ValueError("mask must be in range <0, 15>.")
+
+        changed = mask & (~self._shadow_valid | (self._shadow ^ states))
+        for port_id in PortId:
+            if changed & (1 << port_id):
+                self._driver_call()
+        self._states = (self._states & ~changed) | (states & changed)
+        self._shadow = self._states
+        self._shadow_valid |= changed
+        return changed
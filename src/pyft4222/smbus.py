@@ -0,0 +1,529 @@
+"""Module implementing an 'smbus2'-compatible facade over the I2C Master.
+
+Drivers written against 'smbus2.SMBus' can be used unchanged,
+only the bus construction differs:
+
+    with handle.init_i2c_master(400) as i2c_master:
+        bus = SMBus(i2c_master)
+        value = bus.read_byte_data(0x40, 0x01)
+
+Errors are reported the same way as by the Linux I2C driver,
+'OSError' with 'errno.EREMOTEIO' for not acknowledged transfers,
+'errno.EBADMSG' for Packet Error Code mismatches,
+'errno.EPROTO' for a block byte count above 'I2C_SMBUS_BLOCK_MAX',
+'errno.ETIMEDOUT' for a controller which does not finish the transaction
+and 'errno.EIO' for other transfer failures.
+"""
+
+import errno
+import os
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pyft4222.i2c.master import I2CMaster
+from pyft4222.wrapper import Ft4222Exception
+from pyft4222.wrapper.i2c.master import CtrlStatus, TransactionFlag
+
+I2C_M_RD: int = 0x0001
+"""'i2c_msg' flag marking a read message."""
+I2C_SMBUS_BLOCK_MAX: int = 32
+"""Maximum SMBus block length."""
+_IDLE_TIMEOUT: float = 0.1
+"""Maximum time (in seconds) to wait for the controller to finish a transaction."""
+
+
+def _crc8_table() -> bytes:
+    table = bytearray(256)
+    for idx in range(256):
+        crc = idx
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1)
+        table[idx] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE: bytes = _crc8_table()
+"""CRC-8 (polynomial x^8 + x^2 + x + 1) lookup table used by SMBus PEC."""
+
+_Message = Tuple[int, Union[bytes, int]]
+"""Transfer message: (address, bytes to write or number of bytes to read)."""
+ResultType = TypeVar("ResultType")
+
+
+def crc8(data: Union[bytes, bytearray, memoryview], crc: int = 0) -> int:
+    """Compute the SMBus Packet Error Code (CRC-8) of the given data.
+
+    Args:
+        data:       Data to compute the PEC of
+        crc:        PEC of the preceding data (allows incremental computation)
+
+    Returns:
+        int:        PEC value
+    """
+    table = _CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+class i2c_msg:
+    """A single message of an 'SMBus.i2c_rdwr()' transfer.
+
+    Mirrors 'smbus2.i2c_msg'. Use 'i2c_msg.read()' and 'i2c_msg.write()'
+    to create messages.
+    """
+
+    __slots__ = ("addr", "flags", "len", "buf")
+
+    addr: int
+    flags: int
+    len: int
+    buf: bytearray
+
+    def __init__(self, addr: int, flags: int, buf: bytearray):
+        self.addr = addr
+        self.flags = flags
+        self.len = len(buf)
+        self.buf = buf
+
+    @staticmethod
+    def read(address: int, length: int) -> "i2c_msg":
+        """Create a read message.
+
+        Args:
+            address:    I2C slave address
+            length:     Number of bytes to read;    range <1, 65_535>
+
+        Returns:
+            i2c_msg:    Message, 'buf' contains the read data after the transfer
+        """
+        return i2c_msg(address, I2C_M_RD, bytearray(length))
+
+    @staticmethod
+    def write(address: int, buf: Union[bytes, str, Sequence[int]]) -> "i2c_msg":
+        """Create a write message.
+
+        Args:
+            address:    I2C slave address
+            buf:        Data to write (a 'str' is encoded as UTF-8)
+
+        Returns:
+            i2c_msg:    Message
+        """
+        data = buf.encode() if isinstance(buf, str) else bytes(buf)
+        return i2c_msg(address, 0, bytearray(data))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.buf[: self.len])
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.buf[: self.len])
+
+    def __repr__(self) -> str:
+        return f"i2c_msg({self.addr}, {self.flags}, {bytes(self)!r})"
+
+
+class SMBus:
+    """A class implementing the 'smbus2.SMBus' interface using an I2C Master.
+
+    The 'force' arguments are accepted for compatibility and ignored,
+    there is no kernel driver owning the slaves.
+    """
+
+    pec: bool
+    """Use SMBus Packet Error Checking?
+
+    Applies to all SMBus transactions except quick commands,
+    I2C block transfers and 'i2c_rdwr()', like the Linux I2C driver.
+    """
+
+    _i2c_master: Optional[I2CMaster[Any]]
+
+    def __init__(self, i2c_master: I2CMaster[Any], pec: bool = False):
+        """Initialize the bus with an initialized I2C Master.
+
+        Args:
+            i2c_master:     I2C Master used for all transfers
+            pec:            Enable Packet Error Checking?
+        """
+        self._i2c_master = i2c_master
+        self.pec = pec
+
+    def __enter__(self) -> "SMBus":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Release the I2C Master.
+
+        The I2C Master itself is left initialized, it is owned by the caller.
+        """
+        self._i2c_master = None
+
+    def write_quick(self, i2c_addr: int, force: Optional[bool] = None) -> None:
+        """Perform a quick transaction (address only).
+
+        Warning:
+            The FT4222 driver rejects zero-length writes. A single zero byte
+            is written instead, which sets the register pointer of most
+            devices and writes a register of some (e.g., command-only
+            devices). Use 'read_byte()' or 'I2CMaster.probe()' to detect
+            devices without side effects.
+
+        Args:
+            i2c_addr:   I2C slave address
+            force:      Ignored
+        """
+        self._transfer([(i2c_addr, b"\x00")])
+
+    def read_byte(self, i2c_addr: int, force: Optional[bool] = None) -> int:
+        """Read a single byte from a device.
+
+        Args:
+            i2c_addr:   I2C slave address
+            force:      Ignored
+
+        Returns:
+            int:        Read byte value
+        """
+        return self._smbus([(i2c_addr, 1)])[0]
+
+    def write_byte(
+        self, i2c_addr: int, value: int, force: Optional[bool] = None
+    ) -> None:
+        """Write a single byte to a device.
+
+        Args:
+            i2c_addr:   I2C slave address
+            value:      Byte value to write
+            force:      Ignored
+        """
+        self._smbus([(i2c_addr, bytes((value,)))])
+
+    def read_byte_data(
+        self, i2c_addr: int, register: int, force: Optional[bool] = None
+    ) -> int:
+        """Read a single byte from a designated register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to read
+            force:      Ignored
+
+        Returns:
+            int:        Read byte value
+        """
+        return self._smbus([(i2c_addr, bytes((register,))), (i2c_addr, 1)])[0]
+
+    def write_byte_data(
+        self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
+    ) -> None:
+        """Write a single byte to a designated register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to write
+            value:      Byte value to write
+            force:      Ignored
+        """
+        self._smbus([(i2c_addr, bytes((register, value)))])
+
+    def read_word_data(
+        self, i2c_addr: int, register: int, force: Optional[bool] = None
+    ) -> int:
+        """Read a single little-endian word from a designated register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to read
+            force:      Ignored
+
+        Returns:
+            int:        Read 16-bit value
+        """
+        data = self._smbus([(i2c_addr, bytes((register,))), (i2c_addr, 2)])
+        return int.from_bytes(data, "little")
+
+    def write_word_data(
+        self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
+    ) -> None:
+        """Write a single little-endian word to a designated register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to write
+            value:      16-bit value to write
+            force:      Ignored
+        """
+        self._smbus(
+            [(i2c_addr, bytes((register,)) + (value & 0xFFFF).to_bytes(2, "little"))]
+        )
+
+    def process_call(
+        self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
+    ) -> int:
+        """Write a word to a register and read a word back in one transaction.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to use
+            value:      16-bit value to write
+            force:      Ignored
+
+        Returns:
+            int:        Read 16-bit value
+        """
+        data = self._smbus(
+            [
+                (
+                    i2c_addr,
+                    bytes((register,)) + (value & 0xFFFF).to_bytes(2, "little"),
+                ),
+                (i2c_addr, 2),
+            ]
+        )
+        return int.from_bytes(data, "little")
+
+    def read_block_data(
+        self, i2c_addr: int, register: int, force: Optional[bool] = None
+    ) -> List[int]:
+        """Read an SMBus block (byte count followed by data) from a register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to read
+            force:      Ignored
+
+        Returns:
+            List[int]:  Read block data (without the byte count)
+        """
+        return list(self._block_read(i2c_addr, bytes((register,))))
+
+    def write_block_data(
+        self,
+        i2c_addr: int,
+        register: int,
+        data: Sequence[int],
+        force: Optional[bool] = None,
+    ) -> None:
+        """Write an SMBus block (byte count followed by data) to a register.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to write
+            data:       Block data;     length <0, 32>
+            force:      Ignored
+        """
+        if len(data) > I2C_SMBUS_BLOCK_MAX:
+            raise ValueError("data length must be in range <0, 32>.")
+
+        self._smbus([(i2c_addr, bytes((register, len(data))) + bytes(data))])
+
+    def block_process_call(
+        self,
+        i2c_addr: int,
+        register: int,
+        data: Sequence[int],
+        force: Optional[bool] = None,
+    ) -> List[int]:
+        """Write an SMBus block to a register and read a block back.
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to use
+            data:       Block data to write;    length <0, 32>
+            force:      Ignored
+
+        Returns:
+            List[int]:  Read block data (without the byte count)
+        """
+        if len(data) > I2C_SMBUS_BLOCK_MAX:
+            raise ValueError("data length must be in range <0, 32>.")
+
+        return list(
+            self._block_read(i2c_addr, bytes((register, len(data))) + bytes(data))
+        )
+
+    def read_i2c_block_data(
+        self, i2c_addr: int, register: int, length: int, force: Optional[bool] = None
+    ) -> List[int]:
+        """Read a fixed number of bytes from a register (no byte count).
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to read
+            length:     Number of bytes to read;    range <1, 32>
+            force:      Ignored
+
+        Returns:
+            List[int]:  Read data
+        """
+        if not (0 < length <= I2C_SMBUS_BLOCK_MAX):
+            raise ValueError("length must be in range <1, 32>.")
+
+        return list(
+            self._transfer([(i2c_addr, bytes((register,))), (i2c_addr, length)])[0]
+        )
+
+    def write_i2c_block_data(
+        self,
+        i2c_addr: int,
+        register: int,
+        data: Sequence[int],
+        force: Optional[bool] = None,
+    ) -> None:
+        """Write data to a register (no byte count).
+
+        Args:
+            i2c_addr:   I2C slave address
+            register:   Register to write
+            data:       Data to write;  length <0, 32>
+            force:      Ignored
+        """
+        if len(data) > I2C_SMBUS_BLOCK_MAX:
+            raise ValueError("data length must be in range <0, 32>.")
+
+        self._transfer([(i2c_addr, bytes((register,)) + bytes(data))])
+
+    def i2c_rdwr(self, *i2c_msgs: i2c_msg) -> None:
+        """Combine messages into a single transaction.
+
+        Each message starts with a (repeated) START condition,
+        the last one ends with a STOP condition.
+        Read messages are filled in place.
+
+        Args:
+            i2c_msgs:   Messages created by 'i2c_msg.read()' or 'i2c_msg.write()'
+        """
+        if len(i2c_msgs) == 0:
+            return
+
+        results = self._transfer(
+            [
+                (msg.addr, msg.len if msg.flags & I2C_M_RD else bytes(msg.buf))
+                for msg in i2c_msgs
+            ]
+        )
+        for msg, data in zip((m for m in i2c_msgs if m.flags & I2C_M_RD), results):
+            msg.buf[: len(data)] = data
+
+    def _block_read(self, i2c_addr: int, header: bytes) -> bytes:
+        i2c_master = self._get_master()
+
+        pec = self.pec
+
+        def transaction() -> bytes:
+            i2c_master.write_ex(i2c_addr, TransactionFlag.START, header)
+            count = i2c_master.read_ex(i2c_addr, TransactionFlag.REPEATED_START, 1)[0]
+            if count > I2C_SMBUS_BLOCK_MAX:
+                # Release the bus, the block itself is not read
+                i2c_master.read_ex(i2c_addr, TransactionFlag.STOP, 1)
+                raise OSError(errno.EPROTO, os.strerror(errno.EPROTO))
+            # A STOP condition is bound to a transfer of at least one byte
+            tail = i2c_master.read_ex(
+                i2c_addr, TransactionFlag.STOP, max(count + int(pec), 1)
+            )
+            if pec:
+                expected = crc8(bytes((i2c_addr << 1,)) + header)
+                expected = crc8(bytes(((i2c_addr << 1) | 1, count)), expected)
+                if crc8(memoryview(tail)[:count], expected) != tail[count]:
+                    raise OSError(errno.EBADMSG, os.strerror(errno.EBADMSG))
+            return tail[:count]
+
+        return self._run(i2c_master, transaction)
+
+    def _smbus(self, messages: Sequence[_Message]) -> bytes:
+        """Run an SMBus transaction, with PEC if enabled.
+
+        Returns:
+            bytes:      Data of the final read message (empty for writes)
+        """
+        if not self.pec:
+            results = self._transfer(messages)
+            return results[0] if results else b""
+
+        address, last = messages[-1]
+        pec = 0
+        for msg_address, data in messages[:-1]:
+            assert not isinstance(data, int)
+            pec = crc8(data, crc8(bytes((msg_address << 1,)), pec))
+
+        if isinstance(last, int):
+            data = self._transfer([*messages[:-1], (address, last + 1)])[0]
+            pec = crc8(bytes(((address << 1) | 1,)), pec)
+            if crc8(memoryview(data)[:last], pec) != data[last]:
+                raise OSError(errno.EBADMSG, os.strerror(errno.EBADMSG))
+            return data[:last]
+
+        pec = crc8(last, crc8(bytes((address << 1,)), pec))
+        self._transfer([*messages[:-1], (address, last + bytes((pec,)))])
+        return b""
+
+    def _transfer(self, messages: Sequence[_Message]) -> List[bytes]:
+        i2c_master = self._get_master()
+
+        last = len(messages) - 1
+        flags = [
+            (TransactionFlag.START if idx == 0 else TransactionFlag.REPEATED_START)
+            | (TransactionFlag.STOP if idx == last else 0)
+            for idx in range(len(messages))
+        ]
+
+        def transaction() -> List[bytes]:
+            results: List[bytes] = []
+            for (address, data), flag in zip(messages, flags):
+                if isinstance(data, int):
+                    results.append(i2c_master.read_ex(address, flag, data))
+                else:
+                    i2c_master.write_ex(address, flag, data)
+            return results
+
+        return self._run(i2c_master, transaction)
+
+    def _run(
+        self, i2c_master: I2CMaster[Any], transaction: Callable[[], ResultType]
+    ) -> ResultType:
+        try:
+            result = transaction()
+            wait = i2c_master.wait_idle(_IDLE_TIMEOUT)
+        except Ft4222Exception as e:
+            i2c_master.reset()
+            raise OSError(errno.EIO, os.strerror(errno.EIO)) from e
+
+        status = wait.status
+        if not wait.ok:
+            i2c_master.reset()
+            raise OSError(errno.ETIMEDOUT, os.strerror(errno.ETIMEDOUT))
+
+        if status & (CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.DATA_NACK):
+            i2c_master.reset()
+            raise OSError(errno.EREMOTEIO, os.strerror(errno.EREMOTEIO))
+        if status & (CtrlStatus.ERROR | CtrlStatus.ARBITRATION_LOST):
+            i2c_master.reset()
+            raise OSError(errno.EIO, os.strerror(errno.EIO))
+
+        return result
+
+    def _get_master(self) -> I2CMaster[Any]:
+        if self._i2c_master is None:
+            raise OSError(errno.EBADF, "SMBus has been closed!")
+        return self._i2c_master
@@ -0,0 +1,296 @@
+"""Module bridging the SPI Slave in raw mode to asyncio streams.
+
+The SPI Slave functions are blocking. Instead of wrapping every call in
+'loop.run_in_executor()', a single I/O thread per device polls the Rx queue,
+feeds the received data into an 'asyncio.StreamReader' and drains the data
+written into an 'asyncio.StreamWriter' strictly in order.
+
+Example:
+    reader, writer = await open_spi_slave_stream(spi_slave)
+    writer.write(bytes([0x01, 0x02]))
+    await writer.drain()
+    data = await reader.read(64)
+"""
+
+import asyncio
+import errno
+import threading
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+from pyft4222.spi.slave import SpiSlaveRaw
+
+_DEFAULT_LIMIT: int = 2 ** 16
+"""Default StreamReader buffer limit (in bytes)."""
+_DEFAULT_POLL_INTERVAL: float = 0.001
+"""Default Rx queue poll interval (in seconds) of an idle I/O thread."""
+_MAX_TRANSFER_SIZE: int = (2 ** 16) - 1
+"""Maximum number of bytes transferred by a single driver call."""
+_MAX_PENDING_DELIVERIES: int = 2
+"""Maximum number of Rx reads waiting for the event loop to deliver them."""
+
+
+class _SpiSlaveTransport(asyncio.Transport):
+    """An asyncio transport backed by a dedicated SPI Slave I/O thread.
+
+    All protocol callbacks are executed in the event loop thread.
+    All driver calls are executed in the I/O thread.
+
+    The I/O thread does not read the Rx queue while reading is paused
+    or while '_MAX_PENDING_DELIVERIES' reads wait for the event loop,
+    so a busy or paused reader applies backpressure to the device.
+    Tx data are written by driver calls of at most '_MAX_TRANSFER_SIZE'
+    bytes, the Rx queue is serviced between the calls.
+    """
+
+    _loop: asyncio.AbstractEventLoop
+    _spi_slave: SpiSlaveRaw[Any]
+    _protocol: asyncio.Protocol
+    _poll_interval: float
+    _cond: threading.Condition
+    _tx_queue: Deque[bytes]
+    _tx_size: int
+    _high_water: int
+    _low_water: int
+    _write_paused: bool
+    _reading: bool
+    _deliveries: int
+    _closing: bool
+    _aborted: bool
+    _thread: threading.Thread
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        spi_slave: SpiSlaveRaw[Any],
+        protocol: asyncio.Protocol,
+        poll_interval: float,
+    ):
+        super().__init__(extra={"spi_slave": spi_slave})
+        self._loop = loop
+        self._spi_slave = spi_slave
+        self._protocol = protocol
+        self._poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._tx_queue = deque()
+        self._tx_size = 0
+        self._high_water = 4 * _DEFAULT_LIMIT
+        self._low_water = _DEFAULT_LIMIT
+        self._write_paused = False
+        self._reading = True
+        self._deliveries = 0
+        self._closing = False
+        self._aborted = False
+        self._thread = threading.Thread(
+            target=self._run, name="pyft4222-spi-slave-io", daemon=True
+        )
+
+    def _start(self) -> None:
+        self._protocol.connection_made(self)
+        self._thread.start()
+
+    # Event loop side
+
+    def write(self, data: Any) -> None:
+        if self._closing:
+            raise RuntimeError("SPI Slave transport is closing!")
+        if not data:
+            return
+
+        with self._cond:
+            self._tx_queue.append(bytes(data))
+            self._tx_size += len(data)
+            self._cond.notify()
+
+        self._maybe_pause_protocol()
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def write_eof(self) -> None:
+        raise NotImplementedError("SPI Slave stream cannot be half-closed!")
+
+    def get_write_buffer_size(self) -> int:
+        with self._cond:
+            return self._tx_size
+
+    def get_write_buffer_limits(self) -> Tuple[int, int]:
+        return (self._low_water, self._high_water)
+
+    def set_write_buffer_limits(
+        self, high: Optional[int] = None, low: Optional[int] = None
+    ) -> None:
+        if high is None:
+            high = 4 * _DEFAULT_LIMIT if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not (0 <= low <= high):
+            raise ValueError("Write buffer limits must satisfy 0 <= low <= high.")
+
+        self._high_water = high
+        self._low_water = low
+        self._maybe_pause_protocol()
+        self._maybe_resume_protocol()
+
+    def pause_reading(self) -> None:
+        with self._cond:
+            self._reading = False
+
+    def resume_reading(self) -> None:
+        with self._cond:
+            self._reading = True
+            self._cond.notify()
+
+    def is_reading(self) -> bool:
+        return self._reading and not self._closing
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        """Close the transport after all buffered data has been written."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+
+    def abort(self) -> None:
+        """Close the transport immediately, discarding buffered data."""
+        with self._cond:
+            self._closing = True
+            self._aborted = True
+            self._tx_queue.clear()
+            self._tx_size = 0
+            self._cond.notify()
+
+    def _maybe_pause_protocol(self) -> None:
+        if not self._write_paused and self.get_write_buffer_size() > self._high_water:
+            self._write_paused = True
+            self._protocol.pause_writing()
+
+    def _maybe_resume_protocol(self) -> None:
+        if self._write_paused and self.get_write_buffer_size() <= self._low_water:
+            self._write_paused = False
+            self._protocol.resume_writing()
+
+    def _deliver(self, data: bytes) -> None:
+        try:
+            self._protocol.data_received(data)
+        finally:
+            # After 'data_received()', which may have paused reading
+            with self._cond:
+                self._deliveries -= 1
+                self._cond.notify()
+
+    def _connection_lost(self, exc: Optional[BaseException]) -> None:
+        self._closing = True
+        if self._write_paused:
+            self._write_paused = False
+            self._protocol.resume_writing()
+        self._protocol.connection_lost(exc)
+
+    # I/O thread side
+
+    def _run(self) -> None:
+        exc: Optional[BaseException] = None
+        try:
+            self._io_loop()
+        except BaseException as e:
+            exc = e
+
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._connection_lost, exc)
+
+    def _io_loop(self) -> None:
+        pending: Optional[memoryview] = None
+        while True:
+            with self._cond:
+                if self._aborted:
+                    return
+                if pending is None and self._tx_queue:
+                    pending = memoryview(self._tx_queue.popleft())
+                if pending is None and self._closing:
+                    return
+                reading = self._reading and self._deliveries < _MAX_PENDING_DELIVERIES
+
+            if pending is not None:
+                pending = self._write_some(pending)
+
+            received = self._read_some() if reading else 0
+
+            if pending is None and received == 0:
+                with self._cond:
+                    if not self._tx_queue and not self._closing:
+                        self._cond.wait(self._poll_interval)
+
+    def _read_some(self) -> int:
+        received = self._spi_slave.get_rx_status()
+        if received > 0:
+            data = self._spi_slave.read(min(received, _MAX_TRANSFER_SIZE))
+            with self._cond:
+                self._deliveries += 1
+            self._loop.call_soon_threadsafe(self._deliver, data)
+        return received
+
+    def _write_some(self, chunk: memoryview) -> Optional[memoryview]:
+        """Write the start of a chunk, return the rest (None when done)."""
+        written = self._spi_slave.write(bytes(chunk[:_MAX_TRANSFER_SIZE]))
+        if written <= 0:
+            raise OSError(errno.EIO, "SPI Slave Tx queue accepted no data!")
+
+        with self._cond:
+            # 'abort()' has discarded the rest of the buffer
+            if self._aborted:
+                return None
+            self._tx_size -= written
+            resume = self._write_paused and self._tx_size <= self._low_water
+
+        if resume:
+            self._loop.call_soon_threadsafe(self._maybe_resume_protocol)
+        return chunk[written:] if written < len(chunk) else None
+
+
+async def open_spi_slave_stream(
+    spi_slave: SpiSlaveRaw[Any],
+    *,
+    limit: int = _DEFAULT_LIMIT,
+    poll_interval: float = _DEFAULT_POLL_INTERVAL,
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open an asyncio stream pair backed by the given SPI Slave.
+
+    A dedicated I/O thread owns all driver calls. Received data are fed into
+    the reader, written data are sent to the Tx queue in the order of writes.
+
+    Backpressure is applied in both directions. The I/O thread stops reading
+    the Rx queue while the reader buffer exceeds its limit, and
+    'StreamWriter.drain()' blocks while the write buffer exceeds its
+    high-water mark (see 'StreamWriter.transport.set_write_buffer_limits()').
+
+    Note:
+        Closing the writer stops the I/O thread after all buffered data
+        have been written. The SPI Slave handle itself is left open.
+
+    Args:
+        spi_slave:          SPI Slave initialized in raw mode
+        limit:              StreamReader buffer limit in bytes
+        poll_interval:      Rx queue poll interval of an idle I/O thread (seconds)
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error (reported by the reader)
+        OSError:            If the Tx queue accepts no data (reported by the reader)
+
+    Returns:
+        Tuple[StreamReader, StreamWriter]:  Connected stream pair
+    """
+    if limit <= 0:
+        raise ValueError("limit must be a positive number.")
+    if poll_interval <= 0:
+        raise ValueError("poll_interval must be a positive number.")
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit, loop=loop)
+    protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
+    transport = _SpiSlaveTransport(loop, spi_slave, protocol, poll_interval)
+    transport._start()
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    return reader, writer
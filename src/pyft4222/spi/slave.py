@@ -1,10 +1,11 @@
 from abc import ABC
 from ctypes import c_void_p
 from enum import Enum, auto
-from typing import Any, Generic, Literal, TypeVar, Union
+from typing import Any, Generic, Literal, Optional, TypeVar, Union
 
 from pyft4222.handle import GenericProtocolHandle, StreamHandleType
-from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.metrics import SlaveMonitor
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status, WritableBuffer
 from pyft4222.wrapper.spi import ClkPhase, ClkPolarity, DriveStrength
 from pyft4222.wrapper.spi.common import (
     TransactionIdx,
@@ -19,6 +20,7 @@ from pyft4222.wrapper.spi.slave import (
     SpiSlaveRawHandle,
     get_rx_status,
     read,
+    readinto,
     set_mode,
     write,
 )
@@ -39,6 +41,8 @@ class SpiSlaveCommon(
 ):
     """A class encapsulating functions common to all SPI Slave modes."""
 
+    _monitor: Optional[SlaveMonitor]
+
     def __init__(self, ft_handle: SpiSlaveHandleType, stream_handle: StreamHandleType):
         """Initialize the class with given FT4222 handle and a mode class type.
 
@@ -47,6 +51,7 @@ class SpiSlaveCommon(
             stream_handle:  Calling stream mode handle. Used in 'uninitialize()' method.
         """
         super().__init__(ft_handle, stream_handle)
+        self._monitor = None
 
     # FIXME: De-duplicate with SPI Master
     def reset_bus(self) -> None:
@@ -127,6 +132,17 @@ class SpiSlaveCommon(
                 Ft4222Status.DEVICE_NOT_OPENED, "SPI Slave has been uninitialized!"
             )
 
+    def set_monitor(self, monitor: Optional[SlaveMonitor]) -> None:
+        """Attach (or detach) a latency monitor.
+
+        While attached, every Rx queue poll and every read is timestamped,
+        see 'SlaveMonitor' for the recorded histograms.
+
+        Args:
+            monitor:    Monitor to attach, 'None' disables instrumentation
+        """
+        self._monitor = monitor
+
     def get_rx_status(self) -> int:
         """Get number of bytes in the Rx queue.
 
@@ -137,7 +153,10 @@ class SpiSlaveCommon(
             int:                Number of bytes in the Rx queue
         """
         if self._handle is not None:
-            return get_rx_status(self._handle)
+            rx_count = get_rx_status(self._handle)
+            if self._monitor is not None:
+                self._monitor.on_rx_status(rx_count)
+            return rx_count
         else:
             raise Ft4222Exception(
                 Ft4222Status.DEVICE_NOT_OPENED, "SPI Slave has been uninitialized!"
@@ -161,7 +180,10 @@ class SpiSlaveCommon(
         """
         if self._handle is not None:
             if 0 < read_byte_count < (2 ** 16):
-                return read(self._handle, read_byte_count)
+                data = read(self._handle, read_byte_count)
+                if self._monitor is not None:
+                    self._monitor.on_read(len(data))
+                return data
             else:
                 raise ValueError("read_byte_count must be in range <1, 65_535>.")
         else:
@@ -169,6 +191,37 @@ class SpiSlaveCommon(
                 Ft4222Status.DEVICE_NOT_OPENED, "SPI Slave has been uninitialized!"
             )
 
+    def readinto(self, buffer: WritableBuffer) -> int:
+        """Read data from the Rx queue into the given buffer.
+
+        Unlike 'read()', this method does not allocate any memory.
+        At most as many bytes as the buffer size are read.
+
+        Args:
+            buffer:             Writable buffer to read into, size <1, 65_535>
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+
+        Returns:
+            int:                Number of bytes read into the buffer
+        """
+        if self._handle is not None:
+            view = memoryview(buffer)
+            if view.readonly:
+                raise ValueError("buffer must be writable.")
+            if 0 < view.nbytes < (2 ** 16):
+                bytes_read = readinto(self._handle, buffer)
+                if self._monitor is not None:
+                    self._monitor.on_read(bytes_read)
+                return bytes_read
+            else:
+                raise ValueError("buffer size must be in range <1, 65_535>.")
+        else:
+            raise Ft4222Exception(
+                Ft4222Status.DEVICE_NOT_OPENED, "SPI Slave has been uninitialized!"
+            )
+
     def write(self, write_data: bytes) -> int:
         """Write data into Tx queue.
 
@@ -0,0 +1,287 @@
+"""Module implementing GPIO waveform capture and logic-analyzer style decoding.
+
+In waveform mode (see 'Gpio.set_waveform_mode()') the FT4222 samples every
+input port with level triggers enabled and stores one level event per sample
+into the trigger queue of the port. 'capture_waveform()' drains the queues
+in bulk and stores the samples as 0/1 bytes into preallocated buffers:
+a 'uint8' NumPy array when NumPy is installed, 'array("B")' otherwise.
+The captured samples are views of these buffers (no copy is made).
+
+The library does not document the sampling period, it depends on the system
+clock. The capture measures it empirically (host time per sample), use
+'scale_sample_period()' to convert a measured period to another clock.
+
+The decoding functions work on either buffer type. NumPy arrays are decoded
+vectorially, other buffers by C-level byte searches.
+
+Example:
+    capture = capture_waveform(gpio, [PortId.PORT_2], sample_count=10_000)
+    samples = capture.samples[PortId.PORT_2]
+    widths = pulse_widths(samples)
+    print([width * capture.sample_period for width in widths])
+"""
+
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from pyft4222.gpio import Gpio
+from pyft4222.polling import DEFAULT_STRATEGY, PollStrategy
+from pyft4222.wrapper import GpioTrigger, WritableBuffer
+from pyft4222.wrapper.common import ClockRate
+from pyft4222.wrapper.gpio import PortId
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+_MAX_EVENTS: int = (2 ** 16) - 1
+"""Maximum number of events read by a single driver call."""
+_LEVEL_OFFSET: int = 0 if sys.byteorder == "little" else 3
+"""Offset of the least significant byte of a raw 32-bit event value."""
+_LEVEL_TABLE: bytes = bytes(
+    1 if value == GpioTrigger.LEVEL_HIGH else 0 for value in range(256)
+)
+"""Translation of the raw event value to a 0/1 sample."""
+
+Samples = Any
+"""A 'uint8' NumPy array or a byte buffer (e.g., 'memoryview') of 0/1 samples."""
+
+
+class WaveformCapture(NamedTuple):
+    """NamedTuple representing captured waveforms."""
+
+    samples: Dict[PortId, Samples]
+    """Captured 0/1 samples per port (trimmed to 'sample_count').
+
+    Views of the capture buffers: NumPy array slices or 'memoryview' objects.
+    """
+    sample_count: int
+    """Number of samples captured per port."""
+    sample_period: float
+    """Measured time between two samples in seconds (NaN if unknown)."""
+    clock_rate: ClockRate
+    """System clock during the capture."""
+
+    @property
+    def sample_rate(self) -> float:
+        """Measured sample rate in Hz."""
+        return 1.0 / self.sample_period if self.sample_period > 0 else float("nan")
+
+
+def allocate_samples(sample_count: int) -> Samples:
+    """Allocate a zeroed sample buffer ('uint8' NumPy array if available).
+
+    Args:
+        sample_count:   Number of samples
+
+    Returns:
+        Samples:        Sample buffer
+    """
+    if np is not None:
+        return np.zeros(sample_count, dtype=np.uint8)
+    return array("B", bytes(sample_count))
+
+
+def scale_sample_period(
+    sample_period: float, measured_at: ClockRate, clock_rate: ClockRate
+) -> float:
+    """Convert a sample period measured at one system clock to another one.
+
+    Args:
+        sample_period:  Measured sample period in seconds
+        measured_at:    System clock during the measurement
+        clock_rate:     System clock to convert to
+
+    Returns:
+        float:          Expected sample period in seconds
+    """
+    return sample_period * measured_at.frequency / clock_rate.frequency
+
+
+def capture_waveform(
+    gpio: Gpio[Any],
+    ports: Sequence[PortId],
+    sample_count: int,
+    out: Optional[Mapping[PortId, WritableBuffer]] = None,
+    timeout: float = 1.0,
+    strategy: PollStrategy = DEFAULT_STRATEGY,
+) -> WaveformCapture:
+    """Capture the levels of input ports using the waveform mode.
+
+    Level triggers are enabled on the given ports and the waveform mode
+    is enabled for the duration of the capture. Events queued before
+    the capture are discarded.
+
+    Note:
+        The trigger configuration of the ports is left as set by the capture.
+
+    Args:
+        gpio:           Initialized GPIO, captured ports configured as inputs
+        ports:          Ports to capture
+        sample_count:   Number of samples per port
+        out:            Preallocated sample buffers per port, each of at
+                        least 'sample_count' bytes (default: 'allocate_samples()')
+        timeout:        Maximum capture time in seconds
+        strategy:       Trigger queue polling schedule
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        WaveformCapture:    Samples captured before the timeout
+    """
+    if sample_count <= 0:
+        raise ValueError("sample_count must be a positive number.")
+    if len(ports) == 0:
+        raise ValueError("ports must not be empty.")
+
+    buffers = {
+        port: (out[port] if out is not None else allocate_samples(sample_count))
+        for port in ports
+    }
+    if any(memoryview(buffer).nbytes < sample_count for buffer in buffers.values()):
+        raise ValueError("out buffers must hold at least sample_count samples.")
+
+    clock_rate = gpio.get_clock()
+    scratch = array("I", bytes(4 * min(sample_count, _MAX_EVENTS)))
+    positions = {port: 0 for port in ports}
+    first_at: Optional[float] = None
+    first_count = 0
+    last_at = 0.0
+
+    for port in ports:
+        gpio.set_input_trigger(port, GpioTrigger.LEVEL_HIGH | GpioTrigger.LEVEL_LOW)
+    gpio.set_waveform_mode(True)
+    try:
+        for port in ports:
+            stale = gpio.get_queued_trigger_event_count(port)
+            while stale > 0:
+                stale -= gpio.read_trigger_queue_into(
+                    port, memoryview(scratch)[: min(stale, len(scratch))]
+                )
+
+        deadline = time.perf_counter() + timeout
+        intervals = strategy.intervals()
+        while min(positions.values()) < sample_count:
+            progress = False
+            for port in ports:
+                remaining = sample_count - positions[port]
+                if remaining <= 0:
+                    continue
+                pending = gpio.get_queued_trigger_event_count(port)
+                if pending <= 0:
+                    continue
+
+                read_count = min(pending, remaining, len(scratch))
+                event_count = gpio.read_trigger_queue_into(
+                    port, memoryview(scratch)[:read_count]
+                )
+                _store_levels(scratch, event_count, buffers[port], positions[port])
+                positions[port] += event_count
+                progress = progress or event_count > 0
+
+            now = time.perf_counter()
+            if progress:
+                if first_at is None:
+                    first_at = now
+                    first_count = min(positions.values())
+                last_at = now
+                intervals = strategy.intervals()
+            if now >= deadline:
+                break
+            if not progress:
+                interval = next(intervals)
+                if interval > 0.0:
+                    time.sleep(min(interval, deadline - now))
+    finally:
+        gpio.set_waveform_mode(False)
+
+    captured = min(positions.values())
+    # The first batch was sampled before its poll, only count the later ones
+    measured = captured - first_count
+    sample_period = (
+        (last_at - first_at) / measured
+        if first_at is not None and measured > 0
+        else float("nan")
+    )
+    return WaveformCapture(
+        {port: _trim(buffers[port], captured) for port in ports},
+        captured,
+        sample_period,
+        clock_rate,
+    )
+
+
+def _trim(buffer: WritableBuffer, count: int) -> Samples:
+    # Slicing an 'array' or a 'bytearray' copies, a memoryview does not
+    if np is not None and isinstance(buffer, np.ndarray):
+        return buffer[:count]
+    return memoryview(buffer).cast("B")[:count]
+
+
+def _store_levels(
+    events: "array[int]", event_count: int, out: WritableBuffer, offset: int
+) -> None:
+    if np is not None:
+        levels = np.frombuffer(events, dtype=np.uint32, count=event_count)
+        target = np.frombuffer(out, dtype=np.uint8)
+        target[offset : offset + event_count] = levels == GpioTrigger.LEVEL_HIGH
+    else:
+        raw = memoryview(events).cast("B")
+        lsb = raw[_LEVEL_OFFSET : event_count * 4 : 4].tobytes()
+        memoryview(out).cast("B")[offset : offset + event_count] = lsb.translate(
+            _LEVEL_TABLE
+        )
+
+
+def find_edges(samples: Samples) -> Tuple[Sequence[int], Sequence[int]]:
+    """Find the rising and falling edges in a sampled waveform.
+
+    Args:
+        samples:    0/1 samples
+
+    Returns:
+        Tuple[Sequence[int], Sequence[int]]:    Indices of the first sample
+                                                after each rising and each
+                                                falling edge
+    """
+    if np is not None and isinstance(samples, np.ndarray):
+        steps = np.diff(samples.astype(np.int8))
+        return (np.flatnonzero(steps == 1) + 1, np.flatnonzero(steps == -1) + 1)
+
+    data = memoryview(samples).cast("B")
+    return (
+        array("q", (match.start() + 1 for match in re.finditer(b"\x00\x01", data))),
+        array("q", (match.start() + 1 for match in re.finditer(b"\x01\x00", data))),
+    )
+
+
+def pulse_widths(samples: Samples, level: int = 1) -> Sequence[int]:
+    """Measure the widths of complete pulses of the given level.
+
+    Pulses cut off by the start or the end of the capture are ignored.
+
+    Args:
+        samples:    0/1 samples
+        level:      Pulse level (1 -> high pulses, 0 -> low pulses)
+
+    Returns:
+        Sequence[int]:  Pulse widths in samples, in capture order
+    """
+    rising, falling = find_edges(samples)
+    starts, ends = (rising, falling) if level else (falling, rising)
+
+    if len(starts) == 0:
+        return starts
+    # Edges alternate, drop the end of a pulse started before the capture
+    ends = ends[bisect_right(ends, starts[0]) :]
+    count = min(len(starts), len(ends))
+
+    if np is not None and isinstance(starts, np.ndarray):
+        return ends[:count] - starts[:count]
+    return array("q", (end - start for start, end in zip(starts[:count], ends)))
@@ -0,0 +1,119 @@
+"""Module implementing the background polling thread shared by the engines.
+
+The register-file engine, the response pipeline, the GPIO event stream
+and the DRDY acquisition all poll the device from a dedicated thread.
+'PollingWorker' owns the thread, the adaptive polling loop, the stop
+signal and the propagation of a thread failure to 'stop()'.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Type, TypeVar
+
+from pyft4222.polling import PollStrategy
+
+WorkerType = TypeVar("WorkerType", bound="PollingWorker")
+
+
+class PollingWorker(ABC):
+    """A base class polling the device in a background thread.
+
+    Subclasses implement '_poll()' and may extend '_on_start()'.
+    The polling schedule restarts whenever a poll finds work,
+    idle polls sleep the next interval of the schedule.
+    """
+
+    _worker_name: str = "Worker"
+    """Name used in error messages."""
+    _thread_name: str = "pyft4222-worker"
+
+    _poll_strategy: PollStrategy
+    _stop_event: threading.Event
+    _thread: Optional[threading.Thread]
+    _error: Optional[BaseException]
+    _lock: threading.Lock
+    """Lock guarding the counters of the subclass."""
+
+    def __init__(self, poll_strategy: PollStrategy):
+        self._poll_strategy = poll_strategy
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def __enter__(self: WorkerType) -> WorkerType:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        self.stop()
+        return False
+
+    @property
+    def running(self) -> bool:
+        """Is the background thread alive?"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background thread.
+
+        Raises:
+            Ft4222Exception:    In case of unexpected error
+        """
+        if self._thread is not None:
+            raise RuntimeError(f"{self._worker_name} is already running!")
+
+        self._stop_event.clear()
+        self._error = None
+        self._on_start()
+        self._thread = threading.Thread(
+            target=self._worker_loop, name=self._thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread.
+
+        Raises:
+            Ft4222Exception:    If the thread failed on a device error
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        if self._error is not None:
+            raise self._error
+
+    def _on_start(self) -> None:
+        """Prepare the device, called from 'start()' before the thread starts."""
+
+    @abstractmethod
+    def _poll(self) -> bool:
+        """Poll the device once.
+
+        Returns:
+            bool:       Has the poll found work?
+        """
+
+    def _worker_loop(self) -> None:
+        try:
+            intervals = self._poll_strategy.intervals()
+            while not self._stop_event.is_set():
+                if self._poll():
+                    intervals = self._poll_strategy.intervals()
+                    continue
+
+                interval = next(intervals)
+                if interval > 0.0:
+                    self._stop_event.wait(interval)
+        except BaseException as e:
+            self._error = e
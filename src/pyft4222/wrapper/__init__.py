@@ -1,12 +1,16 @@
 import platform
+from array import array
 from ctypes import c_void_p
 from enum import IntEnum, IntFlag, auto
-from typing import Final, NewType, Optional
+from typing import Final, NewType, Optional, Union
 
 OS_TYPE: Final = platform.system()
 
 FtHandle = NewType("FtHandle", c_void_p)
 
+WritableBuffer = Union[bytearray, memoryview, array]
+"""A writable C-contiguous buffer (bytearray, memoryview or array)."""
+
 
 class FtStatus(IntEnum):
     """Class representing a D2XX 'FT_RESULT' enum."""
@@ -1,6 +1,6 @@
 from ctypes import Structure, POINTER, byref
 from ctypes import c_uint, c_void_p, c_bool, c_uint16
-from typing import NamedTuple, Union
+from typing import Final, Mapping, NamedTuple, Union
 from enum import IntEnum, auto
 
 from . import Ft4222Status, Ft4222Exception, GpioTrigger, FtHandle
@@ -35,6 +35,19 @@ class ClockRate(IntEnum):
     SYS_CLK_80 = auto()
     """80 MHz"""
 
+    @property
+    def frequency(self) -> int:
+        """System clock frequency in Hz."""
+        return _CLOCK_FREQUENCIES[self]
+
+
+_CLOCK_FREQUENCIES: Final[Mapping[ClockRate, int]] = {
+    ClockRate.SYS_CLK_60: 60_000_000,
+    ClockRate.SYS_CLK_24: 24_000_000,
+    ClockRate.SYS_CLK_48: 48_000_000,
+    ClockRate.SYS_CLK_80: 80_000_000,
+}
+
 
 class ChipVersion(IntEnum):
     """Enum representing a chip revision.
@@ -1,10 +1,10 @@
-from ctypes import POINTER, byref, c_bool, c_uint, c_uint16, c_void_p
+from ctypes import POINTER, byref, c_bool, c_uint, c_uint16, c_void_p, sizeof
 from enum import IntEnum, auto
-from typing import Final, List, NewType, Tuple
+from typing import Final, List, NewType, Optional, Tuple
 
 from koda import Err, Ok, Result
 
-from . import Ft4222Exception, Ft4222Status, FtHandle, GpioTrigger
+from . import Ft4222Exception, Ft4222Status, FtHandle, GpioTrigger, WritableBuffer
 from .dll_loader import ftlib
 
 GpioHandle = NewType("GpioHandle", FtHandle)
@@ -123,6 +123,61 @@ def write(ft_handle: GpioHandle, port_id: PortId, state: bool) -> None:
         raise Ft4222Exception(result)
 
 
+def read_all(ft_handle: GpioHandle) -> int:
+    """Read the states of all GPIO ports.
+
+    Note:
+        The library has no multi-port read, the ports are read one by one.
+        This function avoids the per-call overhead of 'read()'
+        (result object allocation and port conversions).
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in GPIO mode
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        int:                Bit map of port states (bit n -> 'PortId.PORT_n')
+    """
+    gpio_state = c_bool()
+    state_ref = byref(gpio_state)
+    states = 0
+
+    for port_idx in range(_GPIO_COUNT):
+        result: Ft4222Status = _read(ft_handle, port_idx, state_ref)
+
+        if result != Ft4222Status.OK:
+            raise Ft4222Exception(result)
+
+        states |= gpio_state.value << port_idx
+
+    return states
+
+
+def write_mask(ft_handle: GpioHandle, mask: int, states: int) -> None:
+    """Write values to the GPIO ports selected by a bit mask.
+
+    Args:
+        ft_handle:      Handle to an initialized FT4222 device in GPIO mode
+        mask:           Bit map of ports to write (bit n -> 'PortId.PORT_n')
+        states:         Bit map of port states to set
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+    """
+    assert 0 <= mask < (2 ** _GPIO_COUNT), "Mask must be in range <0, 15>."
+
+    for port_idx in range(_GPIO_COUNT):
+        if mask & (1 << port_idx):
+            result: Ft4222Status = _write(
+                ft_handle, port_idx, bool(states & (1 << port_idx))
+            )
+
+            if result != Ft4222Status.OK:
+                raise Ft4222Exception(result)
+
+
 def set_input_trigger(
     ft_handle: GpioHandle, port_id: PortId, trigger: GpioTrigger
 ) -> None:
@@ -177,7 +232,7 @@ def get_trigger_status(ft_handle: GpioHandle, port_id: PortId) -> int:
 
 
 def read_trigger_queue(
-    ft_handle: GpioHandle, port_id: PortId, max_read_size: int = (2 ** 16) - 1
+    ft_handle: GpioHandle, port_id: PortId, max_read_size: Optional[int] = None
 ) -> List[GpioTrigger]:
     """Get events recorded in the trigger event queue.
 
@@ -186,7 +241,8 @@ def read_trigger_queue(
     Args:
         ft_handle:                  Handle to an initialized FT4222 device in GPIO mode
         port_id:                    GPIO port index
-        max_read_size:              Non-negative number of event to read from queue
+        max_read_size:              Non-negative number of event to read from queue,
+                                    None reads the events queued at the time of the call
 
     Raises:
         Ft4222Exception:            In case of unexpected device error
@@ -194,10 +250,16 @@ def read_trigger_queue(
     Returns:
         List[FT4222.GpioTrigger]:   List of trigger events (if any)
     """
+    if max_read_size is None:
+        max_read_size = get_trigger_status(ft_handle, port_id)
+
     assert (
         0 <= max_read_size < (2 ** 16)
     ), "Max. read size must be a non-negative number smaller than 2^16."
 
+    if max_read_size == 0:
+        return []
+
     event_buffer = (c_uint * max_read_size)()
     events_read = c_uint16()
 
@@ -211,6 +273,46 @@ def read_trigger_queue(
     return list(map(GpioTrigger, event_buffer[: events_read.value]))
 
 
+def read_trigger_queue_into(
+    ft_handle: GpioHandle, port_id: PortId, buffer: WritableBuffer
+) -> int:
+    """Read events from the trigger event queue into the given buffer.
+
+    Unlike 'read_trigger_queue()', no intermediate buffer is allocated and
+    no 'GpioTrigger' objects are created, the driver writes the raw event
+    values (32-bit unsigned integers) directly into the given buffer.
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in GPIO mode
+        port_id:            GPIO port index
+        buffer:             Writable buffer of 32-bit items (e.g., 'array("I")'),
+                            its size is the maximum number of events to read;
+                            size <1, 65_535> items
+
+    Raises:
+        Ft4222Exception:    In case of unexpected device error
+
+    Returns:
+        int:                Number of events read into the buffer
+    """
+    event_capacity = memoryview(buffer).nbytes // sizeof(c_uint)
+    assert (
+        0 < event_capacity < (2 ** 16)
+    ), "Buffer size must be positive and less than 2^16 events."
+
+    event_buffer = (c_uint * event_capacity).from_buffer(buffer)
+    events_read = c_uint16()
+
+    result: Ft4222Status = _read_trigger_queue(
+        ft_handle, port_id, event_buffer, event_capacity, byref(events_read)
+    )
+
+    if result != Ft4222Status.OK:
+        raise Ft4222Exception(result)
+
+    return events_read.value
+
+
 def set_waveform_mode(ft_handle: GpioHandle, enable: bool) -> None:
     """Enable or disable WaveForm Mode.
 
@@ -4,7 +4,7 @@ from typing import NewType
 
 from koda import Err, Ok, Result
 
-from .. import Ft4222Exception, Ft4222Status, FtHandle
+from .. import Ft4222Exception, Ft4222Status, FtHandle, WritableBuffer
 from ..dll_loader import ftlib
 
 I2cMasterHandle = NewType("I2cMasterHandle", FtHandle)
@@ -223,6 +223,40 @@ def read_ex(
     return bytes(read_buffer[: bytes_read.value])
 
 
+def read_ex_into(
+    ft_handle: I2cMasterHandle,
+    dev_address: int,
+    flag: TransactionFlag,
+    buffer: WritableBuffer,
+) -> int:
+    """Read data from the specified I2C slave device into the given buffer.
+
+    Unlike 'read_ex()', no intermediate buffer is allocated,
+    the driver writes directly into the given buffer.
+
+    NOTE: This function is supported by the rev. B FT4222H or later!
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in I2C Master mode
+        dev_address:        Address of target I2C slave device
+        flag:               I2C transaction condition flag
+        buffer:             Writable buffer, its size (in bytes) is the number
+                            of bytes to read; size <1, 65_535>
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        int:                Number of bytes read into the buffer
+    """
+    result = try_read_ex_into(ft_handle, dev_address, flag, buffer)
+
+    if isinstance(result, Err):
+        raise Ft4222Exception(result.val)
+
+    return result.val
+
+
 def write_ex(
     ft_handle: I2cMasterHandle,
     dev_address: int,
@@ -264,6 +298,91 @@ def write_ex(
     return bytes_written.value
 
 
+def try_read_ex_into(
+    ft_handle: I2cMasterHandle,
+    dev_address: int,
+    flag: TransactionFlag,
+    buffer: WritableBuffer,
+) -> Result[int, Ft4222Status]:
+    """Read data from the specified I2C slave device into the given buffer.
+
+    Unlike 'read_ex()', no exception is raised and no intermediate buffer
+    is allocated. Suitable for probing devices, where failures are expected.
+
+    NOTE: This function is supported by the rev. B FT4222H or later!
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in I2C Master mode
+        dev_address:        Address of target I2C slave device
+        flag:               I2C transaction condition flag
+        buffer:             Writable buffer, its size (in bytes) is the number
+                            of bytes to read; size <1, 65_535>
+
+    Returns:
+        Result:             Number of bytes read, or the failure status
+    """
+    assert (
+        0 <= dev_address < (2 ** 16)
+    ), "Device address must be an 16b unsigned integer (range 0 - 65 535)"
+    read_byte_count = memoryview(buffer).nbytes
+    assert (
+        0 < read_byte_count < (2 ** 16)
+    ), "Number of bytes to read must be positive and less than 2^16"
+
+    read_buffer = (c_uint8 * read_byte_count).from_buffer(buffer)
+    bytes_read = c_uint16()
+
+    result: Ft4222Status = _read_ex(
+        ft_handle, dev_address, flag, read_buffer, read_byte_count, byref(bytes_read)
+    )
+
+    if result == Ft4222Status.OK:
+        return Ok(bytes_read.value)
+    else:
+        return Err(result)
+
+
+def try_write_ex(
+    ft_handle: I2cMasterHandle,
+    dev_address: int,
+    flag: TransactionFlag,
+    write_data: bytes,
+) -> Result[int, Ft4222Status]:
+    """Write data to a specified I2C slave device with the specified I2C condition.
+
+    Unlike 'write_ex()', no exception is raised.
+    Suitable for probing devices, where failures are expected.
+
+    NOTE: This function is supported by the rev. B FT4222H or later!
+
+    Args:
+        ft_handle:      Handle to an initialized FT4222 device in I2C Master mode
+        dev_address:    Address of target I2C slave device
+        flag:           I2C transaction condition flag
+        write_data:     Non-empty list of bytes to write
+
+    Returns:
+        Result:         Number of bytes written, or the failure status
+    """
+    assert (
+        0 <= dev_address < (2 ** 16)
+    ), "Device address must be an 16b unsigned integer (range 0 - 65 535)"
+    assert (
+        0 < len(write_data) < (2 ** 16)
+    ), "Data to be written must be non-empty and contain less than 2^16 bytes"
+
+    bytes_written = c_uint16()
+
+    result: Ft4222Status = _write_ex(
+        ft_handle, dev_address, flag, write_data, len(write_data), byref(bytes_written)
+    )
+
+    if result == Ft4222Status.OK:
+        return Ok(bytes_written.value)
+    else:
+        return Err(result)
+
+
 def reset(ft_handle: I2cMasterHandle) -> None:
     """Reset the I2C master device.
 
@@ -307,6 +426,50 @@ def get_status(ft_handle: I2cMasterHandle) -> CtrlStatus:
     return CtrlStatus(status.value)
 
 
+def get_status_byte(ft_handle: I2cMasterHandle) -> int:
+    """Read the raw status byte of the I2C master controller.
+
+    Unlike 'get_status()', no 'CtrlStatus' object is created,
+    suitable for tight polling loops.
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in I2C Master mode
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        int:                Raw controller status ('CtrlStatus' bits)
+    """
+    status = c_uint8()
+
+    result: Ft4222Status = _get_status(ft_handle, byref(status))
+
+    if result != Ft4222Status.OK:
+        raise Ft4222Exception(result)
+
+    return status.value
+
+
+def try_get_status(ft_handle: I2cMasterHandle) -> Result[CtrlStatus, Ft4222Status]:
+    """Read the status of the I2C master controller without raising exceptions.
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in I2C Master mode
+
+    Returns:
+        Result:             Controller status, or the failure status
+    """
+    status = c_uint8()
+
+    result: Ft4222Status = _get_status(ft_handle, byref(status))
+
+    if result == Ft4222Status.OK:
+        return Ok(CtrlStatus(status.value))
+    else:
+        return Err(result)
+
+
 def reset_bus(ft_handle: I2cMasterHandle) -> None:
     """Reset I2C bus.
 
@@ -50,6 +50,11 @@ class ClkDiv(IntEnum):
     CLK_DIV_256 = auto()  # 1/256 System Clock
     CLK_DIV_512 = auto()  # 1/512 System Clock
 
+    @property
+    def divisor(self) -> int:
+        """System clock divisor (1 for 'CLK_NONE')."""
+        return 1 << self.value
+
 
 class CsPolarity(IntEnum):
     """Enum representing possible chip_select signal polarities."""
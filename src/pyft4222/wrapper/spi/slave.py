@@ -4,7 +4,7 @@ from typing import Literal, NewType, Union, overload
 
 from koda import Err, Ok, Result
 
-from .. import Ft4222Exception, Ft4222Status, FtHandle
+from .. import Ft4222Exception, Ft4222Status, FtHandle, WritableBuffer
 from ..dll_loader import ftlib
 from . import ClkPhase, ClkPolarity
 
@@ -189,7 +189,42 @@ def read(ft_handle: SpiSlaveHandle, read_byte_count: int) -> bytes:
     if result != Ft4222Status.OK:
         raise Ft4222Exception(result)
 
-    return bytes(read_buffer[: bytes_read.value])
+    return bytes(memoryview(read_buffer)[: bytes_read.value])
+
+
+def readinto(ft_handle: SpiSlaveHandle, buffer: WritableBuffer) -> int:
+    """Read data from the receive queue of the SPI slave device into the given buffer.
+
+    Unlike 'read()', no intermediate buffer is allocated,
+    the driver writes directly into the given buffer.
+
+    Args:
+        ft_handle:          Handle to an initialized FT4222 device in SPI Slave mode
+        buffer:             Writable buffer, its size (in bytes) is the maximum
+                            number of bytes to read; size <1, 65_535>
+
+    Raises:
+        Ft4222Exception:    In case of unexpected error
+
+    Returns:
+        int:                Number of bytes read into the buffer
+    """
+    read_byte_count = memoryview(buffer).nbytes
+    assert (
+        0 < read_byte_count < (2 ** 16)
+    ), "Number of bytes to read must be positive and less than 2^16"
+
+    read_buffer = (c_uint8 * read_byte_count).from_buffer(buffer)
+    bytes_read = c_uint16()
+
+    result: Ft4222Status = _read(
+        ft_handle, read_buffer, read_byte_count, byref(bytes_read)
+    )
+
+    if result != Ft4222Status.OK:
+        raise Ft4222Exception(result)
+
+    return bytes_read.value
 
 
 def write(ft_handle: SpiSlaveHandle, write_data: bytes) -> int:
@@ -0,0 +1,29 @@
+import json
+
+from pyft4222.bench import gpio as gpio_bench
+from pyft4222.sim import SimGpio
+
+
+def test_write_mask_shadow():
+    gpio = SimGpio()
+
+    assert gpio.write_mask(0x0F, 0x05) == 0x0F
+    assert gpio.read_all() == 0x05
+    assert gpio.write_mask(0x0F, 0x05) == 0x00
+    assert gpio.write_mask(0x03, 0x02) == 0x03
+    assert gpio.read_all() == 0x06
+
+    calls = gpio.driver_calls
+    gpio.write_mask(0x0F, 0x06)
+    assert gpio.driver_calls == calls
+
+
+def test_gpio_bench():
+    results = gpio_bench.run_gpio_bench(SimGpio(), iterations=16)
+
+    assert len(results) == 6
+    assert all(result.iterations == 16 for result in results)
+    assert all(result.per_sample_us >= 0 for result in results)
+
+    decoded = json.loads(gpio_bench.results_to_json(results))
+    assert decoded[0]["operation"] == "read x4"
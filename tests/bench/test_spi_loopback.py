@@ -0,0 +1,100 @@
+import json
+from typing import Final
+
+from pyft4222.bench import spi_loopback
+from pyft4222.sim import SimSpiLink
+from pyft4222.wrapper.common import ClockRate
+from pyft4222.wrapper.spi.master import ClkDiv
+
+_TRANSFER_SIZE: Final[int] = 1024
+_TRANSFER_COUNT: Final[int] = 64
+
+
+def test_loopback():
+    link = SimSpiLink(ClockRate.SYS_CLK_80, ClkDiv.CLK_DIV_4)
+    result = spi_loopback.run_loopback(
+        link.master,
+        link.slave,
+        transfer_size=_TRANSFER_SIZE,
+        transfer_count=_TRANSFER_COUNT,
+    )
+
+    assert result.bytes_received == _TRANSFER_SIZE * _TRANSFER_COUNT
+    assert result.missing_bytes == 0
+    assert result.error_transfers == 0
+    assert result.throughput_mb_s > 0
+    assert 0 <= result.latency_p50 <= result.latency_p99 <= result.latency_max
+
+
+def test_loopback_detects_corruption():
+    link = SimSpiLink(corrupt_every=5000)
+    result = spi_loopback.run_loopback(
+        link.master,
+        link.slave,
+        transfer_size=_TRANSFER_SIZE,
+        transfer_count=_TRANSFER_COUNT,
+    )
+
+    # Bytes 0, 5000, 10000, ... are corrupted, each in a different transfer
+    assert result.error_transfers == -(-_TRANSFER_SIZE * _TRANSFER_COUNT // 5000)
+
+
+def test_loopback_reports_missing_bytes():
+    link = SimSpiLink(rx_capacity=_TRANSFER_SIZE * 4)
+    link.slave.readinto = lambda buffer: 0  # type: ignore
+    result = spi_loopback.run_loopback(
+        link.master,
+        link.slave,
+        transfer_size=_TRANSFER_SIZE,
+        transfer_count=_TRANSFER_COUNT,
+        timeout=0.1,
+    )
+
+    assert result.bytes_received == 0
+    assert result.missing_bytes == _TRANSFER_SIZE * _TRANSFER_COUNT
+
+
+def test_sweep_json():
+    combinations = [
+        (ClockRate.SYS_CLK_60, ClkDiv.CLK_DIV_2),
+        (ClockRate.SYS_CLK_24, ClkDiv.CLK_DIV_512),
+    ]
+    results = spi_loopback.run_sweep(
+        spi_loopback.sim_pair_factory(),
+        combinations,
+        transfer_size=_TRANSFER_SIZE,
+        transfer_count=_TRANSFER_COUNT,
+    )
+    decoded = json.loads(spi_loopback.results_to_json(results))
+
+    assert [(r["clk_rate"], r["clk_div"]) for r in decoded] == [
+        (rate.name, div.name) for rate, div in combinations
+    ]
+    assert decoded[0]["spi_clock_hz"] == 30_000_000
+    assert all(r["error_transfers"] == 0 for r in decoded)
+
+
+def test_loopback_resyncs_after_dropped_byte():
+    link = SimSpiLink()
+    single_write = link.master.single_write
+    writes = 0
+
+    def drop_byte(write_data: bytes, end_transaction: bool = True) -> int:
+        nonlocal writes
+        writes += 1
+        if writes == 10:
+            write_data = write_data[:100] + write_data[101:]
+        return single_write(write_data, end_transaction)
+
+    link.master.single_write = drop_byte  # type: ignore
+    result = spi_loopback.run_loopback(
+        link.master,
+        link.slave,
+        transfer_size=_TRANSFER_SIZE,
+        transfer_count=_TRANSFER_COUNT,
+        timeout=0.5,
+    )
+
+    assert result.missing_bytes == 1
+    assert result.error_transfers == 1
+    assert result.latency_max >= 0
@@ -48,6 +48,17 @@ def test_read_ex(i2c_master_handle: i2c_master.I2cMasterHandle):
     assert len(read_data) == read_length
 
 
+def test_read_ex_into(i2c_master_handle: i2c_master.I2cMasterHandle):
+    read_buffer = bytearray(40)
+    bytes_read = i2c_master.read_ex_into(
+        i2c_master_handle,
+        _TEST_DEVICE_ADDR,
+        i2c_master.TransactionFlag.NONE,
+        read_buffer,
+    )
+    assert bytes_read == len(read_buffer)
+
+
 def test_write_ex(i2c_master_handle: i2c_master.I2cMasterHandle):
     data_to_write = bytes([0xFF, 0x01, 0x02, 0x03, 0xDE, 0xAD, 0xBE, 0xEF])
     bytes_written = i2c_master.write_ex(
@@ -59,11 +70,46 @@ def test_write_ex(i2c_master_handle: i2c_master.I2cMasterHandle):
     assert bytes_written == len(data_to_write)
 
 
+def test_try_read_ex_into(i2c_master_handle: i2c_master.I2cMasterHandle):
+    read_buffer = bytearray(40)
+    result = i2c_master.try_read_ex_into(
+        i2c_master_handle,
+        _TEST_DEVICE_ADDR,
+        i2c_master.TransactionFlag.START_AND_STOP,
+        read_buffer,
+    )
+    assert isinstance(result, Ok)
+    assert result.val == len(read_buffer)
+
+
+def test_try_write_ex(i2c_master_handle: i2c_master.I2cMasterHandle):
+    data_to_write = bytes([0xFF, 0x01, 0x02, 0x03, 0xDE, 0xAD, 0xBE, 0xEF])
+    result = i2c_master.try_write_ex(
+        i2c_master_handle,
+        _TEST_DEVICE_ADDR,
+        i2c_master.TransactionFlag.START_AND_STOP,
+        data_to_write,
+    )
+    assert isinstance(result, Ok)
+    assert result.val == len(data_to_write)
+
+
 def test_get_status(i2c_master_handle: i2c_master.I2cMasterHandle):
     status = i2c_master.get_status(i2c_master_handle)
     assert status == i2c_master.CtrlStatus.IDLE
 
 
+def test_get_status_byte(i2c_master_handle: i2c_master.I2cMasterHandle):
+    status = i2c_master.get_status_byte(i2c_master_handle)
+    assert status == i2c_master.CtrlStatus.IDLE
+
+
+def test_try_get_status(i2c_master_handle: i2c_master.I2cMasterHandle):
+    result = i2c_master.try_get_status(i2c_master_handle)
+    assert isinstance(result, Ok)
+    assert result.val == i2c_master.CtrlStatus.IDLE
+
+
 def test_reset(i2c_master_handle: i2c_master.I2cMasterHandle):
     i2c_master.reset(i2c_master_handle)
 
@@ -58,3 +58,9 @@ def test_set_clock_stretch(i2c_perif_handle: i2c_slave.I2cSlaveHandle):
 
 def test_set_resp_word(i2c_perif_handle: i2c_slave.I2cSlaveHandle):
     i2c_slave.set_resp_word(i2c_perif_handle, 0x00)
+
+
+def test_readinto(i2c_perif_handle: i2c_slave.I2cSlaveHandle):
+    buffer = bytearray(1024)
+    bytes_read = i2c_slave.readinto(i2c_perif_handle, buffer)
+    assert bytes_read == 0
@@ -56,6 +56,14 @@ def test_read(spi_periph_raw_handle: spi_periph.SpiSlaveRawHandle):
     assert len(read_data) == 0
 
 
+# FIXME: Reads are blocking it seems
+@pytest.mark.skip
+def test_readinto(spi_periph_raw_handle: spi_periph.SpiSlaveRawHandle):
+    buffer = bytearray(20)
+    bytes_read = spi_periph.readinto(spi_periph_raw_handle, buffer)
+    assert bytes_read == 0
+
+
 def test_write(spi_periph_raw_handle: spi_periph.SpiSlaveRawHandle):
     write_data = bytes([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08])
     bytes_written = spi_periph.write(spi_periph_raw_handle, write_data)
@@ -1,4 +1,5 @@
 import itertools
+from array import array
 from ctypes import c_void_p
 from functools import reduce
 
@@ -77,6 +78,16 @@ def test_read_write(gpio_output_handle: gpio.GpioHandle):
             assert gpio.read(gpio_output_handle, port) == val
 
 
+def test_read_all_write_mask(gpio_output_handle: gpio.GpioHandle):
+    for states in range(2 ** len(gpio.PortId)):
+        gpio.write_mask(gpio_output_handle, 0x0F, states)
+        assert gpio.read_all(gpio_output_handle) == states
+
+    gpio.write_mask(gpio_output_handle, 0x0F, 0x00)
+    gpio.write_mask(gpio_output_handle, 0x05, 0x0F)
+    assert gpio.read_all(gpio_output_handle) == 0x05
+
+
 def test_input_trigger(gpio_input_handle: gpio.GpioHandle):
     for port in gpio.PortId:
         states = itertools.product(*[(None, x) for x in GpioTrigger])
@@ -100,6 +111,13 @@ def test_read_trigger_queue(gpio_input_handle: gpio.GpioHandle):
         assert len(result) == 0
 
 
+def test_read_trigger_queue_into(gpio_input_handle: gpio.GpioHandle):
+    buffer = array("I", [0] * 16)
+    for port in gpio.PortId:
+        result = gpio.read_trigger_queue_into(gpio_input_handle, port, buffer)
+        assert result == 0
+
+
 def test_set_waveform_mode(gpio_input_handle: gpio.GpioHandle):
     for state in [True, False]:
         gpio.set_waveform_mode(gpio_input_handle, state)
@@ -0,0 +1,286 @@
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from koda import Ok
+
+from pyft4222 import gpio as gpio_module
+from pyft4222.gpio import Gpio
+from pyft4222.i2c import master as i2c_master_module
+from pyft4222.i2c.master import I2CMaster
+from pyft4222.wrapper import WritableBuffer
+from pyft4222.wrapper.i2c.master import CtrlStatus, TransactionFlag
+
+_NACK: CtrlStatus = CtrlStatus.IDLE | CtrlStatus.ERROR | CtrlStatus.SLAVE_ADDR_NACK
+
+
+class FakeI2CDevice:
+    """A register-pointer I2C slave (e.g., a sensor or a 24Cxx EEPROM).
+
+    The first 'address_width' bytes written after a START condition set
+    the register pointer, the following bytes are written from the pointer.
+    Reads start at the pointer. The pointer wraps around the memory.
+    """
+
+    memory: bytearray
+    pointer: int
+    address_width: int
+    busy_polls: int
+    """Number of following transactions not acknowledged (e.g., write cycle)."""
+    writes: List[bytes]
+
+    def __init__(self, size: int = 256, address_width: int = 1):
+        self.memory = bytearray(size)
+        self.pointer = 0
+        self.address_width = address_width
+        self.busy_polls = 0
+        self.writes = []
+        self._pointer_bytes = 0
+
+    def write(self, flag: TransactionFlag, data: bytes) -> None:
+        self.writes.append(bytes(data))
+        view = memoryview(data)
+        if flag & TransactionFlag.START:
+            self._pointer_bytes = self.address_width
+            self.pointer = 0
+        while self._pointer_bytes > 0 and len(view) > 0:
+            self.pointer = ((self.pointer << 8) | view[0]) % len(self.memory)
+            self._pointer_bytes -= 1
+            view = view[1:]
+        for byte in view:
+            self.memory[self.pointer] = byte
+            self.pointer = (self.pointer + 1) % len(self.memory)
+
+    def read(self, count: int) -> bytes:
+        data = bytes(
+            self.memory[(self.pointer + idx) % len(self.memory)] for idx in range(count)
+        )
+        self.pointer = (self.pointer + count) % len(self.memory)
+        return data
+
+
+class FakeI2CDriver:
+    """Simulated I2C Master driver functions of 'pyft4222.wrapper.i2c.master'.
+
+    Transfers to absent (or busy) slaves succeed, the NACK is only reported
+    by the controller status, like by the real driver.
+    """
+
+    devices: Dict[int, FakeI2CDevice]
+    transactions: List[Tuple[str, int, TransactionFlag, bytes]]
+    """('w' or 'r', address, flag, data) of every transfer."""
+    status: CtrlStatus
+    busy_polls: int
+    """Number of following status polls reporting a busy controller."""
+    status_polls: int
+    resets: int
+    bus_resets: int
+    transfer_limit: Optional[int]
+    """Maximum number of bytes transferred per call (simulates short transfers)."""
+
+    def __init__(self) -> None:
+        self.devices = {}
+        self.transactions = []
+        self.status = CtrlStatus.IDLE
+        self.transfer_limit = None
+        self.busy_polls = 0
+        self.status_polls = 0
+        self.resets = 0
+        self.bus_resets = 0
+
+    def _device(self, address: int) -> Any:
+        device = self.devices.get(address)
+        if device is None or device.busy_polls > 0:
+            if device is not None:
+                device.busy_polls -= 1
+            self.status = _NACK
+            return None
+        self.status = CtrlStatus.IDLE
+        return device
+
+    def write_ex(self, handle: Any, address: int, flag: Any, data: bytes) -> int:
+        data = bytes(data[: self.transfer_limit])
+        self.transactions.append(("w", address, TransactionFlag(flag), data))
+        device = self._device(address)
+        if device is not None:
+            device.write(TransactionFlag(flag), data)
+        return len(data)
+
+    def read_ex_into(
+        self, handle: Any, address: int, flag: Any, buffer: WritableBuffer
+    ) -> int:
+        view = memoryview(buffer).cast("B")[: self.transfer_limit]
+        device = self._device(address)
+        data = device.read(len(view)) if device is not None else bytes(len(view))
+        view[:] = data
+        self.transactions.append(("r", address, TransactionFlag(flag), data))
+        return len(view)
+
+    def read_ex(self, handle: Any, address: int, flag: Any, count: int) -> bytes:
+        buffer = bytearray(count)
+        count = self.read_ex_into(handle, address, flag, buffer)
+        return bytes(buffer[:count])
+
+    def write(self, handle: Any, address: int, data: bytes) -> int:
+        return self.write_ex(handle, address, TransactionFlag.START_AND_STOP, data)
+
+    def read(self, handle: Any, address: int, count: int) -> bytes:
+        return self.read_ex(handle, address, TransactionFlag.START_AND_STOP, count)
+
+    def get_status(self, handle: Any) -> CtrlStatus:
+        self.status_polls += 1
+        if self.busy_polls > 0:
+            self.busy_polls -= 1
+            return CtrlStatus.CONTROLLER_BUSY
+        return self.status
+
+    def get_status_byte(self, handle: Any) -> int:
+        return int(self.get_status(handle))
+
+    def reset(self, handle: Any) -> None:
+        self.resets += 1
+        self.status = CtrlStatus.IDLE
+
+    def reset_bus(self, handle: Any) -> None:
+        self.bus_resets += 1
+
+    def install(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in (
+            "write_ex",
+            "read_ex",
+            "read_ex_into",
+            "write",
+            "read",
+            "get_status",
+            "get_status_byte",
+            "reset",
+            "reset_bus",
+        ):
+            monkeypatch.setattr(i2c_master_module, name, getattr(self, name))
+        monkeypatch.setattr(
+            i2c_master_module,
+            "try_write_ex",
+            lambda *args: Ok(self.write_ex(*args)),
+        )
+        monkeypatch.setattr(
+            i2c_master_module,
+            "try_read_ex_into",
+            lambda *args: Ok(self.read_ex_into(*args)),
+        )
+        monkeypatch.setattr(
+            i2c_master_module,
+            "try_get_status",
+            lambda handle: Ok(self.get_status(handle)),
+        )
+
+
+class FakeI2CSlave:
+    """Simulated 'I2CSlave' with Rx data pushed by the test (the master side)."""
+
+    rx: bytearray
+    tx: List[bytes]
+    """Data of every 'write()' call (staged for the master)."""
+    resets: int
+    clock_stretch: bool
+
+    def __init__(self) -> None:
+        self.rx = bytearray()
+        self.tx = []
+        self.resets = 0
+        self.clock_stretch = False
+        self._lock = threading.Lock()
+
+    def push(self, data: bytes) -> None:
+        with self._lock:
+            self.rx += data
+
+    def get_rx_status(self) -> int:
+        with self._lock:
+            return len(self.rx)
+
+    def readinto(self, buffer: WritableBuffer) -> int:
+        view = memoryview(buffer).cast("B")
+        with self._lock:
+            count = min(len(view), len(self.rx))
+            view[:count] = self.rx[:count]
+            del self.rx[:count]
+        return count
+
+    def read(self, read_byte_count: int) -> bytes:
+        buffer = bytearray(read_byte_count)
+        return bytes(buffer[: self.readinto(buffer)])
+
+    def write(self, data: bytes) -> int:
+        with self._lock:
+            self.tx.append(bytes(data))
+        return len(data)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.resets += 1
+
+    def set_clock_stretch(self, enable: bool) -> None:
+        self.clock_stretch = enable
+
+
+class FakeGpio:
+    """Simulated 'Gpio' trigger event queues, events are pushed by the test."""
+
+    queues: Dict[Any, List[int]]
+
+    def __init__(self) -> None:
+        self.queues = {}
+        self._lock = threading.Lock()
+
+    def push(self, port: Any, *events: int) -> None:
+        with self._lock:
+            self.queues.setdefault(port, []).extend(int(event) for event in events)
+
+    def get_queued_trigger_event_count(self, port_id: Any) -> int:
+        with self._lock:
+            return len(self.queues.get(port_id, ()))
+
+    def read_trigger_queue_into(self, port_id: Any, buffer: WritableBuffer) -> int:
+        view = memoryview(buffer).cast("B").cast("I")
+        with self._lock:
+            events = self.queues.get(port_id, [])
+            count = min(len(view), len(events))
+            view[:count] = array("I", events[:count])
+            del events[:count]
+        return count
+
+
+def wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    """Wait until a background thread makes the predicate true."""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, "Condition not met in time!"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def fake_i2c(monkeypatch: pytest.MonkeyPatch) -> Tuple[FakeI2CDriver, I2CMaster[Any]]:
+    driver = FakeI2CDriver()
+    driver.install(monkeypatch)
+    i2c_master: I2CMaster[Any] = I2CMaster(object(), None)  # type: ignore
+    monkeypatch.setattr(i2c_master, "get_max_transfer_size", lambda: 64)
+    return driver, i2c_master
+
+
+@pytest.fixture
+def fake_gpio(monkeypatch: pytest.MonkeyPatch) -> Tuple[FakeGpio, Gpio[Any]]:
+    queues = FakeGpio()
+    monkeypatch.setattr(
+        gpio_module,
+        "get_trigger_status",
+        lambda handle, port_id: queues.get_queued_trigger_event_count(port_id),
+    )
+    monkeypatch.setattr(
+        gpio_module,
+        "read_trigger_queue_into",
+        lambda handle, port_id, buffer: queues.read_trigger_queue_into(port_id, buffer),
+    )
+    gpio: Gpio[Any] = Gpio(object(), None)  # type: ignore
+    return queues, gpio
@@ -0,0 +1,133 @@
+from typing import List
+
+import pytest
+
+from pyft4222.acquisition import DrdyAcquisition, SampleRing
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+from tests.unit.fakes import fake_gpio, wait_for  # noqa: F401
+
+
+class _FakeSpiMaster:
+    """Answers each transfer with the command byte followed by a counter."""
+
+    transfers: List[bytes]
+
+    def __init__(self) -> None:
+        self.transfers = []
+
+    def single_read_write(self, data: bytes) -> bytes:
+        self.transfers.append(bytes(data))
+        return bytes([0xFF, len(self.transfers)]) + bytes(len(data) - 2)
+
+
+def _append(ring: SampleRing, sequence: int) -> None:
+    ring.append(sequence, float(sequence), sequence - 0.5, bytes([sequence] * 2))
+
+
+def test_ring_pops_oldest_first():
+    ring = SampleRing(4, 2)
+    for sequence in range(3):
+        _append(ring, sequence)
+
+    assert len(ring) == 3
+    samples = ring.pop_all()
+    assert [sample.sequence for sample in samples] == [0, 1, 2]
+    assert samples[1] == (1, 1.0, 0.5, b"\x01\x01")
+    assert len(ring) == 0
+    assert ring.pop_all() == []
+
+
+def test_ring_wraps_around():
+    ring = SampleRing(4, 2)
+    for sequence in range(3):
+        _append(ring, sequence)
+    ring.pop_all()
+
+    # The head is now in the middle of the storage
+    for sequence in range(3, 7):
+        _append(ring, sequence)
+    samples = ring.pop_all()
+
+    assert [sample.sequence for sample in samples] == [3, 4, 5, 6]
+    assert [sample.data for sample in samples] == [
+        bytes([idx] * 2) for idx in range(3, 7)
+    ]
+    assert ring.overwritten == 0
+
+
+def test_ring_overwrites_oldest():
+    ring = SampleRing(3, 2)
+    for sequence in range(8):
+        _append(ring, sequence)
+
+    assert len(ring) == ring.capacity == 3
+    assert ring.overwritten == 5
+    assert [sample.sequence for sample in ring.pop_all()] == [5, 6, 7]
+
+
+def test_ring_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        SampleRing(0, 2)
+    with pytest.raises(ValueError):
+        SampleRing(2, 0)
+
+
+def _acquisition(gpio, spi_master, **kwargs) -> DrdyAcquisition:
+    gpio.set_input_trigger = lambda port, trigger: None
+    return DrdyAcquisition(gpio, spi_master, PortId.PORT_3, bytes(4), **kwargs)
+
+
+def test_coalesced_edges_are_missed(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+    spi_master = _FakeSpiMaster()
+    queues.push(PortId.PORT_3, GpioTrigger.FALLING)  # before start, discarded
+
+    with _acquisition(gpio, spi_master) as acquisition:
+        queues.push(PortId.PORT_3, *([GpioTrigger.FALLING] * 3))
+        wait_for(lambda: acquisition.get_stats().edges == 3)
+
+    stats = acquisition.get_stats()
+    assert stats.samples == 1
+    assert stats.missed_edges == 2
+    assert stats.overflow_polls == 0
+    assert acquisition.ring.pop_all()[0].data == b"\x01\x00\x00"
+
+
+def test_each_edge_is_read_without_coalescing(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+    spi_master = _FakeSpiMaster()
+
+    with _acquisition(gpio, spi_master, coalesce=False) as acquisition:
+        queues.push(PortId.PORT_3, *([GpioTrigger.FALLING] * 3))
+        wait_for(lambda: acquisition.get_stats().samples == 3)
+
+    stats = acquisition.get_stats()
+    assert (stats.edges, stats.missed_edges) == (3, 0)
+    samples = acquisition.ring.pop_all()
+    assert [sample.sequence for sample in samples] == [0, 1, 2]
+    assert all(sample.edge_after <= sample.timestamp for sample in samples)
+
+
+def test_full_queue_is_reported(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+
+    with _acquisition(gpio, _FakeSpiMaster(), overflow_level=4) as acquisition:
+        queues.push(PortId.PORT_3, *([GpioTrigger.FALLING] * 4))
+        wait_for(lambda: acquisition.get_stats().edges == 4)
+        queues.push(PortId.PORT_3, *([GpioTrigger.FALLING] * 2))
+        wait_for(lambda: acquisition.get_stats().edges == 6)
+
+    assert acquisition.get_stats().overflow_polls == 1
+
+
+def test_other_edge_is_ignored(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+    spi_master = _FakeSpiMaster()
+
+    with _acquisition(gpio, spi_master) as acquisition:
+        queues.push(PortId.PORT_3, GpioTrigger.RISING)
+        wait_for(lambda: not queues.queues[PortId.PORT_3])
+
+    assert acquisition.get_stats().edges == 0
+    assert spi_master.transfers == []
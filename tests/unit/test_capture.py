@@ -0,0 +1,158 @@
+import errno
+import os
+import time
+from typing import Any, List
+
+import pytest
+
+from pyft4222.capture import CaptureService, find_offset, read_index
+from pyft4222.sim import SimSpiLink
+
+_BLOCK_SIZE = 4096
+
+
+def _payload(size: int) -> bytes:
+    return bytes((idx * 7) & 0xFF for idx in range(size))
+
+
+def _wait_captured(capture: CaptureService, byte_count: int) -> None:
+    deadline = time.monotonic() + 2.0
+    while capture.get_stats().bytes_captured < byte_count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _capture_files(directory: Any, suffix: str) -> List[str]:
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(suffix)
+    )
+
+
+def test_rotation_and_index(tmp_path):
+    link = SimSpiLink()
+    data = _payload(5 * _BLOCK_SIZE)
+    capture = CaptureService(
+        link.slave,
+        str(tmp_path),
+        block_size=_BLOCK_SIZE,
+        max_file_size=2 * _BLOCK_SIZE,
+    )
+
+    with capture:
+        link.master.single_write(data)
+        _wait_captured(capture, len(data))
+
+    stats = capture.get_stats()
+    assert stats.bytes_written == len(data)
+    assert stats.blocks_written == 5
+    assert stats.files_written == 3
+
+    data_files = _capture_files(tmp_path, ".bin")
+    index_files = _capture_files(tmp_path, ".idx")
+    assert [os.path.getsize(path) for path in data_files] == [8192, 8192, 4096]
+    assert b"".join(open(path, "rb").read() for path in data_files) == data
+
+    entries = read_index(index_files[0])
+    assert [(entry.offset, entry.length) for entry in entries] == [
+        (0, _BLOCK_SIZE),
+        (_BLOCK_SIZE, _BLOCK_SIZE),
+    ]
+    assert entries[0].timestamp <= entries[1].timestamp
+    assert os.path.getsize(index_files[0]) == 2 * 20
+    assert find_offset(entries, entries[1].timestamp + 1.0) == _BLOCK_SIZE
+    assert find_offset([], 0.0) == 0
+
+
+def test_partial_block_flush(tmp_path):
+    link = SimSpiLink()
+    capture = CaptureService(
+        link.slave, str(tmp_path), block_size=_BLOCK_SIZE, flush_interval=0.01
+    )
+
+    with capture:
+        link.master.single_write(_payload(100))
+        _wait_captured(capture, 100)
+        deadline = time.monotonic() + 2.0
+        while capture.get_stats().blocks_written == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+
+        # The index is flushed with its block, not only on close
+        (index_path,) = _capture_files(tmp_path, ".idx")
+        assert [entry.length for entry in read_index(index_path)] == [100]
+
+        # The next block restores the block alignment of the file
+        link.master.single_write(_payload(_BLOCK_SIZE))
+        _wait_captured(capture, 100 + _BLOCK_SIZE)
+
+    entries = read_index(index_path)
+    assert [(entry.offset, entry.length) for entry in entries] == [
+        (0, 100),
+        (100, _BLOCK_SIZE - 100),
+        (_BLOCK_SIZE, 100),
+    ]
+
+
+class _ShortWriteFile:
+    def __init__(self, file: Any):
+        self._file = file
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+    def write(self, data: Any) -> int:
+        return self._file.write(data[:1000])
+
+
+class _ShortWriteCapture(CaptureService):
+    def _rotate(self) -> None:
+        super()._rotate()
+        self._data_file = _ShortWriteFile(self._data_file)  # type: ignore
+
+
+def test_short_writes(tmp_path):
+    link = SimSpiLink()
+    data = _payload(2 * _BLOCK_SIZE)
+    capture = _ShortWriteCapture(link.slave, str(tmp_path), block_size=_BLOCK_SIZE)
+
+    with capture:
+        link.master.single_write(data)
+        _wait_captured(capture, len(data))
+
+    (data_path,) = _capture_files(tmp_path, ".bin")
+    (index_path,) = _capture_files(tmp_path, ".idx")
+    assert open(data_path, "rb").read() == data
+    assert [entry.offset for entry in read_index(index_path)] == [0, _BLOCK_SIZE]
+
+
+class _FailingWriteCapture(CaptureService):
+    def _write_block(self, block: memoryview, read_at: float, timestamp: float):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+def test_writer_failure_stops_reader(tmp_path):
+    link = SimSpiLink()
+    capture = _FailingWriteCapture(
+        link.slave, str(tmp_path), block_size=_BLOCK_SIZE, flush_interval=0.01
+    )
+    capture.start()
+    link.master.single_write(_payload(_BLOCK_SIZE))
+
+    deadline = time.monotonic() + 2.0
+    while capture.error is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    assert capture._reader is not None
+    capture._reader.join(2.0)
+    assert not capture._reader.is_alive()
+
+    # The reader no longer drains the device
+    link.master.single_write(_payload(_BLOCK_SIZE))
+    time.sleep(0.05)
+    assert link.slave.get_rx_status() == _BLOCK_SIZE
+
+    with pytest.raises(OSError):
+        capture.stop()
+    assert capture.get_stats().dropped_chunks == 0
@@ -0,0 +1,92 @@
+import pytest
+
+from pyft4222.i2c.eeprom import Eeprom, EepromVerifyError
+from pyft4222.wrapper.i2c.master import TransactionFlag
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+
+class _WriteCycleDevice(FakeI2CDevice):
+    """An EEPROM not acknowledging during its internal write cycle."""
+
+    def __init__(self, size: int, address_width: int, cycle_polls: int):
+        super().__init__(size, address_width)
+        self.cycle_polls = cycle_polls
+
+    def write(self, flag: TransactionFlag, data: bytes) -> None:
+        super().write(flag, data)
+        if flag & TransactionFlag.STOP:
+            self.busy_polls = self.cycle_polls
+
+
+def test_split_page_boundaries():
+    eeprom = Eeprom(None, size=1024, page_size=16, address_width=2)  # type: ignore
+
+    assert list(eeprom._split(0x0E, 20, 16)) == [
+        (0x50, b"\x00\x0e", 2),
+        (0x50, b"\x00\x10", 16),
+        (0x50, b"\x00\x20", 2),
+    ]
+    assert list(eeprom._split(0x10, 16, 16)) == [(0x50, b"\x00\x10", 16)]
+    assert list(eeprom._split(0x1F, 1, 16)) == [(0x50, b"\x00\x1f", 1)]
+    assert list(eeprom._split(0x20, 0, 16)) == []
+
+
+def test_split_block_select():
+    # 24C04: 512 bytes, the 9th address bit is the lowest slave address bit
+    eeprom = Eeprom(None, size=512, page_size=16)  # type: ignore
+
+    assert list(eeprom._split(0xFE, 4, 16)) == [
+        (0x50, b"\xfe", 2),
+        (0x51, b"\x00", 2),
+    ]
+    assert list(eeprom._split(0x00, 512, 256)) == [
+        (0x50, b"\x00", 256),
+        (0x51, b"\x00", 256),
+    ]
+
+
+def test_write_read_with_ack_polling(fake_i2c):
+    driver, i2c_master = fake_i2c
+    device = _WriteCycleDevice(1024, 2, cycle_polls=3)
+    driver.devices[0x50] = device
+    eeprom = Eeprom(i2c_master, size=1024, page_size=16, address_width=2)
+    data = bytes(range(1, 21))
+
+    eeprom.write(0x0E, data, verify=True)
+
+    assert device.memory[0x0E : 0x0E + 20] == data
+    assert device.writes == [
+        b"\x00\x0e" + data[:2],
+        b"\x00\x10" + data[2:18],
+        b"\x00\x20" + data[18:],
+        b"\x00\x0e",
+    ]
+    stats = eeprom.get_stats()
+    assert stats.pages_written == 3
+    # 3 not acknowledged read probes and 1 acknowledged one per page
+    assert stats.ack_polls == 12
+    assert driver.resets == 0
+
+
+def test_write_cycle_timeout(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x50] = _WriteCycleDevice(256, 1, cycle_polls=10 ** 9)
+    eeprom = Eeprom(i2c_master, write_timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        eeprom.write(0x00, b"\x01")
+    assert driver.resets == 1
+
+
+def test_verify_error(fake_i2c):
+    driver, i2c_master = fake_i2c
+    device = FakeI2CDevice()
+    driver.devices[0x50] = device
+    eeprom = Eeprom(i2c_master)
+    device.write = lambda flag, data: FakeI2CDevice.write(  # type: ignore
+        device, flag, data[:1] if flag & TransactionFlag.STOP else data
+    )
+
+    with pytest.raises(EepromVerifyError) as error:
+        eeprom.write(0x10, b"\x01\x02", verify=True)
+    assert error.value.address == 0x10
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from pyft4222.events import GpioEventStream
+from pyft4222.polling import PollStrategy
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+from tests.unit.fakes import FakeGpio, wait_for
+
+_FAST = PollStrategy(spin_polls=1, initial_interval=0.0005, max_interval=0.001)
+_RISING = GpioTrigger.RISING
+_FALLING = GpioTrigger.FALLING
+
+
+def test_iteration_after_stop():
+    gpio = FakeGpio()
+    stream = GpioEventStream(gpio, [PortId.PORT_0, PortId.PORT_1], poll_strategy=_FAST)
+
+    with stream:
+        gpio.push(PortId.PORT_1, _RISING, _FALLING)
+        wait_for(lambda: stream.get_stats().events == 2)
+        gpio.push(PortId.PORT_0, _RISING)
+        wait_for(lambda: stream.get_stats().events == 3)
+
+    events = list(stream)
+    assert [(e.port, e.trigger) for e in events] == [
+        (PortId.PORT_1, _RISING),
+        (PortId.PORT_1, _FALLING),
+        (PortId.PORT_0, _RISING),
+    ]
+    assert events[0].timestamp == events[1].timestamp <= events[2].timestamp
+    assert isinstance(events[0].trigger, GpioTrigger)
+
+
+def test_callback_and_stats():
+    gpio = FakeGpio()
+    received = []
+    stream = GpioEventStream(
+        gpio,
+        [PortId.PORT_2],
+        callback=received.append,
+        queue_size=0,
+        poll_strategy=_FAST,
+        overflow_level=3,
+    )
+
+    with stream:
+        gpio.push(PortId.PORT_2, _RISING, _FALLING)
+        wait_for(lambda: len(received) == 2)
+        gpio.push(PortId.PORT_2, _RISING, _FALLING, _RISING)
+        wait_for(lambda: len(received) == 5)
+
+    stats = stream.get_stats()
+    assert (stats.events, stats.max_pending, stats.overflow_polls) == (5, 3, 1)
+    assert stats.polls >= 2 and stats.dropped == 0
+    assert stats.latency.count == 2
+    with pytest.raises(RuntimeError):
+        stream.get()
+
+    stream.reset_stats()
+    assert stream.get_stats().events == 0
+
+
+def test_overflow_level_defaults_to_driver_depth():
+    gpio = FakeGpio()
+    stream = GpioEventStream(gpio, [PortId.PORT_0], queue_size=0, poll_strategy=_FAST)
+    gpio.push(PortId.PORT_0, *([_RISING] * 0xFFFF))
+
+    with stream:
+        wait_for(lambda: stream.get_stats().events == 0xFFFF)
+
+    assert stream.get_stats().overflow_polls == 1
+
+
+def test_full_queues_count_drops():
+    gpio = FakeGpio()
+    stream = GpioEventStream(gpio, [PortId.PORT_0], queue_size=1, poll_strategy=_FAST)
+
+    async def consume():
+        async_queue = stream.async_queue(maxsize=1)
+        with stream:
+            gpio.push(PortId.PORT_0, _RISING, _FALLING, _RISING)
+            while stream.get_stats().events < 3:
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.01)
+        return async_queue.qsize()
+
+    assert asyncio.run(consume()) == 1
+    # Two events dropped by each of the iteration and asyncio queues
+    assert stream.get_stats().dropped == 4
+    assert [event.trigger for event in stream] == [_RISING]
+
+
+def test_stop_reraises_thread_error():
+    gpio = FakeGpio()
+    stream = GpioEventStream(gpio, [PortId.PORT_0], poll_strategy=_FAST)
+
+    def fail(port_id):
+        raise OSError("USB transfer failed!")
+
+    stream.start()
+    with pytest.raises(RuntimeError):
+        stream.start()
+    gpio.get_queued_trigger_event_count = fail
+    wait_for(lambda: not stream.running)
+    assert list(stream) == []
+    with pytest.raises(OSError):
+        stream.stop()
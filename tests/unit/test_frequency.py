@@ -0,0 +1,84 @@
+from array import array
+
+import pytest
+
+from pyft4222 import frequency
+from pyft4222.frequency import FrequencyCounter, FrequencyMeasurement, _count_events
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+from tests.unit.fakes import fake_gpio  # noqa: F401
+
+_R = int(GpioTrigger.RISING)
+_F = int(GpioTrigger.FALLING)
+
+
+@pytest.fixture(params=["numpy", "regex"])
+def counting_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(frequency, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "events, previous, expected",
+    [
+        ([], 0, (0, 0, 0)),
+        ([_R, _F, _R, _F], 0, (2, 2, 0)),
+        ([_F, _R, _F], _R, (1, 2, 0)),
+        ([_R, _R, _F, _F, _F], 0, (2, 3, 3)),
+        # Repeats across two reads are found through the previous event
+        ([_R, _F], _R, (1, 1, 1)),
+        ([_F, _R], _F, (1, 1, 1)),
+    ],
+)
+def test_count_events(events, previous, expected, counting_path):
+    assert _count_events(array("I", events), previous) == expected
+
+
+def _counter(gpio) -> FrequencyCounter:
+    gpio.set_input_trigger = lambda port, trigger: None
+    return FrequencyCounter(gpio, PortId.PORT_2)
+
+
+def test_measure_counts_edges(fake_gpio, counting_path):  # noqa: F811
+    queues, gpio = fake_gpio
+    counter = _counter(gpio)
+    counter.arm()
+
+    queues.push(PortId.PORT_2, *([_R, _F] * 500))
+    result = counter.measure(0.01)
+
+    assert (result.rising, result.falling) == (500, 500)
+    assert result.frequency == pytest.approx(500 / result.elapsed)
+    assert result.min_hz == pytest.approx(1.0 / result.elapsed)
+    assert not result.overflow
+    assert result.max_hz > 0.0
+
+
+def test_repeat_across_windows_is_an_overflow(fake_gpio, counting_path):  # noqa: F811
+    queues, gpio = fake_gpio
+    counter = _counter(gpio)
+    counter.arm()
+
+    queues.push(PortId.PORT_2, _R, _F, _R)
+    assert not counter.measure(0.005).overflow
+    queues.push(PortId.PORT_2, _R, _F)
+    assert counter.measure(0.005).overflow
+
+
+def test_check_ignores_the_read_rate(fake_gpio):  # noqa: F811
+    _, gpio = fake_gpio
+    counter = _counter(gpio)
+    # A fast signal drained in bulk, above the queue read rate
+    result = FrequencyMeasurement(1000.0, 1000, 1000, 1.0, 1.0, 400.0, False)
+    counter.measure = lambda window: result  # type: ignore
+
+    assert counter.check(1000.0, tolerance=0.01)
+    assert not counter.check(1100.0, tolerance=0.01)
+    # Below the resolution of the window
+    assert not counter.check(0.5, tolerance=10.0)
+
+    counter.measure = lambda window: result._replace(overflow=True)  # type: ignore
+    assert not counter.check(1000.0, tolerance=0.01)
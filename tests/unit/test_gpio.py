@@ -0,0 +1,98 @@
+import pytest
+
+from pyft4222 import gpio as gpio_module
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.gpio import PortId
+from tests.unit.fakes import fake_gpio  # noqa: F401
+
+_EVENTS = [
+    GpioTrigger.RISING,
+    GpioTrigger.FALLING,
+    GpioTrigger.RISING,
+    GpioTrigger.LEVEL_HIGH,
+    GpioTrigger.LEVEL_LOW,
+    GpioTrigger.LEVEL_LOW,
+    GpioTrigger.LEVEL_LOW,
+]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def counting_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(gpio_module, "np", None)
+    return request.param
+
+
+def test_count_triggers(fake_gpio, counting_path):  # noqa: F811
+    queues, gpio = fake_gpio
+
+    # A large read first, so the reused buffer holds stale events afterwards
+    queues.push(PortId.PORT_1, *([GpioTrigger.RISING] * 100))
+    assert tuple(gpio.count_triggers(PortId.PORT_1)) == (100, 0, 0, 0)
+
+    queues.push(PortId.PORT_1, *_EVENTS)
+    counts = gpio.count_triggers(PortId.PORT_1)
+    assert tuple(counts) == (2, 1, 1, 3)
+    assert counts.total == len(_EVENTS)
+
+    assert tuple(gpio.count_triggers(PortId.PORT_1)) == (0, 0, 0, 0)
+
+
+def test_read_trigger_array_is_a_copy(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+
+    queues.push(PortId.PORT_0, *_EVENTS)
+    first = gpio.read_trigger_array(PortId.PORT_0)
+    queues.push(PortId.PORT_0, GpioTrigger.FALLING, GpioTrigger.FALLING)
+    second = gpio.read_trigger_array(PortId.PORT_0)
+
+    assert first.typecode == "I"
+    assert first.tolist() == [int(event) for event in _EVENTS]
+    assert second.tolist() == [GpioTrigger.FALLING] * 2
+    assert len(gpio.read_trigger_array(PortId.PORT_0)) == 0
+
+
+def test_interrupt_batch_shares_one_latency(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+
+    queues.push(PortId.PORT_3, GpioTrigger.RISING, GpioTrigger.FALLING)
+    events = gpio.wait_interrupt(timeout=1.0)
+
+    assert [event.trigger for event in events] == [
+        GpioTrigger.RISING,
+        GpioTrigger.FALLING,
+    ]
+    assert events[0].timestamp == events[1].timestamp
+    assert events[0].latency == events[1].latency >= 0.0
+    # One latency per batch, not per event
+    latency = gpio.get_interrupt_latency()
+    assert latency.count == 1
+    assert latency.maximum == events[0].latency
+
+
+def test_interrupt_timeout(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+
+    assert gpio.wait_interrupt(timeout=0.01) == []
+    assert gpio.get_interrupt_latency().count == 0
+
+
+def test_interrupts_iterate_batches(fake_gpio):  # noqa: F811
+    queues, gpio = fake_gpio
+    queues.push(PortId.PORT_3, GpioTrigger.FALLING, GpioTrigger.FALLING)
+
+    events = []
+    for event in gpio.interrupts(timeout=0.01):
+        events.append(event)
+        if len(events) == 2:
+            queues.push(PortId.PORT_3, GpioTrigger.RISING)
+
+    assert [event.trigger for event in events] == [
+        GpioTrigger.FALLING,
+        GpioTrigger.FALLING,
+        GpioTrigger.RISING,
+    ]
+    assert events[0].timestamp == events[1].timestamp <= events[2].timestamp
+    assert gpio.get_interrupt_latency().count == 2
@@ -0,0 +1,181 @@
+import pytest
+
+from pyft4222.i2c import master as i2c_master_module
+from pyft4222.i2c.master import ScanMethod
+from pyft4222.wrapper import Ft4222Exception
+from pyft4222.wrapper.i2c.master import TransactionFlag
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+
+def _sensor() -> FakeI2CDevice:
+    device = FakeI2CDevice()
+    device.memory[:] = bytes(range(256))
+    return device
+
+
+def test_read_registers(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = _sensor()
+
+    result = i2c_master.read_registers(
+        [(0x40, 0x10, 2), (0x41, 0x00, 1), (0x40, 0x20, 3)]
+    )
+
+    assert [bytes(view) for view in result.data] == [b"\x10\x11", b"", b"\x20\x21\x22"]
+    assert result.failed == [1]
+    assert driver.resets == 1
+
+
+def test_read_registers_results_are_independent(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = _sensor()
+
+    first = i2c_master.read_registers([(0x40, 0x10, 2)])
+    second = i2c_master.read_registers([(0x40, 0x20, 2)])
+
+    assert bytes(first.data[0]) == b"\x10\x11"
+    assert bytes(second.data[0]) == b"\x20\x21"
+
+
+def test_read_registers_reuse_buffer(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = _sensor()
+
+    first = i2c_master.read_registers([(0x40, 0x10, 2)], reuse_buffer=True)
+    kept = bytes(first.data[0])
+    second = i2c_master.read_registers([(0x40, 0x20, 2)], reuse_buffer=True)
+
+    # Views of a reused buffer are overwritten by the next batch
+    assert kept == b"\x10\x11"
+    assert bytes(first.data[0]) == b"\x20\x21"
+    assert bytes(second.data[0]) == b"\x20\x21"
+
+
+def test_write_registers(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = FakeI2CDevice()
+
+    failed = i2c_master.write_registers([(0x40, 0x05, b"\xaa\xbb"), (0x41, 0x00, b"")])
+
+    assert failed == [1]
+    assert driver.devices[0x40].memory[5:7] == b"\xaa\xbb"
+
+
+def test_scan_uses_read_probes(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x20] = FakeI2CDevice()
+    driver.devices[0x50] = FakeI2CDevice()
+
+    assert i2c_master.scan(range(0x10, 0x60)) == {0x20, 0x50}
+    assert all(kind == "r" for kind, _, _, _ in driver.transactions)
+    assert driver.devices[0x20].writes == []
+
+    assert i2c_master.probe(0x20, ScanMethod.WRITE)
+    assert driver.transactions[-1] == (
+        "w",
+        0x20,
+        TransactionFlag.START_AND_STOP,
+        b"\x00",
+    )
+
+
+def test_probe_waits_for_busy_controller(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = FakeI2CDevice()
+    driver.busy_polls = 3
+
+    assert i2c_master.probe(0x40)
+    assert driver.status_polls == 4
+
+    driver.busy_polls = 10 ** 9
+    assert not i2c_master.probe(0x40)
+    assert driver.resets == 1
+
+
+_START = TransactionFlag.START
+_STOP = TransactionFlag.STOP
+_NONE = TransactionFlag.NONE
+
+
+@pytest.fixture
+def chunked(fake_i2c, monkeypatch):
+    driver, i2c_master = fake_i2c
+    # Two 64-byte USB packets per chunk
+    monkeypatch.setattr(i2c_master_module, "_MAX_CHUNK_SIZE", 130)
+    driver.devices[0x50] = FakeI2CDevice(size=512, address_width=2)
+    return driver, i2c_master
+
+
+def _flags(driver):
+    return [(kind, flag, len(data)) for kind, _, flag, data in driver.transactions]
+
+
+def test_write_chunked_sequencing(chunked):
+    driver, i2c_master = chunked
+    data = bytes(range(256)) + bytes(44)
+
+    assert i2c_master.write_chunked(0x50, data) == 300
+    assert _flags(driver) == [("w", _START, 128), ("w", _NONE, 128), ("w", _STOP, 44)]
+    assert driver.devices[0x50].writes[0] == data[:128]
+
+
+def test_read_chunked_sequencing(chunked):
+    driver, i2c_master = chunked
+    device = driver.devices[0x50]
+    device.memory[:] = bytes(range(256)) * 2
+
+    i2c_master.write_ex(0x50, _START, b"\x00\x10")
+    data = i2c_master.read_chunked(0x50, 200, TransactionFlag.REPEATED_START)
+
+    assert data == (bytes(range(256)) * 2)[0x10:0xD8]
+    assert _flags(driver)[1:] == [
+        ("r", TransactionFlag.REPEATED_START, 128),
+        ("r", _STOP, 72),
+    ]
+
+
+def test_chunked_without_stop(chunked):
+    driver, i2c_master = chunked
+
+    i2c_master.write_chunked(0x50, bytes(130), stop=False)
+    i2c_master.write_chunked(0x50, bytes(10), first_flag=_NONE)
+
+    assert _flags(driver) == [
+        ("w", _START, 128),
+        ("w", _NONE, 2),
+        ("w", _STOP, 10),
+    ]
+
+
+def test_single_chunk_has_start_and_stop(chunked):
+    driver, i2c_master = chunked
+
+    i2c_master.read_chunked(0x50, 16)
+    assert _flags(driver) == [("r", TransactionFlag.START_AND_STOP, 16)]
+
+
+@pytest.mark.parametrize("flag", [TransactionFlag.START_AND_STOP, TransactionFlag.STOP])
+def test_chunked_rejects_stop_in_first_flag(chunked, flag):
+    driver, i2c_master = chunked
+
+    with pytest.raises(ValueError):
+        i2c_master.write_chunked(0x50, bytes(300), first_flag=flag)
+    with pytest.raises(ValueError):
+        i2c_master.read_chunked(0x50, 300, first_flag=flag)
+    assert driver.transactions == []
+
+
+def test_short_chunk_releases_the_bus(chunked):
+    driver, i2c_master = chunked
+    driver.transfer_limit = 100
+
+    with pytest.raises(Ft4222Exception):
+        i2c_master.write_chunked(0x50, bytes(300))
+    assert _flags(driver) == [("w", _START, 100)]
+    assert driver.resets == 1
+
+    driver.transactions.clear()
+    with pytest.raises(Ft4222Exception):
+        i2c_master.read_chunked(0x50, 300)
+    assert _flags(driver) == [("r", _START, 100)]
+    assert driver.resets == 2
@@ -0,0 +1,94 @@
+import math
+
+import pytest
+
+from pyft4222.metrics import Histogram, SlaveMonitor
+
+
+def test_histogram_buckets():
+    histogram = Histogram([1.0, 2.0, 4.0])
+    for value in (0.5, 1.0, 1.5, 4.0, 10.0):
+        histogram.record(value)
+    histogram.record(3.0, weight=3)
+
+    snapshot = histogram.snapshot()
+    # Bounds are inclusive, the last bucket is unbounded
+    assert snapshot.counts == (2, 1, 4, 1)
+    assert snapshot.count == 8
+    assert snapshot.total == pytest.approx(26.0)
+    assert snapshot.mean == pytest.approx(3.25)
+    assert (snapshot.minimum, snapshot.maximum) == (0.5, 10.0)
+
+
+def test_histogram_percentile():
+    histogram = Histogram.exponential(1.0, bucket_count=4)
+    assert math.isnan(histogram.snapshot().percentile(0.5))
+
+    for value in range(1, 11):
+        histogram.record(value)
+    snapshot = histogram.snapshot()
+
+    assert snapshot.bounds == (1.0, 2.0, 4.0, 8.0)
+    assert snapshot.percentile(0.0) == 1.0
+    assert snapshot.percentile(0.1) == 1.0
+    assert snapshot.percentile(0.4) == 4.0
+    assert snapshot.percentile(0.8) == 8.0
+    # Values above the last bound are represented by the maximum
+    assert snapshot.percentile(1.0) == 10.0
+    with pytest.raises(ValueError):
+        snapshot.percentile(1.5)
+
+
+def test_histogram_reset_and_snapshot():
+    histogram = Histogram([1.0])
+    histogram.record(0.5)
+    snapshot = histogram.snapshot()
+    histogram.reset()
+
+    # Snapshots are not affected by later changes
+    assert snapshot.count == 1
+    empty = histogram.snapshot()
+    assert empty.counts == (0, 0)
+    assert empty.count == 0
+    assert math.isnan(empty.mean)
+    assert math.isnan(empty.minimum) and math.isnan(empty.maximum)
+
+
+def test_histogram_invalid_bounds():
+    with pytest.raises(ValueError):
+        Histogram([])
+    with pytest.raises(ValueError):
+        Histogram([1.0, 1.0])
+
+
+def test_slave_monitor():
+    monitor = SlaveMonitor()
+    monitor.on_rx_status(10, timestamp=1.0)
+    monitor.on_rx_status(15, timestamp=2.0)
+    monitor.on_read(12, timestamp=3.0)
+    # 2 bytes arrived after the last poll
+    monitor.on_read(5, timestamp=4.0)
+
+    snapshot = monitor.snapshot()
+    assert (snapshot.polls, snapshot.reads) == (2, 2)
+    assert snapshot.latency.count == 17
+    assert snapshot.latency.total == pytest.approx(10 * 2.0 + 2 * 1.0 + 3 * 2.0)
+    assert snapshot.arrival_window.total == pytest.approx(5 * 1.0 + 2 * 2.0)
+    assert snapshot.queue_depth.count == 2
+    assert snapshot.read_size.total == pytest.approx(17.0)
+
+    monitor.reset()
+    assert monitor.snapshot().latency.count == 0
+
+
+def test_slave_monitor_unobserved_consumption():
+    monitor = SlaveMonitor()
+    monitor.on_rx_status(10, timestamp=1.0)
+    # Queue emptied without a read (e.g., reset), nothing is recorded
+    monitor.on_rx_status(0, timestamp=2.0)
+    monitor.on_rx_status(4, timestamp=3.0)
+    monitor.on_read(4, timestamp=5.0)
+
+    latency = monitor.snapshot().latency
+    assert latency.count == 4
+    assert latency.total == pytest.approx(4 * 2.0)
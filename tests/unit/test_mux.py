@@ -0,0 +1,136 @@
+import pytest
+
+from pyft4222.i2c.mux import I2CMux
+from pyft4222.wrapper import Ft4222Exception
+from pyft4222.wrapper.i2c.master import TransactionFlag
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+_START_STOP = TransactionFlag.START_AND_STOP
+
+
+def _mux(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x70] = FakeI2CDevice(size=1)
+    driver.devices[0x40] = FakeI2CDevice()
+    return driver, I2CMux(i2c_master, 0x70, channel_count=4)
+
+
+def _selects(driver):
+    return [data for kind, address, _, data in driver.transactions if address == 0x70]
+
+
+def test_channel_select_byte(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+
+    mux.select(2)
+    mux.select_mask(0b1001)
+    mux.select_mask(0)
+
+    assert driver.transactions == [
+        ("w", 0x70, _START_STOP, b"\x04"),
+        ("w", 0x70, _START_STOP, b"\x09"),
+        ("w", 0x70, _START_STOP, b"\x00"),
+    ]
+    assert mux.selected == 0
+
+    with pytest.raises(ValueError):
+        mux.select(4)
+    with pytest.raises(ValueError):
+        mux.select_mask(0x10)
+
+
+def test_selection_is_cached(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+    bus = mux.channel(1)
+
+    bus.write(0x40, b"\x10\xaa")
+    assert bus.read(0x40, 1) == b"\x00"
+    bus.write(0x40, b"\x10")
+    assert bus.read(0x40, 1) == b"\xaa"
+
+    assert _selects(driver) == [b"\x02"]
+    assert tuple(mux.get_stats()) == (1, 3)
+
+    mux.invalidate()
+    assert mux.selected is None
+    bus.probe(0x40)
+    assert _selects(driver) == [b"\x02", b"\x02"]
+
+
+def test_failed_select_leaves_selection_unknown(fake_i2c, monkeypatch):
+    driver, mux = _mux(fake_i2c)
+    mux.select(0)
+
+    def fail(*args):
+        raise OSError("USB transfer failed!")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(mux._i2c_master, "write", fail)
+        with pytest.raises(OSError):
+            mux.select(1)
+    assert mux.selected is None
+
+    mux.select(1)
+    assert mux.selected == 0b10
+
+
+def test_absent_mux_is_not_cached(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+    mux.select(1)
+    del driver.devices[0x70]
+
+    with pytest.raises(Ft4222Exception):
+        mux.select(0)
+    assert mux.selected is None
+    assert driver.resets == 1
+
+    # Retried, not skipped as already selected
+    with pytest.raises(Ft4222Exception):
+        mux.select(0)
+    assert _selects(driver) == [b"\x02", b"\x01", b"\x01"]
+
+    with pytest.raises(Ft4222Exception):
+        mux.read_selection()
+    assert mux.selected is None
+
+
+def test_busy_mux_is_retried(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+    driver.devices[0x70].busy_polls = 1
+
+    with pytest.raises(Ft4222Exception):
+        mux.select(2)
+    mux.select(2)
+
+    assert mux.selected == 0b100
+    assert tuple(mux.get_stats()) == (1, 0)
+
+
+def test_read_selection_updates_cache(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+    driver.devices[0x70].memory[0] = 0b0100
+
+    assert mux.read_selection() == 0b0100
+    mux.select(2)
+    assert _selects(driver) == [b"\x04"]
+
+
+def test_run_grouped_starts_with_selected_channel(fake_i2c):
+    driver, mux = _mux(fake_i2c)
+    mux.select(3)
+    order = []
+
+    def access(tag):
+        return lambda i2c_master: order.append(tag) or tag
+
+    results = mux.run_grouped(
+        [(1, access("a")), (3, access("b")), (1, access("c")), (0, access("d"))]
+    )
+
+    assert results == ["a", "b", "c", "d"]
+    assert order == ["b", "d", "a", "c"]
+    assert _selects(driver) == [b"\x08", b"\x01", b"\x02"]
+
+    driver.transactions.clear()
+    mux.run_grouped([(0, access("e")), (2, access("f"))], reorder=False)
+    assert _selects(driver) == [b"\x01", b"\x04"]
@@ -0,0 +1,87 @@
+import pytest
+
+from pyft4222.i2c.pmbus import (
+    PMBus,
+    decode_linear11,
+    decode_linear16,
+    encode_linear11,
+)
+from pyft4222.smbus import crc8
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "word, value",
+    [
+        (0xF0C8, 50.0),  # exponent -2, mantissa 200
+        (0xE320, 50.0),  # exponent -4, mantissa 800
+        (0x0001, 1.0),
+        (0x0FFF, -2.0),  # exponent 1, mantissa -1
+        (0xFFFF, -0.5),  # exponent -1, mantissa -1
+        (0x7BFF, 1023 * 2.0 ** 15),
+    ],
+)
+def test_decode_linear11(word, value):
+    assert decode_linear11(word) == value
+
+
+@pytest.mark.parametrize(
+    "value, word",
+    [(50.0, 0xE320), (-0.5, 0xAC00), (0.0, 0x8000), (1023 * 2.0 ** 15, 0x7BFF)],
+)
+def test_encode_linear11(value, word):
+    assert encode_linear11(value) == word
+    assert decode_linear11(word) == value
+
+
+def test_encode_linear11_out_of_range():
+    with pytest.raises(ValueError):
+        encode_linear11(1024 * 2.0 ** 15)
+
+
+@pytest.mark.parametrize(
+    "word, vout_mode, value",
+    [
+        (0x0266, 0x17, 614 / 512),  # exponent -9
+        (0x1A66, 0x14, 6758 / 4096),  # exponent -12
+        (0x0003, 0x01, 6.0),
+    ],
+)
+def test_decode_linear16(word, vout_mode, value):
+    assert decode_linear16(word, vout_mode) == value
+
+
+def test_decode_linear16_rejects_other_modes():
+    with pytest.raises(ValueError):
+        decode_linear16(0x0266, 0x40 | 0x17)
+
+
+def test_read_linear16_caches_vout_mode(fake_i2c):
+    driver, i2c_master = fake_i2c
+    device = FakeI2CDevice()
+    driver.devices[0x40] = device
+    device.memory[0x20] = 0x17
+    device.memory[0x8B:0x8D] = (0x0266).to_bytes(2, "little")
+    pmbus = PMBus(i2c_master, pec=False)
+
+    assert pmbus.read_linear16(0x40) == 614 / 512
+    assert pmbus.read_linear16(0x40) == 614 / 512
+    mode_reads = [data for kind, _, _, data in driver.transactions if data == b"\x20"]
+    assert len(mode_reads) == 1
+
+
+def test_read_bulk_verifies_pec(fake_i2c):
+    driver, i2c_master = fake_i2c
+    device = FakeI2CDevice()
+    driver.devices[0x40] = device
+    device.memory[0x88:0x8A] = b"\xc8\xf0"
+    device.memory[0x8A] = crc8(bytes((0x80, 0x88, 0x81, 0xC8, 0xF0)))
+    device.memory[0x8C:0x8E] = b"\x01\x00"
+    device.memory[0x8E] = 0x00
+    pmbus = PMBus(i2c_master)
+
+    assert pmbus.read_bulk_linear11([(0x40, 0x88), (0x40, 0x8C), (0x41, 0x88)]) == [
+        50.0,
+        None,
+        None,
+    ]
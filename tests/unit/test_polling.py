@@ -0,0 +1,43 @@
+import itertools
+
+from pyft4222.polling import PollStrategy, poll_until
+
+
+def test_intervals():
+    strategy = PollStrategy(
+        spin_polls=2, initial_interval=0.001, max_interval=0.004, growth=2.0
+    )
+
+    assert list(itertools.islice(strategy.intervals(), 6)) == [
+        0.0,
+        0.0,
+        0.001,
+        0.002,
+        0.004,
+        0.004,
+    ]
+
+
+def test_poll_until_done():
+    values = iter([3, 2, 1, 0, 5])
+
+    result = poll_until(lambda: next(values), lambda value: value == 0, 1.0)
+
+    assert (result.ok, result.value, result.polls) == (True, 0, 4)
+    assert result.elapsed >= 0.0
+
+
+def test_poll_until_timeout():
+    strategy = PollStrategy(spin_polls=0, initial_interval=0.002, max_interval=0.002)
+
+    result = poll_until(lambda: 1, lambda value: value == 0, 0.01, strategy)
+
+    assert (result.ok, result.value) == (False, 1)
+    assert 2 <= result.polls <= 7
+    assert result.elapsed >= 0.01
+
+
+def test_poll_until_zero_timeout_polls_once():
+    result = poll_until(lambda: 7, lambda value: False, 0.0)
+
+    assert (result.ok, result.value, result.polls) == (False, 7, 1)
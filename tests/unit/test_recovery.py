@@ -0,0 +1,115 @@
+import pytest
+
+from pyft4222.i2c.recovery import Fault, RecoveryPolicy, classify_status
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.wrapper.i2c.master import CtrlStatus
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+_POLICY = RecoveryPolicy(initial_backoff=0.0, max_backoff=0.0, status_timeout=0.001)
+
+
+@pytest.mark.parametrize(
+    "status, fault",
+    [
+        (CtrlStatus.IDLE, Fault.NONE),
+        (
+            CtrlStatus.CONTROLLER_BUSY | CtrlStatus.SLAVE_ADDR_NACK,
+            Fault.CONTROLLER_STUCK,
+        ),
+        (CtrlStatus.ARBITRATION_LOST | CtrlStatus.ERROR, Fault.ARBITRATION_LOST),
+        (CtrlStatus.SLAVE_ADDR_NACK | CtrlStatus.ERROR, Fault.ADDRESS_NACK),
+        (CtrlStatus.DATA_NACK | CtrlStatus.ERROR, Fault.DATA_NACK),
+        (CtrlStatus.BUS_BUSY | CtrlStatus.IDLE, Fault.BUS_STUCK),
+    ],
+)
+def test_classify_status(status, fault):
+    assert classify_status(status) == fault
+
+
+def test_data_nack_is_retried(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY)
+    failures = [CtrlStatus.DATA_NACK | CtrlStatus.ERROR] * 2
+
+    def transaction():
+        driver.status = failures.pop() if failures else CtrlStatus.IDLE
+        return 42
+
+    assert i2c_master.run_with_recovery(transaction, idempotent=True) == 42
+
+    stats = i2c_master.get_recovery_stats()
+    assert (stats.transactions, stats.retries, stats.failures) == (1, 2, 0)
+    assert (stats.data_nacks, stats.controller_resets) == (2, 2)
+    assert driver.resets == 2
+
+
+def test_address_nack_is_not_retried(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY)
+
+    with pytest.raises(Ft4222Exception):
+        i2c_master.read(0x40, 1)
+
+    stats = i2c_master.get_recovery_stats()
+    assert (stats.retries, stats.failures, stats.address_nacks) == (0, 1, 1)
+    assert len(driver.transactions) == 1
+
+
+def test_writes_are_not_retried_by_default(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY)
+    driver.devices[0x40] = FakeI2CDevice()
+    driver.devices[0x40].busy_polls = 1
+
+    with pytest.raises(Ft4222Exception):
+        i2c_master.write(0x40, b"\x00")
+    assert len(driver.transactions) == 1
+
+    i2c_master.set_recovery_policy(
+        _POLICY._replace(retry_writes=True, retry_on=frozenset((Fault.ADDRESS_NACK,)))
+    )
+    driver.devices[0x40].busy_polls = 1
+    assert i2c_master.write(0x40, b"\x00") == 1
+    assert i2c_master.get_recovery_stats().retries == 1
+
+
+def test_stuck_bus_is_released(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY._replace(max_retries=1))
+
+    def transaction():
+        driver.status = CtrlStatus.IDLE | CtrlStatus.BUS_BUSY
+
+    with pytest.raises(Ft4222Exception):
+        i2c_master.run_with_recovery(transaction, idempotent=True)
+
+    stats = i2c_master.get_recovery_stats()
+    assert (stats.bus_stuck, stats.bus_resets, stats.controller_resets) == (2, 2, 2)
+    assert (stats.retries, stats.failures) == (1, 1)
+    assert driver.bus_resets == 2
+
+
+def test_status_is_classified_after_controller_finishes(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY._replace(status_timeout=1.0))
+    driver.devices[0x40] = FakeI2CDevice()
+    driver.busy_polls = 5
+
+    assert i2c_master.read(0x40, 1) == b"\x00"
+    assert driver.status_polls == 6
+    assert i2c_master.get_recovery_stats().controller_stuck == 0
+
+
+def test_driver_error_is_retried(fake_i2c):
+    driver, i2c_master = fake_i2c
+    i2c_master.set_recovery_policy(_POLICY)
+    attempts = []
+
+    def transaction():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise Ft4222Exception(Ft4222Status.IO_ERROR, "USB transfer failed!")
+        return len(attempts)
+
+    assert i2c_master.run_with_recovery(transaction, idempotent=True) == 3
+    assert i2c_master.get_recovery_stats().driver_errors == 2
@@ -0,0 +1,111 @@
+import pytest
+
+from pyft4222.i2c.regfile import RegisterFileEngine
+from tests.unit.fakes import FakeI2CSlave, wait_for
+
+
+def _engine(**kwargs):
+    slave = FakeI2CSlave()
+    store = bytearray(range(32))
+    engine = RegisterFileEngine(slave, store, prefetch=4, **kwargs)
+    return slave, store, engine
+
+
+def test_pointer_write_stages_data():
+    slave, store, engine = _engine()
+
+    with engine:
+        slave.push(b"\x10")
+        wait_for(lambda: len(slave.tx) == 2)
+
+    assert slave.tx == [b"\x00\x01\x02\x03", b"\x10\x11\x12\x13"]
+    assert slave.resets == 1
+    assert engine.pointer == 0x10
+
+    stats = engine.get_stats()
+    assert (stats.transactions, stats.pointer_writes, stats.bytes_written) == (1, 1, 0)
+    assert (stats.bytes_staged, stats.stale_flushes) == (8, 1)
+    assert stats.stage_latency.count == 1
+
+
+def test_register_write_with_wrap_around():
+    writes = []
+    slave, store, engine = _engine(
+        on_write=lambda address, data: writes.append((address, bytes(data)))
+    )
+
+    with engine:
+        slave.push(b"\x1e\xaa\xbb\xcc")
+        wait_for(lambda: len(slave.tx) == 2)
+
+    assert store[0x1E:] == b"\xaa\xbb" and store[0] == 0xCC
+    assert writes == [(0x1E, b"\xaa\xbb"), (0x00, b"\xcc")]
+    assert engine.pointer == 1
+    assert slave.tx[-1] == b"\x01\x02\x03\x04"
+    assert engine.get_stats().bytes_written == 3
+
+
+def test_merged_writes_are_split_by_frame_size():
+    slave, store, engine = _engine(frame_size=2)
+
+    with engine:
+        # Two writes merged in the Rx queue, then one split between two reads
+        slave.push(b"\x01\xaa\x02\xbb\x03")
+        wait_for(lambda: engine.get_stats().transactions == 2)
+        slave.push(b"\xcc")
+        wait_for(lambda: engine.get_stats().transactions == 3)
+
+    assert store[1:4] == b"\xaa\xbb\xcc"
+    assert engine.pointer == 4
+    assert engine.get_stats().merged_writes == 1
+    # Staged once per Rx read, only the last pointer is served
+    assert slave.tx == [b"\x00\x01\x02\x03", b"\x03\x04\x05\x06", b"\x04\x05\x06\x07"]
+
+
+def test_merged_writes_without_framing_form_one_write():
+    slave, store, engine = _engine()
+
+    with engine:
+        slave.push(b"\x01\xaa\x02")
+        wait_for(lambda: engine.get_stats().transactions == 1)
+
+    assert store[1:3] == b"\xaa\x02"
+    assert engine.get_stats().merged_writes == 0
+
+
+def test_underruns_follow_deadline():
+    slave, _, engine = _engine(deadline=0.0)
+
+    with engine:
+        slave.push(b"\x05")
+        wait_for(lambda: engine.get_stats().transactions == 1)
+
+    assert engine.get_stats().underruns == 1
+    engine.reset_stats()
+    assert engine.get_stats().underruns == 0
+
+
+def test_stop_reraises_thread_error():
+    slave, _, engine = _engine()
+
+    def fail():
+        raise OSError("USB transfer failed!")
+
+    engine.start()
+    with pytest.raises(RuntimeError):
+        engine.start()
+    slave.get_rx_status = fail
+    wait_for(lambda: engine._error is not None)
+    with pytest.raises(OSError):
+        engine.stop()
+
+
+def test_invalid_arguments():
+    slave = FakeI2CSlave()
+
+    with pytest.raises(ValueError):
+        RegisterFileEngine(slave, bytearray(0))
+    with pytest.raises(ValueError):
+        RegisterFileEngine(slave, bytearray(8), address_width=3)
+    with pytest.raises(ValueError):
+        RegisterFileEngine(slave, bytearray(8), address_width=2, frame_size=1)
@@ -0,0 +1,116 @@
+import pytest
+
+from pyft4222.i2c.responder import ResponsePipeline
+from tests.unit.fakes import FakeI2CSlave, wait_for
+
+
+def _pipeline(**kwargs):
+    slave = FakeI2CSlave()
+    pipeline = ResponsePipeline(slave, **kwargs)
+    pipeline.register(b"\x01", lambda cmd: b"A" + cmd)
+    pipeline.register(b"\x01\x02", lambda cmd: b"B")
+    pipeline.register(b"\x03", lambda cmd: b"C")
+    return slave, pipeline
+
+
+def _send(slave, pipeline, command):
+    expected = pipeline.get_stats().transactions + 1
+    slave.push(command)
+    wait_for(lambda: pipeline.get_stats().transactions == expected)
+
+
+def test_prefix_routing():
+    slave, pipeline = _pipeline()
+
+    with pipeline:
+        assert slave.clock_stretch
+        _send(slave, pipeline, b"\x01\x05")
+        _send(slave, pipeline, b"\x01\x02\x05")
+        _send(slave, pipeline, b"\x7f")
+
+    assert slave.tx == [b"A\x01\x05", b"B"]
+    stats = pipeline.get_stats()
+    assert (stats.transactions, stats.misses, stats.unmatched) == (3, 2, 1)
+    assert stats.stretch.count == 2
+
+
+def test_successor_prediction():
+    slave, pipeline = _pipeline()
+
+    with pipeline:
+        for command in (b"\x01", b"\x03", b"\x01", b"\x03", b"\x01"):
+            _send(slave, pipeline, command)
+
+    # After learning 0x01 -> 0x03 -> 0x01, each response is queued ahead
+    assert slave.tx == [b"A\x01", b"C", b"A\x01", b"C", b"A\x01", b"C"]
+    stats = pipeline.get_stats()
+    assert (stats.hits, stats.misses, stats.flushes) == (2, 3, 0)
+    assert slave.resets == 0
+
+
+def test_misprediction_is_flushed():
+    slave, pipeline = _pipeline()
+
+    with pipeline:
+        for command in (b"\x01", b"\x03", b"\x01", b"\x01\x02"):
+            _send(slave, pipeline, command)
+
+    assert slave.tx == [b"A\x01", b"C", b"A\x01", b"C", b"B"]
+    stats = pipeline.get_stats()
+    assert (stats.hits, stats.misses, stats.flushes) == (0, 4, 1)
+    assert slave.resets == 1
+
+    pipeline.reset_stats()
+    assert pipeline.get_stats().transactions == 0
+
+
+def test_unpredictable_and_disabled_prestaging():
+    slave, pipeline = _pipeline(prestage=False)
+    pipeline.register(b"\x04", lambda cmd: b"D", predictable=False)
+
+    with pipeline:
+        for command in (b"\x01", b"\x03", b"\x01", b"\x03"):
+            _send(slave, pipeline, command)
+    assert pipeline.get_stats().hits == 0
+    assert len(slave.tx) == 4
+
+    slave, pipeline = _pipeline()
+    pipeline.register(b"\x04", lambda cmd: b"D", predictable=False)
+    with pipeline:
+        for command in (b"\x01", b"\x04", b"\x01", b"\x04"):
+            _send(slave, pipeline, command)
+    # Only the predictable 0x01 response is queued ahead (after 0x04)
+    assert slave.tx == [b"A\x01", b"D", b"A\x01", b"D", b"A\x01"]
+    assert pipeline.get_stats().hits == 0
+
+
+def test_merged_commands_are_split_by_length():
+    slave = FakeI2CSlave()
+    pipeline = ResponsePipeline(slave, prestage=False)
+    pipeline.register(b"\x10", lambda cmd: cmd[1:], length=2)
+    pipeline.register(b"\x20", lambda cmd: b"V" + cmd[1:])
+
+    with pipeline:
+        slave.push(b"\x10\xaa\x10\xbb\x20\x01\x02")
+        wait_for(lambda: pipeline.get_stats().transactions == 3)
+        slave.push(b"\x10")
+        slave.push(b"\xcc")
+        wait_for(lambda: pipeline.get_stats().transactions == 4)
+
+    assert slave.tx == [b"\xaa", b"\xbb", b"V\x01\x02", b"\xcc"]
+    assert pipeline.get_stats().merged == 2
+
+
+def test_register_checks():
+    slave, pipeline = _pipeline()
+
+    with pytest.raises(ValueError):
+        pipeline.register(b"", lambda cmd: b"")
+    with pytest.raises(ValueError):
+        pipeline.register(b"\x01\x02", lambda cmd: b"", length=1)
+
+    with pipeline:
+        with pytest.raises(RuntimeError):
+            pipeline.register(b"\x05", lambda cmd: b"")
+        with pytest.raises(RuntimeError):
+            pipeline.start()
@@ -0,0 +1,133 @@
+import time
+from functools import partial
+from typing import Callable, List, Tuple
+
+import pytest
+
+from pyft4222.sequencer import Sequencer, Step, compile_steps
+from pyft4222.sim import SimGpio
+from pyft4222.wrapper.gpio import PortId
+
+
+class _BoundGpio(SimGpio):
+    """SimGpio with 'bind_write()' recording each write and its time."""
+
+    log: List[Tuple[float, PortId, bool]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.log = []
+
+    def bind_write(self, port_id: PortId, state: bool) -> Callable[[], None]:
+        return partial(self._logged_write, port_id, state)
+
+    def _logged_write(self, port_id: PortId, state: bool) -> None:
+        self.log.append((time.perf_counter(), port_id, state))
+        self.write(port_id, state)
+
+
+def test_compile_drops_redundant_writes():
+    sequence = compile_steps(
+        [
+            Step(PortId.PORT_0, False, 0.001),
+            Step(PortId.PORT_0, False, 0.002),  # redundant, hold merged
+            Step(PortId.PORT_1, False, 0.003),  # first write of the port
+            Step(PortId.PORT_0, True, 0.004),
+            Step(PortId.PORT_1, False, 0.005),  # redundant, hold merged
+            Step(PortId.PORT_1, True, 0.0),
+        ]
+    )
+
+    assert sequence.writes == (
+        (PortId.PORT_0, False),
+        (PortId.PORT_1, False),
+        (PortId.PORT_0, True),
+        (PortId.PORT_1, True),
+    )
+    assert sequence.offsets == pytest.approx((0.0, 0.003, 0.006, 0.015))
+    assert sequence.duration == pytest.approx(0.015)
+
+
+def test_compile_normalizes_levels():
+    steps = [Step(PortId.PORT_2, 1, 0.001), Step(PortId.PORT_2, True, 0.001)]
+    sequence = compile_steps(steps)  # type: ignore
+    assert sequence.writes == ((PortId.PORT_2, True),)
+    assert sequence.duration == pytest.approx(0.002)
+
+
+def test_compile_rejects_negative_hold():
+    with pytest.raises(ValueError):
+        compile_steps([Step(PortId.PORT_0, True, -0.001)])
+
+
+def test_run_keeps_the_schedule():
+    gpio = _BoundGpio()
+    steps = [
+        Step(PortId.PORT_0, True, 0.002),
+        Step(PortId.PORT_0, True, 0.003),
+        Step(PortId.PORT_1, True, 0.004),
+        Step(PortId.PORT_0, False, 0.001),
+    ]
+    sequencer = Sequencer(gpio, steps, spin_threshold=0.0005)  # type: ignore
+
+    started = time.perf_counter()
+    result = sequencer.run()
+
+    assert result.writes == 3
+    assert result.lateness.count == 3
+    assert result.duration >= 0.010
+    assert sequencer.get_result() is result
+    assert [(port, state) for _, port, state in gpio.log] == [
+        (PortId.PORT_0, True),
+        (PortId.PORT_1, True),
+        (PortId.PORT_0, False),
+    ]
+    # Writes never start early, the redundant step's hold is kept
+    assert gpio.log[1][0] - started >= 0.005
+    assert gpio.log[2][0] - started >= 0.009
+    assert gpio.read(PortId.PORT_1) and not gpio.read(PortId.PORT_0)
+
+
+def test_repeat_and_thread():
+    gpio = _BoundGpio()
+    steps = [Step(PortId.PORT_3, True, 0.001), Step(PortId.PORT_3, False, 0.001)]
+
+    with Sequencer(gpio, steps, repeat=3) as sequencer:  # type: ignore
+        pass
+
+    result = sequencer.get_result()
+    assert result is not None
+    assert result.writes == 6
+    assert result.duration >= 0.006
+    assert [state for _, _, state in gpio.log] == [True, False] * 3
+
+
+def test_stop_aborts_the_sequence():
+    gpio = _BoundGpio()
+    steps = [Step(PortId.PORT_0, True, 10.0), Step(PortId.PORT_0, False, 0.0)]
+    sequencer = Sequencer(gpio, steps)  # type: ignore
+
+    sequencer.start()
+    deadline = time.perf_counter() + 2.0
+    while not gpio.log:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+    result = sequencer.stop()
+
+    assert result is not None
+    assert result.writes == 1
+    assert result.duration < 10.0
+
+
+def test_thread_error_is_raised_by_join():
+    gpio = _BoundGpio()
+
+    def failing_write() -> None:
+        raise RuntimeError("USB disconnected")
+
+    gpio.bind_write = lambda port_id, state: failing_write  # type: ignore
+    sequencer = Sequencer(gpio, [Step(PortId.PORT_0, True, 0.0)])  # type: ignore
+
+    sequencer.start()
+    with pytest.raises(RuntimeError, match="USB disconnected"):
+        sequencer.join()
@@ -0,0 +1,95 @@
+from array import array
+from ctypes import addressof, c_uint8
+
+import pytest
+
+from pyft4222.i2c.slave import I2CSlave
+from pyft4222.spi.slave import SpiSlaveRaw
+from pyft4222.wrapper import Ft4222Exception, Ft4222Status
+from pyft4222.wrapper.i2c import slave as i2c_slave_wrapper
+from pyft4222.wrapper.spi import slave as spi_slave_wrapper
+
+_RX_DATA = bytes(range(1, 6))
+
+
+class _FakeRead:
+    """Simulated 'FT4222_*Slave_Read()' returning '_RX_DATA' (or less)."""
+
+    def __init__(self, status: Ft4222Status = Ft4222Status.OK) -> None:
+        self.status = status
+        self.addresses = []
+
+    def __call__(self, handle, read_buffer, read_byte_count, bytes_read_ref):
+        self.addresses.append(addressof(read_buffer))
+        count = min(read_byte_count, len(_RX_DATA))
+        read_buffer[:count] = _RX_DATA[:count]
+        bytes_read_ref._obj.value = count
+        return self.status
+
+
+@pytest.fixture(params=["spi", "i2c"])
+def slave(request, monkeypatch):
+    fake_read = _FakeRead()
+    if request.param == "spi":
+        monkeypatch.setattr(spi_slave_wrapper, "_read", fake_read)
+        instance = SpiSlaveRaw(object(), None)  # type: ignore
+    else:
+        monkeypatch.setattr(i2c_slave_wrapper, "_read", fake_read)
+        instance = I2CSlave(object(), None)  # type: ignore
+    return fake_read, instance
+
+
+def test_partial_read_count(slave):
+    _, instance = slave
+    buffer = bytearray(b"\xff" * 8)
+
+    assert instance.readinto(buffer) == 5
+    assert buffer == _RX_DATA + b"\xff" * 3
+
+
+def test_reads_into_caller_memory(slave):
+    fake_read, instance = slave
+    target = bytearray(16)
+    view = memoryview(target)[4:8]
+
+    assert instance.readinto(view) == 4
+    assert target[4:8] == _RX_DATA[:4]
+    # The driver wrote into the caller's buffer, not into a temporary one
+    base = addressof((c_uint8 * len(target)).from_buffer(target))
+    assert fake_read.addresses == [base + 4]
+
+
+def test_reads_into_array(slave):
+    _, instance = slave
+    buffer = array("H", bytes(6))
+
+    assert instance.readinto(buffer) == 5
+    assert buffer.tobytes() == _RX_DATA + b"\x00"
+
+
+def test_rejects_readonly_and_empty_buffers(slave):
+    fake_read, instance = slave
+
+    with pytest.raises(ValueError):
+        instance.readinto(memoryview(b"readonly"))
+    with pytest.raises(ValueError):
+        instance.readinto(bytearray())
+    assert fake_read.addresses == []
+
+
+def test_wrapper_rejects_readonly_buffer(monkeypatch):
+    fake_read = _FakeRead()
+    monkeypatch.setattr(spi_slave_wrapper, "_read", fake_read)
+
+    with pytest.raises(TypeError):
+        spi_slave_wrapper.readinto(object(), memoryview(b"readonly"))  # type: ignore
+    assert fake_read.addresses == []
+
+
+def test_driver_error(monkeypatch):
+    monkeypatch.setattr(
+        spi_slave_wrapper, "_read", _FakeRead(Ft4222Status.DEVICE_NOT_OPENED)
+    )
+
+    with pytest.raises(Ft4222Exception):
+        spi_slave_wrapper.readinto(object(), bytearray(4))  # type: ignore
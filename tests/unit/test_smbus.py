@@ -0,0 +1,143 @@
+import errno
+
+import pytest
+
+from pyft4222.smbus import SMBus, crc8, i2c_msg
+from pyft4222.wrapper.i2c.master import TransactionFlag
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+_START = TransactionFlag.START
+_RESTART_STOP = TransactionFlag.REPEATED_START | TransactionFlag.STOP
+_START_STOP = TransactionFlag.START_AND_STOP
+
+
+def _bus(fake_i2c, pec=False):
+    driver, i2c_master = fake_i2c
+    device = FakeI2CDevice()
+    device.memory[:] = bytes(range(256))
+    driver.devices[0x40] = device
+    return driver, device, SMBus(i2c_master, pec=pec)
+
+
+def test_byte_and_word_transactions(fake_i2c):
+    driver, device, bus = _bus(fake_i2c)
+
+    assert bus.read_byte_data(0x40, 0x10) == 0x10
+    assert bus.read_word_data(0x40, 0x20) == 0x2120
+    bus.write_word_data(0x40, 0x30, 0xBEEF)
+    bus.write_byte(0x40, 0x50)
+    assert bus.read_byte(0x40) == 0x50
+
+    assert driver.transactions == [
+        ("w", 0x40, _START, b"\x10"),
+        ("r", 0x40, _RESTART_STOP, b"\x10"),
+        ("w", 0x40, _START, b"\x20"),
+        ("r", 0x40, _RESTART_STOP, b"\x20\x21"),
+        ("w", 0x40, _START_STOP, b"\x30\xef\xbe"),
+        ("w", 0x40, _START_STOP, b"\x50"),
+        ("r", 0x40, _START_STOP, b"\x50"),
+    ]
+    assert device.memory[0x30:0x32] == b"\xef\xbe"
+
+
+def test_block_transactions(fake_i2c):
+    driver, device, bus = _bus(fake_i2c)
+    device.memory[0x60:0x64] = b"\x03\xaa\xbb\xcc"
+
+    assert bus.read_block_data(0x40, 0x60) == [0xAA, 0xBB, 0xCC]
+    bus.write_block_data(0x40, 0x70, [1, 2])
+    assert bus.read_i2c_block_data(0x40, 0x70, 3) == [2, 1, 2]
+
+    assert driver.transactions[:3] == [
+        ("w", 0x40, _START, b"\x60"),
+        ("r", 0x40, TransactionFlag.REPEATED_START, b"\x03"),
+        ("r", 0x40, TransactionFlag.STOP, b"\xaa\xbb\xcc"),
+    ]
+    assert driver.transactions[3] == ("w", 0x40, _START_STOP, b"\x70\x02\x01\x02")
+
+
+def test_i2c_rdwr(fake_i2c):
+    driver, _, bus = _bus(fake_i2c)
+    write = i2c_msg.write(0x40, [0x08])
+    read = i2c_msg.read(0x40, 2)
+
+    bus.i2c_rdwr(write, read)
+
+    assert list(read) == [0x08, 0x09]
+    assert [flag for _, _, flag, _ in driver.transactions] == [_START, _RESTART_STOP]
+
+
+def test_pec(fake_i2c):
+    driver, device, bus = _bus(fake_i2c, pec=True)
+    bus.write_byte_data(0x40, 0x10, 0x55)
+    expected = crc8(bytes((0x80, 0x10, 0x55)))
+    assert driver.transactions[-1] == (
+        "w",
+        0x40,
+        _START_STOP,
+        bytes((0x10, 0x55, expected)),
+    )
+
+    device.memory[0x20:0x23] = b"\x34\x12" + bytes(
+        (crc8(bytes((0x80, 0x20, 0x81, 0x34, 0x12))),)
+    )
+    assert bus.read_word_data(0x40, 0x20) == 0x1234
+
+    device.memory[0x22] ^= 0xFF
+    with pytest.raises(OSError) as error:
+        bus.read_word_data(0x40, 0x20)
+    assert error.value.errno == errno.EBADMSG
+
+
+def test_nack_and_timeout(fake_i2c):
+    driver, _, bus = _bus(fake_i2c)
+
+    with pytest.raises(OSError) as error:
+        bus.read_byte_data(0x41, 0x00)
+    assert error.value.errno == errno.EREMOTEIO
+    assert driver.resets == 1
+
+    driver.busy_polls = 10 ** 9
+    with pytest.raises(OSError) as error:
+        bus.write_byte(0x40, 0x00)
+    assert error.value.errno == errno.ETIMEDOUT
+    assert driver.resets == 2
+
+
+def test_closed_bus(fake_i2c):
+    _, _, bus = _bus(fake_i2c)
+    bus.close()
+
+    with pytest.raises(OSError) as error:
+        bus.read_byte(0x40)
+    assert error.value.errno == errno.EBADF
+
+
+def test_crc8_check_value():
+    assert crc8(b"123456789") == 0xF4
+    assert crc8(b"6789", crc8(b"12345")) == 0xF4
+
+
+def test_block_count_above_limit(fake_i2c):
+    driver, device, bus = _bus(fake_i2c, pec=True)
+    device.memory[0x60] = 33
+
+    with pytest.raises(OSError) as error:
+        bus.read_block_data(0x40, 0x60)
+    assert error.value.errno == errno.EPROTO
+    assert driver.transactions[-1] == ("r", 0x40, TransactionFlag.STOP, b"\x61")
+
+
+def test_block_pec_covers_count(fake_i2c):
+    _, device, bus = _bus(fake_i2c, pec=True)
+    block = b"\x02\xaa\xbb"
+    pec = crc8(bytes((0x80, 0x60, 0x81)) + block)
+    device.memory[0x60:0x64] = block + bytes((pec,))
+
+    assert bus.read_block_data(0x40, 0x60) == [0xAA, 0xBB]
+
+    device.memory[0x60] = 0x01
+    device.memory[0x62] = crc8(bytes((0x80, 0x60, 0x81, 0x02, 0xAA)))
+    with pytest.raises(OSError) as error:
+        bus.read_block_data(0x40, 0x60)
+    assert error.value.errno == errno.EBADMSG
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyft4222.sim import SimSpiLink
+from pyft4222.spi.aio import open_spi_slave_stream
+
+_LARGE_SIZE = 200_000
+
+
+def _payload(size: int) -> bytes:
+    return bytes(idx & 0xFF for idx in range(size))
+
+
+def test_read_and_large_write():
+    link = SimSpiLink()
+
+    async def scenario() -> bytes:
+        reader, writer = await open_spi_slave_stream(link.slave, poll_interval=0.0005)
+        link.master.single_write(b"hello")
+        received = await asyncio.wait_for(reader.readexactly(5), 1.0)
+
+        writer.write(_payload(_LARGE_SIZE))
+        await writer.drain()
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        return received
+
+    assert asyncio.run(scenario()) == b"hello"
+    assert bytes(link._tx_queue) == _payload(_LARGE_SIZE)
+
+
+def test_short_writes():
+    link = SimSpiLink()
+    sim_write = link.slave.write
+    sizes = []
+
+    def short_write(write_data: bytes) -> int:
+        sizes.append(len(write_data))
+        return sim_write(write_data[:1000])
+
+    link.slave.write = short_write  # type: ignore
+
+    async def scenario() -> None:
+        _, writer = await open_spi_slave_stream(link.slave)
+        writer.write(_payload(5000))
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        assert writer.transport.get_write_buffer_size() == 0
+
+    asyncio.run(scenario())
+    assert bytes(link._tx_queue) == _payload(5000)
+    assert sizes == [5000, 4000, 3000, 2000, 1000]
+
+
+def test_zero_write_fails_stream():
+    link = SimSpiLink()
+    link.slave.write = lambda write_data: 0  # type: ignore
+
+    async def scenario() -> None:
+        reader, writer = await open_spi_slave_stream(link.slave)
+        writer.write(b"data")
+        with pytest.raises(OSError):
+            await asyncio.wait_for(reader.read(1), 1.0)
+
+    asyncio.run(scenario())
+
+
+def test_pause_resume_and_abort():
+    link = SimSpiLink()
+    sim_write = link.slave.write
+    released = threading.Event()
+
+    def blocking_write(write_data: bytes) -> int:
+        released.wait(1.0)
+        return sim_write(write_data)
+
+    link.slave.write = blocking_write  # type: ignore
+
+    async def scenario() -> None:
+        _, writer = await open_spi_slave_stream(link.slave)
+        transport = writer.transport
+        transport.set_write_buffer_limits(high=1000, low=100)
+
+        writer.write(bytes(600))
+        writer.write(bytes(600))
+        drain = asyncio.ensure_future(writer.drain())
+        await asyncio.sleep(0.05)
+        assert not drain.done()
+
+        released.set()
+        await asyncio.wait_for(drain, 1.0)
+        assert transport.get_write_buffer_size() <= 100
+
+        released.clear()
+        for _ in range(4):
+            writer.write(bytes(600))
+        await asyncio.sleep(0.05)
+        transport.abort()
+        assert transport.get_write_buffer_size() == 0
+
+        released.set()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        assert transport.get_write_buffer_size() == 0
+
+    asyncio.run(scenario())
+    # The chunk being written when aborted is finished, the rest is discarded
+    assert len(link._tx_queue) < 1200 + 4 * 600
+
+
+def _count_reads(link: SimSpiLink):
+    sim_read = link.slave.read
+    reads = []
+
+    def counted_read(read_byte_count: int) -> bytes:
+        data = sim_read(read_byte_count)
+        reads.append(len(data))
+        return data
+
+    link.slave.read = counted_read  # type: ignore
+    return reads
+
+
+def test_paused_reading_stops_rx_reads():
+    link = SimSpiLink()
+    reads = _count_reads(link)
+
+    async def scenario() -> bytes:
+        reader, writer = await open_spi_slave_stream(link.slave, poll_interval=0.0005)
+        writer.transport.pause_reading()
+        await asyncio.sleep(0.01)
+
+        link.master.single_write(b"queued")
+        await asyncio.sleep(0.05)
+        assert reads == []
+        assert link.slave.get_rx_status() == 6
+
+        writer.transport.resume_reading()
+        data = await asyncio.wait_for(reader.readexactly(6), 1.0)
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        return data
+
+    assert asyncio.run(scenario()) == b"queued"
+    assert reads == [6]
+
+
+def test_undelivered_reads_are_bounded():
+    link = SimSpiLink()
+    reads = _count_reads(link)
+
+    async def scenario() -> bytes:
+        reader, writer = await open_spi_slave_stream(link.slave, poll_interval=0.0005)
+        # Block the event loop, no read can be delivered meanwhile
+        for _ in range(5):
+            link.master.single_write(bytes(10))
+            time.sleep(0.02)
+        assert len(reads) == 2
+
+        data = await asyncio.wait_for(reader.readexactly(50), 1.0)
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        return data
+
+    assert asyncio.run(scenario()) == bytes(50)
+    assert sum(reads) == 50
+
+
+def test_rx_is_serviced_between_partial_writes():
+    link = SimSpiLink()
+    sim_write = link.slave.write
+    reads = _count_reads(link)
+    log = []
+
+    def short_write(write_data: bytes) -> int:
+        log.append(("w", len(reads)))
+        if len(log) == 1:
+            link.master.single_write(b"rx")
+        return sim_write(write_data[:1000])
+
+    link.slave.write = short_write  # type: ignore
+
+    async def scenario() -> bytes:
+        reader, writer = await open_spi_slave_stream(link.slave)
+        writer.write(_payload(3000))
+        data = await asyncio.wait_for(reader.readexactly(2), 1.0)
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 1.0)
+        return data
+
+    assert asyncio.run(scenario()) == b"rx"
+    # The Rx data arriving during the first write are read before the second
+    assert log == [("w", 0), ("w", 1), ("w", 1)]
+    assert bytes(link._tx_queue) == _payload(3000)
@@ -0,0 +1,157 @@
+import pytest
+
+from pyft4222.i2c import master as i2c_master_module
+from pyft4222.i2c.tuning import SpeedTieredSession, readback_verifier, tune_speeds
+from pyft4222.wrapper.i2c.master import CtrlStatus
+from tests.unit.fakes import FakeI2CDevice, fake_i2c  # noqa: F401
+
+
+class _FakeMaster:
+    def __init__(self, stream, kbps):
+        self.stream = stream
+        self.kbps = kbps
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.uninitialize()
+        return False
+
+    def uninitialize(self):
+        self.stream.log.append(("uninit", self.kbps))
+
+
+class _FakeStream:
+    def __init__(self):
+        self.log = []
+
+    def init_i2c_master(self, kbps):
+        self.log.append(("init", kbps))
+        return _FakeMaster(self, kbps)
+
+
+def test_tune_speeds():
+    stream = _FakeStream()
+    limits = {0x40: 400, 0x50: 3400, 0x60: 50}
+
+    results = tune_speeds(
+        stream,
+        [0x40, 0x50, 0x60],
+        speeds=(1000, 100, 400, 3400),
+        verifier=lambda i2c_master, address: i2c_master.kbps <= limits[address],
+    )
+
+    assert {address: tuple(r[1:]) for address, r in results.items()} == {
+        0x40: (400, 1000),
+        0x50: (3400, None),
+        0x60: (None, 100),
+    }
+    # Each speed is applied once and the master is released after it
+    assert stream.log == [
+        ("init", 100),
+        ("uninit", 100),
+        ("init", 400),
+        ("uninit", 400),
+        ("init", 1000),
+        ("uninit", 1000),
+        ("init", 3400),
+        ("uninit", 3400),
+    ]
+
+    with pytest.raises(ValueError):
+        tune_speeds(stream, [0x40], speeds=(50,))
+
+
+def test_readback_verifier(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = FakeI2CDevice(size=4)
+    verify = readback_verifier(read_byte_count=4, trials=3)
+
+    assert verify(i2c_master, 0x40)
+    assert not verify(i2c_master, 0x41)
+
+    # The pointer does not wrap to the same data, the reads differ
+    driver.devices[0x40] = FakeI2CDevice(size=6)
+    driver.devices[0x40].memory[:] = bytes(range(6))
+    assert not verify(i2c_master, 0x40)
+
+
+def test_readback_verifier_rejects_short_reads(fake_i2c):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = FakeI2CDevice(size=4)
+    driver.transfer_limit = 2
+
+    assert not readback_verifier(read_byte_count=4, trials=1)(i2c_master, 0x40)
+    assert driver.resets == 1
+    assert readback_verifier(read_byte_count=2, trials=1)(i2c_master, 0x40)
+
+
+def test_readback_verifier_rejects_nack_during_reads(fake_i2c, monkeypatch):
+    driver, i2c_master = fake_i2c
+    driver.devices[0x40] = FakeI2CDevice(size=4)
+    reads = []
+
+    def read(handle, address, count):
+        # The probe passes, the second verification read is not acknowledged
+        data = driver.read(handle, address, count)
+        reads.append(data)
+        if len(reads) == 2:
+            driver.status = CtrlStatus.IDLE | CtrlStatus.ERROR | CtrlStatus.DATA_NACK
+        return data
+
+    monkeypatch.setattr(i2c_master_module, "read", read)
+    assert not readback_verifier(read_byte_count=4, trials=3)(i2c_master, 0x40)
+    assert len(reads) == 2
+    assert driver.resets == 1
+
+
+def test_readback_verifier_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        readback_verifier(trials=0)
+    with pytest.raises(ValueError):
+        readback_verifier(read_byte_count=0)
+
+
+def test_session_reconfigures_on_tier_change():
+    stream = _FakeStream()
+    configured = []
+    session = SpeedTieredSession(
+        stream, {0x40: 400, 0x50: 1000}, configure=configured.append
+    )
+
+    assert session.run(0x40, lambda m: m.kbps) == 400
+    assert session.run(0x40, lambda m: m.kbps) == 400
+    assert session.run(0x60, lambda m: m.kbps) == 100
+    assert session.current_kbps == 100
+
+    stats = session.get_stats()
+    assert (stats.accesses, stats.reconfigurations) == (3, 2)
+    assert [m.kbps for m in configured] == [400, 100]
+    assert stream.log == [("init", 400), ("uninit", 400), ("init", 100)]
+
+    with session:
+        pass
+    assert session.current_kbps is None
+    assert stream.log[-1] == ("uninit", 100)
+
+
+def test_session_run_grouped():
+    stream = _FakeStream()
+    session = SpeedTieredSession(stream, {0x40: 400, 0x50: 1000, 0x60: 100})
+    session.run(0x40, lambda m: None)
+
+    results = session.run_grouped(
+        [(address, lambda m, a=address: (a, m.kbps)) for address in (0x60, 0x50, 0x40)]
+    )
+
+    assert results == [(0x60, 100), (0x50, 1000), (0x40, 400)]
+    assert [kbps for event, kbps in stream.log if event == "init"] == [400, 1000, 100]
+    assert session.get_stats().reconfigurations == 3
+
+
+def test_session_rejects_invalid_speeds():
+    with pytest.raises(ValueError):
+        SpeedTieredSession(_FakeStream(), {0x40: 5000})
+    with pytest.raises(ValueError):
+        SpeedTieredSession(_FakeStream(), {}, default_kbps=10)
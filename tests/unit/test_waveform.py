@@ -0,0 +1,85 @@
+import math
+
+import pytest
+
+from pyft4222 import waveform
+from pyft4222.waveform import capture_waveform, find_edges, pulse_widths
+from pyft4222.wrapper import GpioTrigger
+from pyft4222.wrapper.common import ClockRate
+from pyft4222.wrapper.gpio import PortId
+from tests.unit.fakes import fake_gpio  # noqa: F401
+
+_LEVELS = [0, 1, 1, 0, 0, 1, 0, 1, 1, 1]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def decode_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(waveform, "np", None)
+    return request.param
+
+
+def _samples(levels):
+    buffer = waveform.allocate_samples(len(levels))
+    memoryview(buffer).cast("B")[:] = bytes(levels)
+    return buffer
+
+
+def test_find_edges(decode_path):
+    rising, falling = find_edges(_samples(_LEVELS))
+    assert list(rising) == [1, 5, 7]
+    assert list(falling) == [3, 6]
+
+
+def test_find_edges_without_edges(decode_path):
+    rising, falling = find_edges(_samples([1] * 8))
+    assert list(rising) == []
+    assert list(falling) == []
+
+
+def test_pulse_widths(decode_path):
+    samples = _samples(_LEVELS)
+    # The last high pulse is cut off by the end of the capture
+    assert list(pulse_widths(samples)) == [2, 1]
+    # The first low pulse is cut off by the start of the capture
+    assert list(pulse_widths(samples, level=0)) == [2, 1]
+    assert list(pulse_widths(_samples([0] * 4))) == []
+
+
+def test_capture_into_caller_buffer(fake_gpio, decode_path):  # noqa: F811
+    queues, gpio = fake_gpio
+    events = [
+        GpioTrigger.LEVEL_HIGH if level else GpioTrigger.LEVEL_LOW for level in _LEVELS
+    ]
+
+    read_stale = gpio.read_trigger_queue_into
+
+    def read_trigger_queue_into(port, buffer):
+        # The waveform is sampled once the stale event has been discarded
+        event_count = read_stale(port, buffer)
+        gpio.read_trigger_queue_into = read_stale
+        queues.push(port, *events)
+        return event_count
+
+    gpio.get_clock = lambda: ClockRate.SYS_CLK_60
+    gpio.set_input_trigger = lambda port, trigger: None
+    gpio.set_waveform_mode = lambda enable: None
+    gpio.read_trigger_queue_into = read_trigger_queue_into
+    queues.push(PortId.PORT_2, GpioTrigger.LEVEL_HIGH)
+
+    out = bytearray(16)
+    capture = capture_waveform(
+        gpio, [PortId.PORT_2], len(_LEVELS), out={PortId.PORT_2: out}
+    )
+
+    samples = capture.samples[PortId.PORT_2]
+    assert capture.sample_count == len(_LEVELS)
+    assert bytes(samples) == bytes(_LEVELS)
+    assert math.isnan(capture.sample_period)
+    assert capture.clock_rate == ClockRate.SYS_CLK_60
+    # The samples are a view of the caller's buffer, not a copy
+    out[0] = 1
+    assert samples[0] == 1
+    assert list(find_edges(samples)[0]) == [5, 7]
@@ -0,0 +1,60 @@
+import pytest
+
+from pyft4222.polling import PollStrategy
+from pyft4222.worker import PollingWorker
+from tests.unit.fakes import wait_for
+
+_STRATEGY = PollStrategy(spin_polls=1, initial_interval=0.0001, max_interval=0.001)
+
+
+class _CountingWorker(PollingWorker):
+    _worker_name = "Counting worker"
+
+    def __init__(self, fail_after: int = -1):
+        super().__init__(_STRATEGY)
+        self.polls = 0
+        self.started = 0
+        self._fail_after = fail_after
+
+    def _on_start(self) -> None:
+        self.started += 1
+
+    def _poll(self) -> bool:
+        self.polls += 1
+        if self.polls == self._fail_after:
+            raise OSError("Device disconnected!")
+        return False
+
+
+def test_incomplete_worker_fails_on_construction():
+    class _Incomplete(PollingWorker):
+        pass
+
+    with pytest.raises(TypeError):
+        _Incomplete(_STRATEGY)  # type: ignore
+
+
+def test_start_and_stop():
+    worker = _CountingWorker()
+
+    with worker:
+        assert worker.running
+        assert worker.started == 1
+        with pytest.raises(RuntimeError):
+            worker.start()
+        wait_for(lambda: worker.polls > 2)
+
+    assert not worker.running
+    worker.stop()
+
+
+def test_thread_error_is_raised_by_stop():
+    worker = _CountingWorker(fail_after=3)
+    worker.start()
+    wait_for(lambda: not worker.running)
+
+    with pytest.raises(OSError, match="disconnected"):
+        worker.stop()
+    # The worker can be restarted
+    worker.start()
+    worker.stop()